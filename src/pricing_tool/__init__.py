@@ -2,7 +2,32 @@
 复杂金融衍生品定价工具
 
 Exotic Options Pricing Tool - 支持多种奇异期权的PDE和MC定价方法
+
+公共类和子包均为延迟加载（PEP 562），首次访问时才导入对应模块
 """
 
+from typing import TYPE_CHECKING
+
+from ._lazy import attach
+
 __version__ = "0.1.0"
 __author__ = "Project Team"
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "Option": ".options.base",
+        "ExoticOption": ".options.exotic",
+        "PricingMethod": ".pricing.base",
+        "PricingResult": ".pricing.base",
+        "MarketData": ".utils.market_data",
+    },
+    submodules=["calibration", "models", "options", "pricing", "utils"],
+)
+
+if TYPE_CHECKING:  # pragma: no cover - 仅供类型检查器使用
+    from . import calibration, models, options, pricing, utils
+    from .options.base import Option
+    from .options.exotic import ExoticOption
+    from .pricing.base import PricingMethod, PricingResult
+    from .utils.market_data import MarketData
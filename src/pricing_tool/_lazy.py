@@ -0,0 +1,50 @@
+"""
+延迟加载工具模块
+
+基于 PEP 562 的模块级 ``__getattr__`` 实现包属性的按需导入，
+使 ``import pricing_tool`` 及其子包在冷启动时不加载 scipy 和各定价引擎
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def attach(
+    package_name: str,
+    attrs: Dict[str, str],
+    submodules: Sequence[str] = (),
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    为包生成延迟加载所需的 ``__getattr__``、``__dir__`` 和 ``__all__``
+
+    参数:
+        package_name: 包的完整名称（通常传入 ``__name__``）
+        attrs: 公共名称 -> 定义该名称的模块（相对于本包，如 ".base"）
+        submodules: 可按属性访问的子模块名称
+
+    返回:
+        (__getattr__, __dir__, __all__) 三元组，直接赋值给包的模块级变量
+
+    示例:
+        __getattr__, __dir__, __all__ = attach(__name__, {"Option": ".base"})
+    """
+    submodule_set = frozenset(submodules)
+    public = [*attrs, *submodules]
+
+    def __getattr__(name: str) -> Any:
+        if name in attrs:
+            module = importlib.import_module(attrs[name], package_name)
+            value = getattr(module, name)
+        elif name in submodule_set:
+            value = importlib.import_module(f".{name}", package_name)
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        # 缓存到包命名空间，后续访问不再经过 __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(public))
+
+    return __getattr__, __dir__, list(public)
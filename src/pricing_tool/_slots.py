@@ -0,0 +1,73 @@
+"""
+紧凑不可变数据类工具模块
+
+为冻结数据类添加 ``__slots__``（兼容 Python 3.8，``dataclass(slots=True)`` 需要 3.10+），
+去掉每个实例的 ``__dict__``，以便在内存中大量持有定价结果和行情对象
+"""
+
+import dataclasses
+from typing import Any, Dict, Type, TypeVar
+
+T = TypeVar("T")
+
+
+def _frozen_setattr(self: Any, name: str, value: Any) -> None:
+    raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self: Any, name: str) -> None:
+    raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+def _slots_getstate(self: Any) -> Dict[str, Any]:
+    return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+
+
+def _slots_setstate(self: Any, state: Dict[str, Any]) -> None:
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """
+    将冻结数据类重建为带 ``__slots__`` 的类
+
+    必须放在 ``@dataclass(frozen=True)`` 之上使用。重建后的类没有实例 ``__dict__``，
+    仍保留数据类生成的 ``__init__``、``__eq__`` 和 ``__hash__``，并支持 pickle。
+    子类只为新增字段声明 slot，继承自带 slot 基类的字段不重复声明
+
+    参数:
+        cls: 冻结数据类
+
+    返回:
+        带 ``__slots__`` 的新类
+
+    抛出:
+        TypeError: 如果 cls 不是冻结数据类或已定义 ``__slots__``
+    """
+    params = getattr(cls, "__dataclass_params__", None)
+    if params is None or not params.frozen:
+        raise TypeError(f"{cls.__name__} 必须是冻结数据类（frozen=True）")
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} 已定义 __slots__")
+
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    inherited = {
+        name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())
+    }
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = tuple(name for name in field_names if name not in inherited)
+    # 字段默认值已固化在生成的 __init__ 中，类属性会与同名 slot 冲突
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    # 数据类生成的 __setattr__ 通过闭包引用旧类，这里替换为与类无关的实现
+    cls_dict["__setattr__"] = _frozen_setattr
+    cls_dict["__delattr__"] = _frozen_delattr
+    cls_dict["__getstate__"] = _slots_getstate
+    cls_dict["__setstate__"] = _slots_setstate
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
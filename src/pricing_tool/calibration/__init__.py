@@ -0,0 +1,22 @@
+"""
+校准模块
+
+包含把参数化模型拟合到期权报价链的最小二乘校准器（延迟加载）
+"""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "QuoteChain": ".calibrator",
+        "CalibrationResult": ".calibrator",
+        "ModelCalibrator": ".calibrator",
+        "PARAMETER_BOUNDS": ".calibrator",
+    },
+)
+
+if TYPE_CHECKING:  # pragma: no cover - 仅供类型检查器使用
+    from .calibrator import PARAMETER_BOUNDS, CalibrationResult, ModelCalibrator, QuoteChain
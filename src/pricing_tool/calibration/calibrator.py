@@ -0,0 +1,428 @@
+"""
+模型校准模块
+
+按最小二乘把参数化模型（GBMModel、HestonModel 等具有解析特征函数的模型）
+拟合到一条期权报价链
+
+整个报价曲面的一次残差求值只需：
+- 对所有期限一次性广播求值特征函数（形状为 (期限数, n_terms)）
+- 与预先算好的 COS 收益系数矩阵做一次逐报价点积
+
+COS 截断区间和收益系数在一次拟合中固定，与模型参数无关，
+因此模型价格对参数的 Jacobian 就是特征函数的解析梯度与同一系数矩阵的点积，
+不需要对定价器做有限差分
+"""
+
+import dataclasses
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from .._slots import slotted
+from ..models.base import Model
+from ..models.gbm import GBMModel
+from ..models.heston import HestonModel
+from ..options.base import Option
+from ..pricing.fourier_pricing import cos_payoff_integrals, cos_truncation_range
+from ..utils.market_data import MarketData
+
+Bounds = Dict[str, Tuple[float, float]]
+
+PARAMETER_BOUNDS: Dict[Type[Model], Bounds] = {
+    GBMModel: {"sigma": (1e-4, 5.0)},
+    HestonModel: {
+        "v0": (1e-4, 4.0),
+        "kappa": (1e-3, 20.0),
+        "theta": (1e-4, 4.0),
+        "xi": (1e-3, 5.0),
+        "rho": (-0.999, 0.999),
+    },
+}
+"""各模型参数的默认取值范围（未列出的模型需要显式传入 bounds）"""
+
+
+class QuoteChain:
+    """
+    期权报价链
+
+    同一标的（现价、利率）下若干 (执行价, 期限, 类型) 的市场价格，
+    可以跨多个期限；校准时按期限分组
+    """
+
+    __slots__ = ("spot", "rate", "strikes", "maturities", "prices", "is_call", "weights")
+
+    def __init__(
+        self,
+        spot: float,
+        rate: float,
+        strikes: Sequence[float],
+        maturities: Sequence[float],
+        prices: Sequence[float],
+        option_types: Sequence[str] = ("call",),
+        weights: Optional[Sequence[float]] = None,
+    ):
+        """
+        初始化报价链
+
+        参数:
+            spot: 现价
+            rate: 无风险利率
+            strikes: 执行价
+            maturities: 期限（与 strikes 等长）
+            prices: 市场价格（与 strikes 等长）
+            option_types: "call"/"put"，单个值时应用于所有报价
+            weights: 残差权重（例如 1 / 买卖价差）；None 时全部为 1
+
+        抛出:
+            ValueError: 如果数组长度不一致或数值无效
+        """
+        K = np.asarray(strikes, dtype=float)
+        T = np.asarray(maturities, dtype=float)
+        P = np.asarray(prices, dtype=float)
+        types = np.asarray(option_types)
+        w = np.ones_like(K) if weights is None else np.asarray(weights, dtype=float)
+        if K.ndim != 1 or K.size == 0:
+            raise ValueError("报价链至少需要一个报价")
+        if not all(a.shape == K.shape for a in (T, P, w)):
+            raise ValueError("strikes、maturities、prices 和 weights 的长度必须一致")
+        if types.size not in (1, K.size):
+            raise ValueError(f"option_types 的长度必须为 1 或 {K.size}，当前: {types.size}")
+        if not np.all(np.isin(types, ("call", "put"))):
+            raise ValueError("期权类型必须是 'call' 或 'put'")
+        if spot <= 0 or K.min() <= 0 or T.min() <= 0:
+            raise ValueError("现价、执行价和期限必须大于 0")
+        if np.any(w < 0):
+            raise ValueError("残差权重不能为负")
+        self.spot = float(spot)
+        self.rate = float(rate)
+        self.strikes = K
+        self.maturities = T
+        self.prices = P
+        self.is_call = np.broadcast_to(types == "call", K.shape).copy()
+        self.weights = w
+
+    @classmethod
+    def from_options(
+        cls,
+        options: Sequence[Option],
+        prices: Sequence[float],
+        market_data: MarketData,
+        weights: Optional[Sequence[float]] = None,
+    ) -> "QuoteChain":
+        """
+        由期权对象和对应的市场价格构造报价链
+
+        参数:
+            options: 欧式期权对象序列
+            prices: 市场价格（与 options 等长）
+            market_data: 市场数据（提供现价和利率）
+            weights: 残差权重
+
+        返回:
+            QuoteChain 对象
+        """
+        return cls(
+            market_data.S,
+            market_data.r,
+            [option.K for option in options],
+            [option.T for option in options],
+            prices,
+            [option.option_type for option in options],
+            weights,
+        )
+
+    def __len__(self) -> int:
+        return self.strikes.size
+
+    def __repr__(self) -> str:
+        return (
+            f"QuoteChain(spot={self.spot}, rate={self.rate}, quotes={len(self)}, "
+            f"maturities={np.unique(self.maturities).size})"
+        )
+
+
+@slotted
+@dataclass(frozen=True, eq=False)
+class CalibrationResult:
+    """
+    校准结果
+
+    model 可作为下一次（例如下一个交易日）校准的初始值；
+    含数组字段，按对象身份比较
+    """
+
+    model: Model
+    """校准后的模型"""
+
+    rmse: float
+    """加权价格残差的均方根"""
+
+    max_abs_error: float
+    """最大绝对价格误差（不加权）"""
+
+    residuals: np.ndarray
+    """各报价的价格误差（模型价格 - 市场价格，不加权）"""
+
+    iterations: int
+    """残差函数求值次数"""
+
+    jacobian_evaluations: int
+    """Jacobian 求值次数"""
+
+    elapsed: float
+    """校准耗时（秒）"""
+
+    success: bool
+    """优化器是否报告收敛"""
+
+    message: str = ""
+    """优化器的终止信息"""
+
+    def __repr__(self) -> str:
+        return (
+            f"CalibrationResult(model={self.model!r}, rmse={self.rmse:.6g}, "
+            f"iterations={self.iterations}, elapsed={self.elapsed:.3f}s, success={self.success})"
+        )
+
+
+class _SurfaceSystem:
+    """
+    固定截断区间下的报价曲面 COS 定价系统
+
+    按期限分组预先计算收益系数矩阵；模型价格和 Jacobian 都是
+    （逐期限的特征函数权重）与该矩阵的逐报价点积
+    """
+
+    def __init__(self, quotes: QuoteChain, range_model: Model, n_terms: int, truncation: float):
+        """
+        预计算截断区间、频率和收益系数
+
+        参数:
+            quotes: 报价链
+            range_model: 用于确定各期限截断区间的模型
+            n_terms: COS 级数项数
+            truncation: 截断区间半宽（标准差的倍数）
+        """
+        S, r = quotes.spot, quotes.rate
+        maturities, self.index = np.unique(quotes.maturities, return_inverse=True)
+        ranges = np.array(
+            [cos_truncation_range(range_model, T, r, truncation) for T in maturities]
+        )
+        self.ranges = ranges
+        self.maturities = maturities[:, np.newaxis]
+        self.r = r
+        width = ranges[:, 1] - ranges[:, 0]
+        self.u = np.arange(n_terms) * np.pi / width[:, np.newaxis]
+        self.shift = np.exp(-1j * self.u * ranges[:, :1])
+
+        discount = np.exp(-r * quotes.maturities)
+        self.coefficients = np.empty((len(quotes), n_terms))
+        for j, (a, b) in enumerate(ranges):
+            members = np.flatnonzero(self.index == j)
+            K = quotes.strikes[members]
+            psi, chi, _ = cos_payoff_integrals(K, S, a, b, n_terms)
+            scale = 2.0 / (b - a) * discount[members]
+            self.coefficients[members] = (scale * (K * psi - S * chi)).T
+        # 看涨期权由平价关系得到
+        self.offset = np.where(quotes.is_call, S - quotes.strikes * discount, 0.0)
+
+    def contains(self, model: Model, truncation: float) -> bool:
+        """
+        检查模型的截断区间是否都落在当前区间内
+
+        参数:
+            model: 标的动态模型
+            truncation: 截断区间半宽
+
+        返回:
+            True 如果当前区间对该模型仍然足够宽
+        """
+        for (a, b), T in zip(self.ranges, self.maturities[:, 0]):
+            a_new, b_new = cos_truncation_range(model, T, self.r, truncation)
+            if a_new < a or b_new > b:
+                return False
+        return True
+
+    def _project(self, values: np.ndarray) -> np.ndarray:
+        # Re[values * exp(-i u a)]，首项权重减半，再按报价展开到 (..., 报价数, n_terms)
+        weights = (values * self.shift).real
+        weights[..., 0] *= 0.5
+        return weights[..., self.index, :]
+
+    def prices(self, model: Model) -> np.ndarray:
+        """
+        所有报价的模型价格
+
+        参数:
+            model: 标的动态模型
+
+        返回:
+            价格数组
+        """
+        phi = model.characteristic_function(self.u, self.maturities, self.r)
+        return np.einsum("qn,qn->q", self._project(phi), self.coefficients) + self.offset
+
+    def jacobian(self, model: Model) -> np.ndarray:
+        """
+        模型价格对模型参数的 Jacobian
+
+        参数:
+            model: 标的动态模型
+
+        返回:
+            形状为 (报价数, 参数个数) 的数组
+        """
+        gradient = model.characteristic_function_gradient(self.u, self.maturities, self.r)
+        return np.einsum("pqn,qn->qp", self._project(gradient), self.coefficients)
+
+
+class ModelCalibrator:
+    """
+    最小二乘模型校准器
+
+    目标函数为加权价格残差 w_i (模型价格_i - 市场价格_i) 的平方和，
+    由 scipy 的有界信赖域反射算法（trf）求解：
+    - 所有期限的特征函数在一次广播调用中求值，残差求值是纯向量运算
+    - 模型实现 characteristic_function_gradient 时使用解析 Jacobian，否则对残差做有限差分
+    - 初始值可直接传入上一次（例如前一交易日）的校准结果，参数变化小时只需少量迭代
+    - 拟合结束后若校准模型的 COS 截断区间超出拟合时使用的区间，以新区间从当前解再拟合一次
+
+    典型的 200 个报价、Heston 五参数曲面可在亚秒级完成
+    """
+
+    def __init__(
+        self,
+        n_terms: int = 256,
+        truncation: float = 16.0,
+        bounds: Optional[Bounds] = None,
+        max_evaluations: int = 200,
+        tolerance: float = 1e-10,
+    ):
+        """
+        初始化校准器
+
+        参数:
+            n_terms: COS 级数项数
+            truncation: COS 截断区间半宽（标准差的倍数）
+            bounds: 参数取值范围 {参数名: (下限, 上限)}；None 时使用 PARAMETER_BOUNDS
+            max_evaluations: 残差函数最多求值次数
+            tolerance: 优化器的 ftol/xtol/gtol
+
+        抛出:
+            ValueError: 如果参数无效
+        """
+        if n_terms < 2:
+            raise ValueError(f"级数项数 n_terms 必须不小于 2，当前值: {n_terms}")
+        if truncation <= 0:
+            raise ValueError(f"截断宽度 truncation 必须大于 0，当前值: {truncation}")
+        if max_evaluations <= 0:
+            raise ValueError(f"最多求值次数必须大于 0，当前值: {max_evaluations}")
+        self.n_terms = n_terms
+        self.truncation = truncation
+        self.bounds = bounds
+        self.max_evaluations = max_evaluations
+        self.tolerance = tolerance
+
+    def _parameter_bounds(self, model: Model) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+        """
+        获取模型参数名及其上下限
+
+        参数:
+            model: 参数化模型
+
+        返回:
+            (参数名, 下限数组, 上限数组)
+
+        抛出:
+            ValueError: 如果模型不是参数化模型或缺少参数范围
+        """
+        if not dataclasses.is_dataclass(model):
+            raise ValueError(f"只能校准参数化模型（数据类），当前: {type(model).__name__}")
+        names = tuple(field.name for field in dataclasses.fields(model))
+        bounds = self.bounds
+        if bounds is None:
+            # 子类沿用基类模型的默认范围
+            defaults = (PARAMETER_BOUNDS.get(cls) for cls in type(model).__mro__)
+            bounds = next((b for b in defaults if b is not None), None)
+        if bounds is None or any(name not in bounds for name in names):
+            raise ValueError(f"缺少 {type(model).__name__} 的参数范围，请通过 bounds 传入")
+        lower = np.array([bounds[name][0] for name in names], dtype=float)
+        upper = np.array([bounds[name][1] for name in names], dtype=float)
+        return names, lower, upper
+
+    def calibrate(self, quotes: QuoteChain, initial: Model) -> CalibrationResult:
+        """
+        把模型校准到报价链
+
+        参数:
+            quotes: 报价链
+            initial: 初始模型（决定模型类型；可传入上一次的 CalibrationResult.model 热启动）
+
+        返回:
+            CalibrationResult 对象
+
+        抛出:
+            ValueError: 如果模型无法校准
+        """
+        from scipy.optimize import least_squares
+
+        start = time.perf_counter()
+        names, lower, upper = self._parameter_bounds(initial)
+        x = np.clip([getattr(initial, name) for name in names], lower, upper)
+        try:
+            initial.characteristic_function_gradient(np.zeros(1), 1.0, quotes.rate)
+            analytic = True
+        except NotImplementedError:
+            analytic = False
+
+        def build(params: np.ndarray) -> Model:
+            return dataclasses.replace(initial, **dict(zip(names, map(float, params))))
+
+        model = build(x)
+        evaluations = jacobian_evaluations = 0
+        for _ in range(2):
+            system = _SurfaceSystem(quotes, model, self.n_terms, self.truncation)
+
+            def residuals(params: np.ndarray) -> np.ndarray:
+                return quotes.weights * (system.prices(build(params)) - quotes.prices)
+
+            def jacobian(params: np.ndarray) -> np.ndarray:
+                return quotes.weights[:, np.newaxis] * system.jacobian(build(params))
+
+            solution = least_squares(
+                residuals,
+                x,
+                jac=jacobian if analytic else "2-point",
+                bounds=(lower, upper),
+                method="trf",
+                x_scale="jac",
+                ftol=self.tolerance,
+                xtol=self.tolerance,
+                gtol=self.tolerance,
+                max_nfev=self.max_evaluations,
+            )
+            evaluations += solution.nfev
+            jacobian_evaluations += solution.njev or 0
+            x = solution.x
+            model = build(x)
+            if system.contains(model, self.truncation):
+                break
+
+        errors = system.prices(model) - quotes.prices
+        weighted = quotes.weights * errors
+        return CalibrationResult(
+            model=model,
+            rmse=float(np.sqrt(np.mean(weighted**2))),
+            max_abs_error=float(np.max(np.abs(errors))),
+            residuals=errors,
+            iterations=evaluations,
+            jacobian_evaluations=jacobian_evaluations,
+            elapsed=time.perf_counter() - start,
+            success=bool(solution.success),
+            message=str(solution.message),
+        )
+
+    def __repr__(self) -> str:
+        return f"ModelCalibrator(n_terms={self.n_terms}, truncation={self.truncation})"
@@ -0,0 +1,26 @@
+"""
+模型模块
+
+包含标的资产动态模型（几何布朗运动、Heston 随机波动率、Dupire 局部波动率），
+供 PDE 和 MC 定价方法使用（延迟加载）
+"""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "Model": ".base",
+        "GBMModel": ".gbm",
+        "HestonModel": ".heston",
+        "LocalVolModel": ".local_vol",
+    },
+)
+
+if TYPE_CHECKING:  # pragma: no cover - 仅供类型检查器使用
+    from .base import Model
+    from .gbm import GBMModel
+    from .heston import HestonModel
+    from .local_vol import LocalVolModel
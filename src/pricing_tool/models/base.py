@@ -0,0 +1,154 @@
+"""
+模型基类模块
+
+定义标的资产动态模型的抽象接口
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class Model(ABC):
+    """
+    标的资产动态模型抽象基类
+
+    模型描述风险中性测度下标的价格（及可能的状态变量，如方差）的演化，
+    与合约条款和定价方法无关。MC 方法通过 initial_state/step 逐步推进路径，
+    PDE 方法按模型类型选择相应的离散算子
+
+    模拟约定:
+        定价方法负责生成标准正态随机数 Z（形状为 (n_factors, 路径数)）并处理对偶变量，
+        模型只负责把 (S, state) 从 t 推进到 t + dt
+    """
+
+    __slots__ = ()
+
+    n_factors = 1
+    """每个时间步需要的独立标准正态随机数个数"""
+
+    exact_transition = False
+    """step 是否为精确转移（True 时任意步长都无离散化误差，MC 不需要细分时间步）"""
+
+    @property
+    @abstractmethod
+    def volatility_scale(self) -> float:
+        """
+        典型波动率水平（用于确定 PDE 网格宽度）
+
+        返回:
+            年化波动率
+        """
+        pass
+
+    def characteristic_function(self, u: np.ndarray, T: float, r: float) -> np.ndarray:
+        """
+        对数收益 ln(S_T / S_0) 的特征函数 E[exp(i u ln(S_T / S_0))]
+
+        供 Fourier 定价方法使用；没有解析特征函数的模型（如局部波动率）不实现
+
+        参数:
+            u: 频率（可以是复数数组）
+            T: 期限
+            r: 无风险利率
+
+        返回:
+            与 u 同形状的复数数组
+
+        抛出:
+            NotImplementedError: 如果模型没有解析特征函数
+        """
+        raise NotImplementedError(f"{type(self).__name__} 没有解析特征函数，不支持 Fourier 定价")
+
+    def characteristic_function_gradient(
+        self, u: np.ndarray, T: float, r: float
+    ) -> np.ndarray:
+        """
+        特征函数对模型参数的解析梯度
+
+        供校准使用；未实现时校准退化为对残差做有限差分
+
+        参数:
+            u: 频率（可以是复数数组）
+            T: 期限（可以是与 u 可广播的数组）
+            r: 无风险利率
+
+        返回:
+            形状为 (参数个数,) + u.shape 的复数数组，参数顺序与模型字段顺序一致
+
+        抛出:
+            NotImplementedError: 如果模型没有解析梯度
+        """
+        raise NotImplementedError(f"{type(self).__name__} 没有特征函数的解析梯度")
+
+    def initial_state(self, size: int) -> Optional[np.ndarray]:
+        """
+        初始状态变量
+
+        参数:
+            size: 路径数
+
+        返回:
+            状态变量数组；只有价格一个状态的模型返回 None
+        """
+        return None
+
+    @abstractmethod
+    def step(
+        self,
+        S: np.ndarray,
+        state: Optional[np.ndarray],
+        t: float,
+        dt: float,
+        r: float,
+        Z: np.ndarray,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        将路径从 t 推进到 t + dt（抽象方法）
+
+        参数:
+            S: 当前标的价格，形状为 (路径数,)
+            state: 当前状态变量（initial_state 的返回值或上一步的结果）
+            t: 当前时间
+            dt: 时间步长
+            r: 无风险利率
+            Z: 标准正态随机数，形状为 (n_factors, 路径数)
+
+        返回:
+            (t + dt 时的标的价格, t + dt 时的状态变量)
+        """
+        pass
+
+    def step_vjp(
+        self,
+        S: np.ndarray,
+        t: float,
+        dt: float,
+        r: float,
+        Z: np.ndarray,
+        S_next: np.ndarray,
+        bar_S_next: np.ndarray,
+    ) -> Tuple[np.ndarray, float, np.ndarray]:
+        """
+        step 的伴随（向量-Jacobian 乘积），供伴随法 Greeks 使用
+
+        只适用于没有额外状态变量的模型
+
+        参数:
+            S: 步首标的价格
+            t: 当前时间
+            dt: 时间步长
+            r: 无风险利率
+            Z: 本步使用的标准正态随机数
+            S_next: step 的输出价格
+            bar_S_next: 目标函数对 S_next 的伴随
+
+        返回:
+            (对 S 的伴随, 对 r 的伴随（所有路径求和）, 对模型参数的伴随（所有路径求和）)
+
+        抛出:
+            NotImplementedError: 如果模型没有伴随实现
+        """
+        raise NotImplementedError(f"{type(self).__name__} 没有伴随实现，请使用扰动法 Greeks")
+
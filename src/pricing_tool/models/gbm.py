@@ -0,0 +1,135 @@
+"""
+几何布朗运动模型模块
+
+实现 Black-Scholes 常数波动率模型
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .._slots import slotted
+from .base import Model
+
+
+@slotted
+@dataclass(frozen=True)
+class GBMModel(Model):
+    """
+    几何布朗运动（Black-Scholes）模型
+
+    dS = r S dt + sigma S dW，转移分布已知，任意步长均为精确模拟。
+    定价方法未指定模型时，使用 MarketData.sigma 构造本模型
+    """
+
+    sigma: float
+    """波动率（年化）"""
+
+    exact_transition = True
+
+    def __post_init__(self) -> None:
+        """
+        验证参数有效性
+
+        抛出:
+            ValueError: 如果波动率不为正
+        """
+        if self.sigma <= 0:
+            raise ValueError(f"波动率 sigma 必须大于 0，当前值: {self.sigma}")
+
+    @property
+    def volatility_scale(self) -> float:
+        return self.sigma
+
+    def characteristic_function(self, u: np.ndarray, T: float, r: float) -> np.ndarray:
+        """
+        对数收益的特征函数 exp(i u (r - sigma^2/2) T - sigma^2 u^2 T / 2)
+
+        参数:
+            u: 频率（可以是复数数组）
+            T: 期限
+            r: 无风险利率
+
+        返回:
+            与 u 同形状的复数数组
+        """
+        u = np.asarray(u, dtype=complex)
+        variance = self.sigma**2 * T
+        return np.exp(1j * u * (r * T - 0.5 * variance) - 0.5 * variance * u**2)
+
+    def characteristic_function_gradient(
+        self, u: np.ndarray, T: float, r: float
+    ) -> np.ndarray:
+        """
+        特征函数对 sigma 的梯度
+
+        参数:
+            u: 频率（可以是复数数组）
+            T: 期限（可以是与 u 可广播的数组）
+            r: 无风险利率
+
+        返回:
+            形状为 (1,) + u.shape 的复数数组
+        """
+        u = np.asarray(u, dtype=complex)
+        phi = self.characteristic_function(u, T, r)
+        return (-self.sigma * T * u * (1j + u) * phi)[np.newaxis]
+
+    def step(
+        self,
+        S: np.ndarray,
+        state: Optional[np.ndarray],
+        t: float,
+        dt: float,
+        r: float,
+        Z: np.ndarray,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        按精确解推进一步
+
+        参数:
+            S: 当前标的价格
+            state: 未使用
+            t: 当前时间
+            dt: 时间步长
+            r: 无风险利率
+            Z: 标准正态随机数，形状为 (1, 路径数)
+
+        返回:
+            (t + dt 时的标的价格, None)
+        """
+        sigma = self.sigma
+        return S * np.exp((r - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * Z[0]), None
+
+    def step_vjp(
+        self,
+        S: np.ndarray,
+        t: float,
+        dt: float,
+        r: float,
+        Z: np.ndarray,
+        S_next: np.ndarray,
+        bar_S_next: np.ndarray,
+    ) -> Tuple[np.ndarray, float, np.ndarray]:
+        """
+        精确步的伴随
+
+        S_next = S exp(a)，a = (r - sigma^2/2) dt + sigma sqrt(dt) Z
+
+        参数:
+            S: 步首标的价格
+            t: 当前时间
+            dt: 时间步长
+            r: 无风险利率
+            Z: 本步使用的标准正态随机数
+            S_next: step 的输出价格
+            bar_S_next: 目标函数对 S_next 的伴随
+
+        返回:
+            (对 S 的伴随, 对 r 的伴随, 对 (sigma,) 的伴随)
+        """
+        bar_a = bar_S_next * S_next
+        bar_sigma = np.dot(bar_a, np.sqrt(dt) * Z[0] - self.sigma * dt)
+        return bar_S_next * S_next / S, float(bar_a.sum() * dt), np.array([bar_sigma])
+
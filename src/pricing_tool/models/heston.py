@@ -0,0 +1,239 @@
+"""
+Heston 随机波动率模型模块
+
+实现 Heston 模型及其 Andersen QE（Quadratic-Exponential）离散格式
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .._slots import slotted
+from .base import Model
+
+# QE 格式在二次分支和指数分支之间切换的阈值（Andersen 2008 推荐值）
+_PSI_CRITICAL = 1.5
+
+
+@slotted
+@dataclass(frozen=True)
+class HestonModel(Model):
+    """
+    Heston 随机波动率模型
+
+    dS = r S dt + sqrt(v) S dW_1
+    dv = kappa (theta - v) dt + xi sqrt(v) dW_2,  d<W_1, W_2> = rho dt
+
+    MC 使用 Andersen QE 格式：方差按矩匹配的二次/指数分布抽样（保持非负，
+    不要求 Feller 条件），对数价格按中心离散（gamma_1 = gamma_2 = 1/2）推进。
+    每一步只有逐元素的向量运算，没有按路径的 Python 循环
+    """
+
+    v0: float
+    """初始方差"""
+
+    kappa: float
+    """方差均值回复速度"""
+
+    theta: float
+    """长期方差"""
+
+    xi: float
+    """方差的波动率（vol of vol）"""
+
+    rho: float
+    """价格与方差驱动布朗运动的相关系数"""
+
+    n_factors = 2
+
+    def __post_init__(self) -> None:
+        """
+        验证参数有效性
+
+        抛出:
+            ValueError: 如果参数无效
+        """
+        if self.v0 <= 0:
+            raise ValueError(f"初始方差 v0 必须大于 0，当前值: {self.v0}")
+        if self.kappa <= 0:
+            raise ValueError(f"均值回复速度 kappa 必须大于 0，当前值: {self.kappa}")
+        if self.theta <= 0:
+            raise ValueError(f"长期方差 theta 必须大于 0，当前值: {self.theta}")
+        if self.xi <= 0:
+            raise ValueError(f"方差波动率 xi 必须大于 0，当前值: {self.xi}")
+        if not -1.0 < self.rho < 1.0:
+            raise ValueError(f"相关系数 rho 必须在 (-1, 1) 之间，当前值: {self.rho}")
+
+    @property
+    def volatility_scale(self) -> float:
+        return float(np.sqrt(max(self.v0, self.theta)))
+
+    @property
+    def feller_satisfied(self) -> bool:
+        """
+        是否满足 Feller 条件 2 kappa theta >= xi^2
+
+        返回:
+            True 如果方差过程不会到达 0
+        """
+        return 2.0 * self.kappa * self.theta >= self.xi**2
+
+    def characteristic_function(self, u: np.ndarray, T: float, r: float) -> np.ndarray:
+        """
+        对数收益的特征函数
+
+        使用 Albrecher 等（2007）的形式（g 取 (beta - d) / (beta + d)），
+        避免原始 Heston 公式在长期限下复对数分支跳跃导致的不连续
+
+        参数:
+            u: 频率（可以是复数数组）
+            T: 期限
+            r: 无风险利率
+
+        返回:
+            与 u 同形状的复数数组
+        """
+        u = np.asarray(u, dtype=complex)
+        kappa, theta, xi, rho = self.kappa, self.theta, self.xi, self.rho
+        beta = kappa - 1j * rho * xi * u
+        d = np.sqrt(beta**2 + xi**2 * (1j * u + u**2))
+        g = (beta - d) / (beta + d)
+        decay = np.exp(-d * T)
+        C = kappa * theta / xi**2 * ((beta - d) * T - 2.0 * np.log((1.0 - g * decay) / (1.0 - g)))
+        D = (beta - d) / xi**2 * (1.0 - decay) / (1.0 - g * decay)
+        return np.exp(1j * u * r * T + C + D * self.v0)
+
+    def characteristic_function_gradient(
+        self, u: np.ndarray, T: float, r: float
+    ) -> np.ndarray:
+        """
+        特征函数对 (v0, kappa, theta, xi, rho) 的解析梯度
+
+        对 characteristic_function 中的 beta、d、g、C、D 逐个链式求导，
+        一次求值得到全部五个参数的导数（校准的 Jacobian 不需要有限差分）
+
+        参数:
+            u: 频率（可以是复数数组）
+            T: 期限（可以是与 u 可广播的数组）
+            r: 无风险利率
+
+        返回:
+            形状为 (5,) + u.shape 的复数数组
+        """
+        u = np.asarray(u, dtype=complex)
+        kappa, theta, xi, rho = self.kappa, self.theta, self.xi, self.rho
+        iu = 1j * u
+        q = iu + u**2
+        beta = kappa - rho * xi * iu
+        d = np.sqrt(beta**2 + xi**2 * q)
+        g = (beta - d) / (beta + d)
+        decay = np.exp(-d * T)
+        log_ratio = np.log((1.0 - g * decay) / (1.0 - g))
+        bracket = (beta - d) * T - 2.0 * log_ratio
+        C = kappa * theta / xi**2 * bracket
+        A = (beta - d) / xi**2
+        B = (1.0 - decay) / (1.0 - g * decay)
+        D = A * B
+        phi = np.exp(iu * r * T + C + D * self.v0)
+
+        def log_phi_derivative(
+            d_beta: np.ndarray, d_xi: float, d_coefficient: float
+        ) -> np.ndarray:
+            # d_coefficient 为 kappa * theta / xi^2 的导数
+            d_d = (beta * d_beta + xi * q * d_xi) / d
+            d_g = 2.0 * (d * d_beta - beta * d_d) / (beta + d) ** 2
+            d_decay = -T * decay * d_d
+            d_log_ratio = -(d_g * decay + g * d_decay) / (1.0 - g * decay) + d_g / (1.0 - g)
+            d_C = d_coefficient * bracket + kappa * theta / xi**2 * (
+                (d_beta - d_d) * T - 2.0 * d_log_ratio
+            )
+            d_A = (d_beta - d_d) / xi**2 - 2.0 * (beta - d) * d_xi / xi**3
+            denominator = 1.0 - g * decay
+            d_B = (
+                -d_decay * denominator + (1.0 - decay) * (d_g * decay + g * d_decay)
+            ) / denominator**2
+            return d_C + self.v0 * (d_A * B + A * d_B)
+
+        gradient = [
+            D,
+            log_phi_derivative(np.ones_like(beta), 0.0, theta / xi**2),
+            C / theta,
+            log_phi_derivative(-rho * iu, 1.0, -2.0 * kappa * theta / xi**3),
+            log_phi_derivative(-xi * iu, 0.0, 0.0),
+        ]
+        return np.stack(gradient) * phi
+
+    def initial_state(self, size: int) -> np.ndarray:
+        """
+        初始方差
+
+        参数:
+            size: 路径数
+
+        返回:
+            填充 v0 的数组
+        """
+        return np.full(size, self.v0)
+
+    def step(
+        self,
+        S: np.ndarray,
+        state: Optional[np.ndarray],
+        t: float,
+        dt: float,
+        r: float,
+        Z: np.ndarray,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        按 QE 格式推进一步
+
+        参数:
+            S: 当前标的价格
+            state: 当前方差
+            t: 当前时间
+            dt: 时间步长
+            r: 无风险利率
+            Z: 标准正态随机数，形状为 (2, 路径数)；Z[0] 驱动方差，Z[1] 驱动价格的独立部分
+
+        返回:
+            (t + dt 时的标的价格, t + dt 时的方差)
+        """
+        from scipy.special import ndtr
+
+        v = state
+        kappa, theta, xi, rho = self.kappa, self.theta, self.xi, self.rho
+        decay = np.exp(-kappa * dt)
+
+        # 条件均值和方差（精确矩）
+        m = theta + (v - theta) * decay
+        s2 = v * (xi**2 * decay / kappa * (1.0 - decay)) + theta * xi**2 / (2.0 * kappa) * (
+            1.0 - decay
+        ) ** 2
+        psi = s2 / (m * m)
+
+        # 二次分支 v' = a (b + Z)^2 先对全部路径计算（psi 截断到阈值以免无效值），
+        # 再只对 psi 超过阈值的路径改用指数分支，避免两次布尔索引拷贝
+        inv_psi = 2.0 / np.minimum(psi, _PSI_CRITICAL)
+        b2 = inv_psi - 1.0 + np.sqrt(inv_psi * (inv_psi - 1.0))
+        v_next = m / (1.0 + b2) * (np.sqrt(b2) + Z[0]) ** 2
+        exponential = np.flatnonzero(psi > _PSI_CRITICAL)
+        if exponential.size:
+            # 指数分支：在 0 处有质量 p 的指数分布，U = Phi(Z) 保持与对偶变量兼容
+            psi_e = psi[exponential]
+            p = (psi_e - 1.0) / (psi_e + 1.0)
+            beta = (1.0 - p) / m[exponential]
+            U = ndtr(Z[0, exponential])
+            v_next[exponential] = np.where(
+                U <= p, 0.0, np.log((1.0 - p) / np.maximum(1.0 - U, 1e-300)) / beta
+            )
+
+        # 对数价格：Andersen 中心离散
+        k0 = -rho * kappa * theta / xi * dt
+        k1 = 0.5 * dt * (kappa * rho / xi - 0.5) - rho / xi
+        k2 = 0.5 * dt * (kappa * rho / xi - 0.5) + rho / xi
+        k3 = 0.5 * dt * (1.0 - rho**2)
+        log_increment = (
+            r * dt + k0 + k1 * v + k2 * v_next + np.sqrt(k3 * (v + v_next)) * Z[1]
+        )
+        return S * np.exp(log_increment), v_next
@@ -0,0 +1,273 @@
+"""
+局部波动率模型模块
+
+实现 Dupire 局部波动率模型：由隐含波动率曲面按 Dupire 公式构造局部波动率网格，
+在网格上插值求值
+"""
+
+from dataclasses import FrozenInstanceError
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import Model
+
+# 局部方差的下限，防止隐含波动率曲面存在轻微套利时出现负值或除零
+_MIN_LOCAL_VARIANCE = 1e-8
+
+
+class LocalVolModel(Model):
+    """
+    Dupire 局部波动率模型
+
+    dS = r S dt + sigma_loc(S, t) S dW
+
+    局部波动率保存在 (时间, 对数远期在值程度 y = ln(S / F(t))) 网格上，
+    F(t) = spot * exp(rate * t)。求值时时间方向线性插值、y 方向线性插值，
+    超出网格的点取边界值。MC 使用对数 Euler 格式，PDE 方法按时间层重建算子
+
+    实例不可变，按对象身份哈希（可用作缓存键）
+    """
+
+    __slots__ = ("spot", "rate", "times", "log_moneyness", "local_vols")
+
+    def __init__(
+        self,
+        spot: float,
+        rate: float,
+        times: Sequence[float],
+        log_moneyness: Sequence[float],
+        local_vols: np.ndarray,
+    ):
+        """
+        由局部波动率网格初始化模型
+
+        参数:
+            spot: 构造曲面时的现价（确定远期 F(t)）
+            rate: 构造曲面时的无风险利率
+            times: 时间节点（升序）
+            log_moneyness: 对数远期在值程度节点（升序）
+            local_vols: 局部波动率，形状为 (len(times), len(log_moneyness))
+
+        抛出:
+            ValueError: 如果网格形状不一致或数值无效
+        """
+        times_arr = np.asarray(times, dtype=float)
+        y = np.asarray(log_moneyness, dtype=float)
+        vols = np.array(local_vols, dtype=float)
+        if spot <= 0:
+            raise ValueError(f"现价 spot 必须大于 0，当前值: {spot}")
+        if vols.shape != (times_arr.size, y.size):
+            raise ValueError(
+                f"局部波动率网格形状必须为 ({times_arr.size}, {y.size})，当前: {vols.shape}"
+            )
+        if y.size < 2:
+            raise ValueError("在值程度节点至少需要 2 个")
+        if np.any(np.diff(times_arr) <= 0) or np.any(np.diff(y) <= 0):
+            raise ValueError("时间节点和在值程度节点必须严格递增")
+        if not np.all(np.isfinite(vols)) or vols.min() <= 0:
+            raise ValueError("局部波动率必须是正的有限数值")
+        for array in (times_arr, y, vols):
+            array.setflags(write=False)
+        object.__setattr__(self, "spot", float(spot))
+        object.__setattr__(self, "rate", float(rate))
+        object.__setattr__(self, "times", times_arr)
+        object.__setattr__(self, "log_moneyness", y)
+        object.__setattr__(self, "local_vols", vols)
+
+    @classmethod
+    def from_implied_vol(
+        cls,
+        spot: float,
+        rate: float,
+        maturities: Sequence[float],
+        log_moneyness: Sequence[float],
+        implied_vols: np.ndarray,
+    ) -> "LocalVolModel":
+        """
+        由隐含波动率曲面按 Dupire 公式构造局部波动率
+
+        以总隐含方差 w(y, T) = sigma_imp^2 T 表示（Gatheral 形式）:
+        sigma_loc^2 = (dw/dT) / (1 - y/w dw/dy + 1/4 (-1/4 - 1/w + y^2/w^2) (dw/dy)^2
+        + 1/2 d^2w/dy^2)，导数在网格上用有限差分计算
+
+        参数:
+            spot: 现价
+            rate: 无风险利率
+            maturities: 期限节点（升序，均大于 0）
+            log_moneyness: 对数远期在值程度 ln(K / F(T)) 节点（升序）
+            implied_vols: 隐含波动率，形状为 (len(maturities), len(log_moneyness))
+
+        返回:
+            LocalVolModel 对象
+
+        抛出:
+            ValueError: 如果网格无效
+        """
+        T = np.asarray(maturities, dtype=float)
+        y = np.asarray(log_moneyness, dtype=float)
+        iv = np.asarray(implied_vols, dtype=float)
+        if T.size < 2 or y.size < 3:
+            raise ValueError("隐含波动率曲面至少需要 2 个期限和 3 个在值程度节点")
+        if iv.shape != (T.size, y.size):
+            raise ValueError(f"隐含波动率网格形状必须为 ({T.size}, {y.size})，当前: {iv.shape}")
+        if T[0] <= 0:
+            raise ValueError(f"期限必须大于 0，当前值: {T[0]}")
+
+        w = iv**2 * T[:, np.newaxis]
+        dw_dT = np.gradient(w, T, axis=0)
+        dw_dy = np.gradient(w, y, axis=1)
+        d2w_dy2 = np.gradient(dw_dy, y, axis=1)
+        Y = y[np.newaxis, :]
+        denominator = (
+            1.0
+            - Y / w * dw_dy
+            + 0.25 * (-0.25 - 1.0 / w + Y**2 / w**2) * dw_dy**2
+            + 0.5 * d2w_dy2
+        )
+        local_variance = dw_dT / np.maximum(denominator, _MIN_LOCAL_VARIANCE)
+        local_vols = np.sqrt(np.maximum(local_variance, _MIN_LOCAL_VARIANCE))
+        return cls(spot, rate, T, y, local_vols)
+
+    def local_vol(self, S: np.ndarray, t: float) -> np.ndarray:
+        """
+        计算局部波动率
+
+        参数:
+            S: 标的价格数组
+            t: 时间
+
+        返回:
+            与 S 同形状的局部波动率数组
+        """
+        times = self.times
+        k = int(np.clip(np.searchsorted(times, t), 1, max(times.size - 1, 1)))
+        if times.size == 1:
+            row = self.local_vols[0]
+        else:
+            weight = float(np.clip((t - times[k - 1]) / (times[k] - times[k - 1]), 0.0, 1.0))
+            row = (1.0 - weight) * self.local_vols[k - 1] + weight * self.local_vols[k]
+        y = np.log(np.maximum(S, 1e-300) / self.spot) - self.rate * t
+        return np.interp(y, self.log_moneyness, row)
+
+    @property
+    def volatility_scale(self) -> float:
+        return float(np.median(self.local_vols))
+
+    def step(
+        self,
+        S: np.ndarray,
+        state: Optional[np.ndarray],
+        t: float,
+        dt: float,
+        r: float,
+        Z: np.ndarray,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        按对数 Euler 格式推进一步（波动率取步首的局部波动率）
+
+        参数:
+            S: 当前标的价格
+            state: 未使用
+            t: 当前时间
+            dt: 时间步长
+            r: 无风险利率
+            Z: 标准正态随机数，形状为 (1, 路径数)
+
+        返回:
+            (t + dt 时的标的价格, None)
+        """
+        sigma = self.local_vol(S, t)
+        return S * np.exp((r - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * Z[0]), None
+
+    def local_vol_vjp(
+        self, S: np.ndarray, t: float, bar_sigma: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        local_vol 的伴随（向量-Jacobian 乘积）
+
+        局部波动率对网格节点是线性插值，对价格是分段线性函数（超出网格时为常数）
+
+        参数:
+            S: 标的价格数组
+            t: 时间
+            bar_sigma: 目标函数对 local_vol(S, t) 的伴随，与 S 同形状
+
+        返回:
+            (对 S 的伴随, 对 local_vols 网格的伴随（形状与 local_vols 相同）)
+        """
+        times, nodes = self.times, self.log_moneyness
+        S = np.asarray(S, dtype=float)
+        bar_sigma = np.asarray(bar_sigma, dtype=float)
+        k = int(np.clip(np.searchsorted(times, t), 1, max(times.size - 1, 1)))
+        if times.size == 1:
+            time_weights = [(0, 1.0)]
+            row = self.local_vols[0]
+        else:
+            weight = float(np.clip((t - times[k - 1]) / (times[k] - times[k - 1]), 0.0, 1.0))
+            time_weights = [(k - 1, 1.0 - weight), (k, weight)]
+            row = (1.0 - weight) * self.local_vols[k - 1] + weight * self.local_vols[k]
+
+        y = np.log(np.maximum(S, 1e-300) / self.spot) - self.rate * t
+        j = np.clip(np.searchsorted(nodes, y), 1, nodes.size - 1)
+        span = nodes[j] - nodes[j - 1]
+        lam = np.clip((y - nodes[j - 1]) / span, 0.0, 1.0)
+        inside = (y > nodes[0]) & (y < nodes[-1])
+        bar_S = bar_sigma * inside * (row[j] - row[j - 1]) / span / S
+
+        row_gradient = np.bincount(
+            (j - 1).ravel(), weights=(bar_sigma * (1.0 - lam)).ravel(), minlength=nodes.size
+        ) + np.bincount(j.ravel(), weights=(bar_sigma * lam).ravel(), minlength=nodes.size)
+        bar_grid = np.zeros_like(self.local_vols)
+        for index, weight in time_weights:
+            bar_grid[index] += weight * row_gradient
+        return bar_S, bar_grid
+
+    def step_vjp(
+        self,
+        S: np.ndarray,
+        t: float,
+        dt: float,
+        r: float,
+        Z: np.ndarray,
+        S_next: np.ndarray,
+        bar_S_next: np.ndarray,
+    ) -> Tuple[np.ndarray, float, np.ndarray]:
+        """
+        对数 Euler 步的伴随
+
+        S_next = S exp(a)，a = (r - sigma^2/2) dt + sigma sqrt(dt) Z，sigma = local_vol(S, t)
+
+        参数:
+            S: 步首标的价格
+            t: 当前时间
+            dt: 时间步长
+            r: 无风险利率
+            Z: 本步使用的标准正态随机数
+            S_next: step 的输出价格
+            bar_S_next: 目标函数对 S_next 的伴随
+
+        返回:
+            (对 S 的伴随, 对 r 的伴随, 对 local_vols 网格的伴随)
+        """
+        sigma = self.local_vol(S, t)
+        bar_a = bar_S_next * S_next
+        bar_S_sigma, bar_grid = self.local_vol_vjp(
+            S, t, bar_a * (np.sqrt(dt) * Z[0] - sigma * dt)
+        )
+        return bar_S_next * S_next / S + bar_S_sigma, float(bar_a.sum() * dt), bar_grid
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"LocalVolModel 是不可变对象，不能修改属性 {name!r}")
+
+    def __repr__(self) -> str:
+        """
+        返回模型的字符串表示
+
+        返回:
+            格式化的字符串
+        """
+        return (
+            f"LocalVolModel(spot={self.spot:.2f}, rate={self.rate:.4f}, "
+            f"grid={self.times.size}x{self.log_moneyness.size})"
+        )
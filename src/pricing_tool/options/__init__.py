@@ -1,10 +1,35 @@
 """
 期权类型模块
 
-包含所有期权类型的基类和具体实现
+包含所有期权类型的基类和具体实现（延迟加载）
 """
 
-from .base import Option
-from .exotic import ExoticOption
+from typing import TYPE_CHECKING
 
-__all__ = ["Option", "ExoticOption"]
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "Option": ".base",
+        "ExoticOption": ".exotic",
+        "EuropeanOption": ".european_option",
+        "MultiAssetOption": ".multi_asset_option",
+        "BasketOption": ".basket_option",
+        "RainbowOption": ".rainbow_option",
+        "AsianOption": ".asian_option",
+        "BarrierOption": ".barrier_option",
+        "LookbackOption": ".lookback_option",
+    },
+)
+
+if TYPE_CHECKING:  # pragma: no cover - 仅供类型检查器使用
+    from .base import Option
+    from .asian_option import AsianOption
+    from .barrier_option import BarrierOption
+    from .basket_option import BasketOption
+    from .european_option import EuropeanOption
+    from .exotic import ExoticOption
+    from .lookback_option import LookbackOption
+    from .multi_asset_option import MultiAssetOption
+    from .rainbow_option import RainbowOption
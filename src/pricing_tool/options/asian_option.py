@@ -0,0 +1,110 @@
+"""
+亚式期权模块
+
+实现基于观察日平均价格的亚式期权（算术/几何平均）
+"""
+
+from typing import Literal, Optional, Sequence
+
+import numpy as np
+
+from .exotic import Dividend, ExoticOption
+
+
+class AsianOption(ExoticOption):
+    """
+    亚式期权（固定执行价）
+    
+    收益基于各观察日价格的平均值 A：看涨 max(A - K, 0)，看跌 max(K - A, 0)。
+    未给出观察日程时对定价方法时间网格上的所有价格取平均
+    """
+    
+    __slots__ = ("average_type",)
+    
+    pde_supported = False
+    
+    def __init__(
+        self,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        option_type: Literal["call", "put"] = "call",
+        average_type: Literal["arithmetic", "geometric"] = "arithmetic",
+        observation_dates: Optional[Sequence[float]] = None,
+        dividends: Optional[Sequence[Dividend]] = None,
+    ):
+        """
+        初始化亚式期权对象
+        
+        参数:
+            S: 标的资产当前价格
+            K: 执行价格
+            T: 到期时间（年）
+            r: 无风险利率（年化）
+            sigma: 波动率（年化）
+            option_type: 期权类型，"call" 或 "put"
+            average_type: 平均方式，"arithmetic"（算术）或 "geometric"（几何）
+            observation_dates: 平均价格的观察日（年）；None 表示连续观察
+            dividends: 离散现金分红 (除息时间, 金额) 序列
+            
+        抛出:
+            ValueError: 如果参数无效
+        """
+        super().__init__(S, K, T, r, sigma, option_type, observation_dates, dividends)
+        if average_type not in ["arithmetic", "geometric"]:
+            raise ValueError(f"平均方式必须是 'arithmetic' 或 'geometric'，当前值: {average_type}")
+        self._set_fields(average_type=average_type)
+    
+    def payoff(self, S_T: np.ndarray) -> np.ndarray:
+        """
+        计算亚式期权收益
+        
+        参数:
+            S_T: 观察日价格路径，形状为 (路径数, 观察日数)
+            
+        返回:
+            期权收益，形状为 (路径数,)
+        """
+        paths = self._as_paths(S_T)
+        if self.average_type == "arithmetic":
+            average = paths.mean(axis=1)
+        else:
+            average = np.exp(np.log(np.maximum(paths, 1e-300)).mean(axis=1))
+        if self.is_call:
+            return np.maximum(average - self.K, 0.0)
+        return np.maximum(self.K - average, 0.0)
+    
+    def payoff_gradient(self, S_T: np.ndarray) -> np.ndarray:
+        """
+        计算亚式期权收益对各观察日价格的导数
+        
+        参数:
+            S_T: 观察日价格路径，形状为 (路径数, 观察日数)
+            
+        返回:
+            导数，形状为 (路径数, 观察日数)
+        """
+        paths = self._as_paths(S_T)
+        n_obs = paths.shape[1]
+        if self.average_type == "arithmetic":
+            average = paths.mean(axis=1)
+            d_average = np.full_like(paths, 1.0 / n_obs)
+        else:
+            average = np.exp(np.log(np.maximum(paths, 1e-300)).mean(axis=1))
+            d_average = average[:, np.newaxis] / (n_obs * np.maximum(paths, 1e-300))
+        if self.is_call:
+            in_the_money = (average > self.K).astype(float)
+        else:
+            in_the_money = -(average < self.K).astype(float)
+        return in_the_money[:, np.newaxis] * d_average
+    
+    def boundary_condition(self, S: np.ndarray, t: float) -> np.ndarray:
+        """
+        亚式期权依赖平均价格，一维 PDE 无法表示
+        
+        抛出:
+            ValueError: 总是抛出
+        """
+        raise ValueError("亚式期权依赖平均价格，不支持一维 PDE 定价")
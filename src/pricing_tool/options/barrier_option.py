@@ -0,0 +1,196 @@
+"""
+障碍期权模块
+
+实现向上/向下、敲入/敲出障碍期权，支持离散观察日程和离散分红
+"""
+
+from typing import List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import Option
+from .exotic import Dividend, ExoticOption
+
+
+class BarrierOption(ExoticOption):
+    """
+    障碍期权
+    
+    标的价格在任一观察日触及障碍（向上: S >= barrier，向下: S <= barrier）即视为触发。
+    敲出期权触发后作废，敲入期权只有触发后才获得普通期权收益。
+    未给出观察日程时为连续观察
+    """
+    
+    __slots__ = ("barrier", "direction", "knock")
+    
+    def __init__(
+        self,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        option_type: Literal["call", "put"] = "call",
+        barrier: float = 120.0,
+        direction: Literal["up", "down"] = "up",
+        knock: Literal["in", "out"] = "out",
+        observation_dates: Optional[Sequence[float]] = None,
+        dividends: Optional[Sequence[Dividend]] = None,
+    ):
+        """
+        初始化障碍期权对象
+        
+        参数:
+            S: 标的资产当前价格
+            K: 执行价格
+            T: 到期时间（年）
+            r: 无风险利率（年化）
+            sigma: 波动率（年化）
+            option_type: 期权类型，"call" 或 "put"
+            barrier: 障碍价格
+            direction: 障碍方向，"up" 或 "down"
+            knock: 障碍类型，"in"（敲入）或 "out"（敲出）
+            observation_dates: 离散观察日（年）；None 表示连续观察
+            dividends: 离散现金分红 (除息时间, 金额) 序列
+            
+        抛出:
+            ValueError: 如果参数无效
+        """
+        super().__init__(S, K, T, r, sigma, option_type, observation_dates, dividends)
+        if barrier <= 0:
+            raise ValueError(f"障碍价格 barrier 必须大于 0，当前值: {barrier}")
+        if direction not in ["up", "down"]:
+            raise ValueError(f"障碍方向必须是 'up' 或 'down'，当前值: {direction}")
+        if knock not in ["in", "out"]:
+            raise ValueError(f"障碍类型必须是 'in' 或 'out'，当前值: {knock}")
+        self._set_fields(barrier=float(barrier), direction=direction, knock=knock)
+    
+    def _breached(self, S: np.ndarray) -> np.ndarray:
+        """
+        判断价格是否触及障碍
+        
+        参数:
+            S: 价格数组
+            
+        返回:
+            布尔数组
+        """
+        if self.direction == "up":
+            return S >= self.barrier
+        return S <= self.barrier
+    
+    def _vanilla(self, S_T: np.ndarray) -> np.ndarray:
+        """普通期权收益"""
+        if self.is_call:
+            return np.maximum(S_T - self.K, 0.0)
+        return np.maximum(self.K - S_T, 0.0)
+    
+    def payoff(self, S_T: np.ndarray, survival: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        计算障碍期权收益
+        
+        参数:
+            S_T: 观察日价格路径，形状为 (路径数, 观察日数)，最后一列为到期价格；
+                一维数组视为只在到期日观察
+            survival: 连续观察时各路径在相邻观察点之间均未触及障碍的条件概率（布朗桥），
+                形状为 (路径数,)；None 表示只在观察点判断
+                
+        返回:
+            期权收益，形状为 (路径数,)
+        """
+        paths = self._as_paths(S_T)
+        hit = self._breached(paths).any(axis=1)
+        vanilla = self._vanilla(paths[:, -1])
+        if survival is None:
+            alive = ~hit if self.knock == "out" else hit
+            return np.where(alive, vanilla, 0.0)
+        if self.knock == "out":
+            return np.where(hit, 0.0, vanilla * survival)
+        return np.where(hit, vanilla, vanilla * (1.0 - survival))
+    
+    def continuous_barrier(self) -> Optional[Tuple[float, str]]:
+        """
+        连续观察的有限障碍
+        
+        返回:
+            (障碍价格, 方向)；离散观察或障碍为无穷大（即普通期权）时返回 None
+        """
+        if self.observation_dates is not None or not np.isfinite(self.barrier):
+            return None
+        return self.barrier, self.direction
+    
+    def jump_condition(self, S: np.ndarray, t: float, V: np.ndarray) -> np.ndarray:
+        """
+        观察日的跳跃条件：敲出期权在触及障碍的区域价值置零
+        
+        参数:
+            S: 标的资产价格数组（网格点）
+            t: 观察日
+            V: 观察日之后（时间上）的期权价值
+            
+        返回:
+            观察日之前的期权价值
+        """
+        if self.knock == "out":
+            return np.where(self._breached(S), 0.0, V)
+        return V
+    
+    def pde_components(self) -> Optional[List[Tuple[float, ExoticOption]]]:
+        """
+        敲入期权按敲入-敲出平价分解为 普通期权 - 敲出期权
+        
+        返回:
+            敲入期权返回 (权重, 期权) 列表，敲出期权返回 None
+        """
+        if self.knock == "out":
+            return None
+        kwargs = dict(
+            S=self.S,
+            K=self.K,
+            T=self.T,
+            r=self.r,
+            sigma=self.sigma,
+            option_type=self.option_type,
+            observation_dates=self.observation_dates,
+            dividends=self.dividends,
+        )
+        # 无穷高的向上敲出障碍永远不会触发，即带相同分红日程的普通期权
+        vanilla = BarrierOption(barrier=np.inf, direction="up", knock="out", **kwargs)
+        knock_out = BarrierOption(
+            barrier=self.barrier, direction=self.direction, knock="out", **kwargs
+        )
+        return [(1.0, vanilla), (-1.0, knock_out)]
+    
+    def boundary_condition(self, S: np.ndarray, t: float) -> np.ndarray:
+        """
+        计算 PDE 边界条件
+        
+        敲出期权在障碍外侧的边界取 0，其余边界取普通期权的渐近值
+        
+        参数:
+            S: 标的资产价格数组（网格边界点）
+            t: 当前时间
+            
+        返回:
+            边界条件值数组
+        """
+        discounted_K = self.K * np.exp(-self.r * (self.T - t))
+        if self.is_call:
+            value = np.maximum(S - discounted_K, 0.0)
+        else:
+            value = np.maximum(discounted_K - S, 0.0)
+        if self.knock == "out":
+            value = np.where(self._breached(S), 0.0, value)
+        return value
+    
+    def __repr__(self) -> str:
+        """
+        返回障碍期权的字符串表示
+        
+        返回:
+            期权的描述字符串
+        """
+        return (
+            f"{Option.__repr__(self)[:-1]}, barrier={self.barrier:.2f}, "
+            f"{self.direction}-and-{self.knock})"
+        )
@@ -5,7 +5,8 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Literal, Optional
+from dataclasses import FrozenInstanceError
+from typing import Any, Dict, Literal, Optional, Tuple
 import numpy as np
 
 
@@ -14,8 +15,13 @@ class Option(ABC):
     期权抽象基类
     
     定义所有期权类型的通用属性和接口
+    
+    期权对象不可变且可哈希：属性存储在 __slots__ 中，初始化后不能修改。
+    子类应在 __slots__ 中声明自己的字段，并通过 _set_fields 赋值
     """
     
+    __slots__ = ("S", "K", "T", "r", "sigma", "option_type")
+    
     def __init__(
         self,
         S: float,
@@ -38,12 +44,95 @@ class Option(ABC):
         """
         self._validate_params(S, K, T, r, sigma, option_type)
         
-        self.S = S
-        self.K = K
-        self.T = T
-        self.r = r
-        self.sigma = sigma
-        self.option_type = option_type
+        self._set_fields(
+            S=S,
+            K=K,
+            T=T,
+            r=r,
+            sigma=sigma,
+            option_type=option_type,
+        )
+    
+    def _set_fields(self, **fields: Any) -> None:
+        """
+        在初始化阶段设置字段（绕过不可变限制）
+        
+        参数:
+            **fields: 字段名称和取值
+        """
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+    
+    @classmethod
+    def _field_names(cls) -> Tuple[str, ...]:
+        """
+        返回沿继承链声明的所有 __slots__ 字段名称
+        
+        返回:
+            字段名称元组（基类字段在前）
+        """
+        names = cls.__dict__.get("_cached_field_names")
+        if names is None:
+            names = tuple(
+                name
+                for klass in reversed(cls.__mro__)
+                for name in klass.__dict__.get("__slots__", ())
+                if name not in ("__dict__", "__weakref__")
+            )
+            # 直接写入类字典，避免子类读到基类缓存
+            type.__setattr__(cls, "_cached_field_names", names)
+        return names
+    
+    def _state(self) -> Tuple[Any, ...]:
+        """
+        返回期权的全部字段取值，用于比较、哈希和序列化
+        
+        返回:
+            字段取值元组
+        """
+        return tuple(getattr(self, name) for name in self._field_names())
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"{self.__class__.__name__} 是不可变对象，不能修改属性 {name!r}")
+    
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"{self.__class__.__name__} 是不可变对象，不能删除属性 {name!r}")
+    
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._state() == other._state()  # type: ignore[attr-defined]
+    
+    def __hash__(self) -> int:
+        return hash((type(self), self._state()))
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        return dict(zip(self._field_names(), self._state()))
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._set_fields(**state)
+    
+    def replace(self, **changes: Any) -> "Option":
+        """
+        返回替换部分字段后的新期权对象（类似 dataclasses.replace）
+        
+        参数:
+            **changes: 字段名称和新取值
+            
+        返回:
+            同类型的新期权对象
+            
+        抛出:
+            ValueError: 如果字段名称不存在
+        """
+        state = self.__getstate__()
+        unknown = set(changes) - set(state)
+        if unknown:
+            raise ValueError(f"{type(self).__name__} 没有字段: {sorted(unknown)}")
+        state.update(changes)
+        clone = object.__new__(type(self))
+        clone.__setstate__(state)
+        return clone
     
     @staticmethod
     def _validate_params(
@@ -115,6 +204,23 @@ class Option(ABC):
         """
         pass
     
+    def payoff_gradient(self, S_T: np.ndarray) -> np.ndarray:
+        """
+        计算收益对标的价格的导数（伴随法 / pathwise Greeks 使用）
+        
+        参数:
+            S_T: 与 payoff 的输入相同
+            
+        返回:
+            与 S_T 同形状的数组（在不可导点取单侧导数）
+            
+        抛出:
+            NotImplementedError: 如果收益不连续（如障碍期权），pathwise 导数不成立
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} 的收益不连续，不支持伴随法 Greeks，请使用扰动法"
+        )
+    
     def __repr__(self) -> str:
         """
         返回期权的字符串表示
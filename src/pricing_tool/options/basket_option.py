@@ -0,0 +1,73 @@
+"""
+篮子期权模块
+
+实现篮子期权，负权重时即为价差期权
+"""
+
+from typing import Literal, Optional, Sequence
+
+import numpy as np
+
+from .multi_asset_option import MultiAssetOption
+
+
+class BasketOption(MultiAssetOption):
+    """
+    篮子期权
+    
+    收益基于标的资产价格的加权和 B = sum(w_i * S_i)：
+    看涨 max(B - K, 0)，看跌 max(K - B, 0)。
+    权重为 (1, -1) 时为价差期权，再令 K = 0 即为交换期权
+    """
+    
+    __slots__ = ("weights",)
+    
+    def __init__(
+        self,
+        S: Sequence[float],
+        K: float,
+        T: float,
+        r: float,
+        sigma: Sequence[float],
+        option_type: Literal["call", "put"] = "call",
+        weights: Optional[Sequence[float]] = None,
+    ):
+        """
+        初始化篮子期权对象
+        
+        参数:
+            S: 各标的资产当前价格
+            K: 执行价格
+            T: 到期时间（年）
+            r: 无风险利率（年化）
+            sigma: 各标的资产波动率（年化）
+            option_type: 期权类型，"call" 或 "put"
+            weights: 各标的资产权重；None 时为等权重
+            
+        抛出:
+            ValueError: 如果参数无效
+        """
+        super().__init__(S, K, T, r, sigma, option_type)
+        if weights is None:
+            weights = [1.0 / self.n_assets] * self.n_assets
+        weights = tuple(float(w) for w in weights)
+        if len(weights) != self.n_assets:
+            raise ValueError(
+                f"权重数量必须与标的资产数量一致，当前: {len(weights)} != {self.n_assets}"
+            )
+        self._set_fields(weights=weights)
+    
+    def payoff(self, S_T: np.ndarray) -> np.ndarray:
+        """
+        计算篮子期权收益
+        
+        参数:
+            S_T: 到期时各标的资产价格，形状为 (..., n_assets)
+            
+        返回:
+            期权收益，形状为 S_T.shape[:-1]
+        """
+        basket = np.asarray(S_T, dtype=float) @ np.asarray(self.weights)
+        if self.is_call:
+            return np.maximum(basket - self.K, 0.0)
+        return np.maximum(self.K - basket, 0.0)
@@ -0,0 +1,73 @@
+"""
+欧式期权模块
+
+实现标准欧式看涨/看跌期权，作为各定价方法的基准合约
+"""
+
+from typing import Literal
+
+import numpy as np
+
+from .base import Option
+
+
+class EuropeanOption(Option):
+    """
+    欧式期权
+    
+    仅在到期日行权，收益为 max(S_T - K, 0)（看涨）或 max(K - S_T, 0)（看跌）
+    """
+    
+    __slots__ = ()
+    
+    def __init__(
+        self,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        option_type: Literal["call", "put"] = "call",
+    ):
+        """
+        初始化欧式期权对象
+        
+        参数:
+            S: 标的资产当前价格
+            K: 执行价格
+            T: 到期时间（年）
+            r: 无风险利率（年化）
+            sigma: 波动率（年化）
+            option_type: 期权类型，"call" 或 "put"
+        """
+        super().__init__(S, K, T, r, sigma, option_type)
+    
+    def payoff(self, S_T: np.ndarray) -> np.ndarray:
+        """
+        计算欧式期权收益
+        
+        参数:
+            S_T: 到期时的标的资产价格（可以是标量或数组）
+            
+        返回:
+            期权收益（与 S_T 同形状的数组）
+        """
+        S_T = np.asarray(S_T, dtype=float)
+        if self.is_call:
+            return np.maximum(S_T - self.K, 0.0)
+        return np.maximum(self.K - S_T, 0.0)
+    
+    def payoff_gradient(self, S_T: np.ndarray) -> np.ndarray:
+        """
+        计算欧式期权收益对到期价格的导数
+        
+        参数:
+            S_T: 到期时的标的资产价格
+            
+        返回:
+            看涨期权为 1{S_T > K}，看跌期权为 -1{S_T < K}
+        """
+        S_T = np.asarray(S_T, dtype=float)
+        if self.is_call:
+            return (S_T > self.K).astype(float)
+        return -(S_T < self.K).astype(float)
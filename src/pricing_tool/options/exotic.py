@@ -5,11 +5,14 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 import numpy as np
 
 from .base import Option
 
+Dividend = Tuple[float, float]
+"""离散现金分红：(除息时间（年）, 分红金额)"""
+
 
 class ExoticOption(Option, ABC):
     """
@@ -17,8 +20,23 @@ class ExoticOption(Option, ABC):
     
     继承自 Option，定义所有奇异期权的通用接口和抽象方法
     奇异期权通常具有路径依赖性，需要特殊的定价方法
+    
+    观察日程与分红日程:
+        observation_dates 为离散观察日（年），到期日 T 总是最后一个观察日；
+        为 None 时表示连续观察，由定价方法在其时间网格上近似。
+        dividends 为离散现金分红 (时间, 金额)，标的价格在除息时下跳分红金额。
+        MC 方法只模拟到这些日期，PDE 方法在这些日期施加跳跃条件
+    
+    路径约定:
+        payoff 接收形状为 (路径数, 观察日数) 的价格数组，最后一列为到期价格；
+        一维数组视为只有到期日一个观察日
     """
     
+    __slots__ = ("observation_dates", "dividends")
+    
+    pde_supported = True
+    """是否可以用一维 PDE 定价（依赖平均值或极值的期权需要额外状态变量，不支持）"""
+    
     def __init__(
         self,
         S: float,
@@ -27,6 +45,8 @@ class ExoticOption(Option, ABC):
         r: float,
         sigma: float,
         option_type: str,
+        observation_dates: Optional[Sequence[float]] = None,
+        dividends: Optional[Sequence[Dividend]] = None,
     ):
         """
         初始化奇异期权对象
@@ -38,8 +58,136 @@ class ExoticOption(Option, ABC):
             r: 无风险利率（年化）
             sigma: 波动率（年化）
             option_type: 期权类型，"call" 或 "put"
+            observation_dates: 离散观察日（年）；None 表示连续观察
+            dividends: 离散现金分红 (除息时间, 金额) 序列
+            
+        抛出:
+            ValueError: 如果日程无效
         """
         super().__init__(S, K, T, r, sigma, option_type)
+        self._set_fields(
+            observation_dates=self._validate_observation_dates(observation_dates, T),
+            dividends=self._validate_dividends(dividends, T),
+        )
+    
+    @staticmethod
+    def _validate_observation_dates(
+        observation_dates: Optional[Sequence[float]],
+        T: float,
+    ) -> Optional[Tuple[float, ...]]:
+        """
+        验证并规范化观察日程
+        
+        参数:
+            observation_dates: 观察日序列
+            T: 到期时间
+            
+        返回:
+            升序、去重且以 T 结尾的观察日元组；None 表示连续观察
+            
+        抛出:
+            ValueError: 如果观察日不在 (0, T] 内
+        """
+        if observation_dates is None:
+            return None
+        dates = sorted({float(t) for t in observation_dates} | {float(T)})
+        if dates[0] <= 0 or dates[-1] > T:
+            raise ValueError(f"观察日必须在 (0, T] 之内，当前值: {tuple(observation_dates)}")
+        return tuple(dates)
+    
+    @staticmethod
+    def _validate_dividends(
+        dividends: Optional[Sequence[Dividend]],
+        T: float,
+    ) -> Tuple[Dividend, ...]:
+        """
+        验证并规范化分红日程
+        
+        参数:
+            dividends: (除息时间, 金额) 序列
+            T: 到期时间
+            
+        返回:
+            按时间升序排列的分红元组（到期后的分红被忽略）
+            
+        抛出:
+            ValueError: 如果除息时间不为正或分红金额为负
+        """
+        result: List[Dividend] = []
+        for t, amount in dividends or ():
+            if t <= 0:
+                raise ValueError(f"除息时间必须大于 0，当前值: {t}")
+            if amount < 0:
+                raise ValueError(f"分红金额不能为负，当前值: {amount}")
+            if t < T:
+                result.append((float(t), float(amount)))
+        return tuple(sorted(result))
+    
+    @property
+    def is_discretely_monitored(self) -> bool:
+        """
+        判断是否为离散观察
+        
+        返回:
+            True 如果给出了观察日程
+        """
+        return self.observation_dates is not None
+    
+    @staticmethod
+    def _as_paths(S_T: np.ndarray) -> np.ndarray:
+        """
+        将输入规范化为 (路径数, 观察日数) 的二维数组
+        
+        参数:
+            S_T: 价格路径数组，或到期价格（标量/一维数组）
+            
+        返回:
+            二维价格数组
+        """
+        paths = np.asarray(S_T, dtype=float)
+        if paths.ndim < 2:
+            paths = paths.reshape(-1, 1)
+        return paths
+    
+    def jump_condition(self, S: np.ndarray, t: float, V: np.ndarray) -> np.ndarray:
+        """
+        观察日的跳跃条件（PDE 方法在观察日施加）
+        
+        默认不改变期权价值；敲出类期权在此将已触发区域的价值置零
+        
+        参数:
+            S: 标的资产价格数组（网格点）
+            t: 观察日
+            V: 观察日之后（时间上）的期权价值
+            
+        返回:
+            观察日之前的期权价值
+        """
+        return V
+    
+    def continuous_barrier(self) -> Optional[Tuple[float, str]]:
+        """
+        连续观察的障碍
+        
+        定价方法据此修正离散时间网格的障碍观察误差：MC 在相邻模拟时间点之间用布朗桥
+        计算未触及障碍的概率（payoff 需接受 survival 参数），PDE 把网格截断在障碍处
+        并取零边界（因此直接求解的分量必须是敲出类，在障碍处价值为零）
+        
+        返回:
+            (障碍价格, 方向 "up"/"down")；没有连续观察的障碍时返回 None
+        """
+        return None
+    
+    def pde_components(self) -> Optional[List[Tuple[float, "ExoticOption"]]]:
+        """
+        PDE 定价时的线性分解
+        
+        部分期权（如敲入期权）可以表示为若干可用 PDE 直接求解的期权的线性组合
+        
+        返回:
+            (权重, 期权) 列表；None 表示直接求解本期权
+        """
+        return None
     
     @abstractmethod
     def payoff(self, S_T: np.ndarray) -> np.ndarray:
@@ -0,0 +1,117 @@
+"""
+回望期权模块
+
+实现基于观察日最高/最低价格的回望期权（固定/浮动执行价）
+"""
+
+from typing import Literal, Optional, Sequence
+
+import numpy as np
+
+from .exotic import Dividend, ExoticOption
+
+
+class LookbackOption(ExoticOption):
+    """
+    回望期权
+    
+    固定执行价: 看涨 max(M - K, 0)，看跌 max(K - m, 0)；
+    浮动执行价: 看涨 S_T - m，看跌 M - S_T。
+    其中 M、m 分别为各观察日价格的最大值和最小值（不含定价日的现价）
+    """
+    
+    __slots__ = ("lookback_type",)
+    
+    pde_supported = False
+    
+    def __init__(
+        self,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        option_type: Literal["call", "put"] = "call",
+        lookback_type: Literal["fixed", "floating"] = "fixed",
+        observation_dates: Optional[Sequence[float]] = None,
+        dividends: Optional[Sequence[Dividend]] = None,
+    ):
+        """
+        初始化回望期权对象
+        
+        参数:
+            S: 标的资产当前价格
+            K: 执行价格（浮动执行价时不参与收益计算）
+            T: 到期时间（年）
+            r: 无风险利率（年化）
+            sigma: 波动率（年化）
+            option_type: 期权类型，"call" 或 "put"
+            lookback_type: 回望类型，"fixed"（固定执行价）或 "floating"（浮动执行价）
+            observation_dates: 观察日（年）；None 表示连续观察
+            dividends: 离散现金分红 (除息时间, 金额) 序列
+            
+        抛出:
+            ValueError: 如果参数无效
+        """
+        super().__init__(S, K, T, r, sigma, option_type, observation_dates, dividends)
+        if lookback_type not in ["fixed", "floating"]:
+            raise ValueError(f"回望类型必须是 'fixed' 或 'floating'，当前值: {lookback_type}")
+        self._set_fields(lookback_type=lookback_type)
+    
+    def payoff(self, S_T: np.ndarray) -> np.ndarray:
+        """
+        计算回望期权收益
+        
+        参数:
+            S_T: 观察日价格路径，形状为 (路径数, 观察日数)，最后一列为到期价格
+            
+        返回:
+            期权收益，形状为 (路径数,)
+        """
+        paths = self._as_paths(S_T)
+        if self.lookback_type == "fixed":
+            if self.is_call:
+                return np.maximum(paths.max(axis=1) - self.K, 0.0)
+            return np.maximum(self.K - paths.min(axis=1), 0.0)
+        if self.is_call:
+            return paths[:, -1] - paths.min(axis=1)
+        return paths.max(axis=1) - paths[:, -1]
+    
+    def payoff_gradient(self, S_T: np.ndarray) -> np.ndarray:
+        """
+        计算回望期权收益对各观察日价格的导数
+        
+        收益只通过极值所在的观察日和到期价格依赖路径
+        
+        参数:
+            S_T: 观察日价格路径，形状为 (路径数, 观察日数)
+            
+        返回:
+            导数，形状为 (路径数, 观察日数)
+        """
+        paths = self._as_paths(S_T)
+        rows = np.arange(paths.shape[0])
+        highest, lowest = paths.argmax(axis=1), paths.argmin(axis=1)
+        gradient = np.zeros_like(paths)
+        if self.lookback_type == "fixed":
+            if self.is_call:
+                gradient[rows, highest] = paths[rows, highest] > self.K
+            else:
+                gradient[rows, lowest] = -(paths[rows, lowest] < self.K).astype(float)
+            return gradient
+        if self.is_call:
+            gradient[:, -1] += 1.0
+            gradient[rows, lowest] -= 1.0
+        else:
+            gradient[rows, highest] += 1.0
+            gradient[:, -1] -= 1.0
+        return gradient
+    
+    def boundary_condition(self, S: np.ndarray, t: float) -> np.ndarray:
+        """
+        回望期权依赖路径极值，一维 PDE 无法表示
+        
+        抛出:
+            ValueError: 总是抛出
+        """
+        raise ValueError("回望期权依赖路径极值，不支持一维 PDE 定价")
@@ -0,0 +1,119 @@
+"""
+多资产期权基类模块
+
+定义挂钩多个标的资产的期权（篮子、价差、彩虹等）的抽象基类
+"""
+
+from abc import ABC, abstractmethod
+from typing import Literal, Sequence, Tuple
+
+import numpy as np
+
+from .base import Option
+
+
+class MultiAssetOption(Option, ABC):
+    """
+    多资产期权抽象基类
+    
+    继承自 Option，但 S 和 sigma 为与标的资产一一对应的元组。
+    payoff 接收形状为 (..., n_assets) 的到期价格数组
+    """
+    
+    __slots__ = ()
+    
+    def __init__(
+        self,
+        S: Sequence[float],
+        K: float,
+        T: float,
+        r: float,
+        sigma: Sequence[float],
+        option_type: Literal["call", "put"] = "call",
+    ):
+        """
+        初始化多资产期权对象
+        
+        参数:
+            S: 各标的资产当前价格
+            K: 执行价格（可以为 0，如交换期权）
+            T: 到期时间（年）
+            r: 无风险利率（年化）
+            sigma: 各标的资产波动率（年化）
+            option_type: 期权类型，"call" 或 "put"
+            
+        抛出:
+            ValueError: 如果参数无效
+        """
+        S = tuple(float(s) for s in S)
+        sigma = tuple(float(s) for s in sigma)
+        self._validate_multi_asset_params(S, K, T, sigma, option_type)
+        self._set_fields(S=S, K=K, T=T, r=r, sigma=sigma, option_type=option_type)
+    
+    @staticmethod
+    def _validate_multi_asset_params(
+        S: Tuple[float, ...],
+        K: float,
+        T: float,
+        sigma: Tuple[float, ...],
+        option_type: str,
+    ) -> None:
+        """
+        验证多资产参数有效性
+        
+        抛出:
+            ValueError: 如果参数无效
+        """
+        if not S:
+            raise ValueError("标的资产数量必须至少为 1")
+        if len(sigma) != len(S):
+            raise ValueError(f"波动率数量必须与标的资产数量一致，当前: {len(sigma)} != {len(S)}")
+        if min(S) <= 0:
+            raise ValueError(f"标的资产价格 S 必须大于 0，当前值: {S}")
+        if K < 0:
+            raise ValueError(f"执行价格 K 不能为负，当前值: {K}")
+        if T <= 0:
+            raise ValueError(f"到期时间 T 必须大于 0，当前值: {T}")
+        if min(sigma) <= 0:
+            raise ValueError(f"波动率 sigma 必须大于 0，当前值: {sigma}")
+        if option_type not in ["call", "put"]:
+            raise ValueError(f"期权类型必须是 'call' 或 'put'，当前值: {option_type}")
+    
+    @property
+    def n_assets(self) -> int:
+        """
+        标的资产数量
+        
+        返回:
+            标的资产个数
+        """
+        return len(self.S)
+    
+    @abstractmethod
+    def payoff(self, S_T: np.ndarray) -> np.ndarray:
+        """
+        计算多资产期权收益函数（抽象方法）
+        
+        参数:
+            S_T: 到期时各标的资产价格，形状为 (..., n_assets)
+            
+        返回:
+            期权收益，形状为 S_T.shape[:-1]
+        """
+        pass
+    
+    def __repr__(self) -> str:
+        """
+        返回多资产期权的字符串表示
+        
+        返回:
+            期权的描述字符串
+        """
+        spots = ", ".join(f"{s:.2f}" for s in self.S)
+        vols = ", ".join(f"{s:.4f}" for s in self.sigma)
+        return (
+            f"{self.__class__.__name__}("
+            f"S=({spots}), K={self.K:.2f}, T={self.T:.4f}, "
+            f"r={self.r:.4f}, sigma=({vols}), "
+            f"type={self.option_type})"
+        )
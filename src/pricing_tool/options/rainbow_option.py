@@ -0,0 +1,68 @@
+"""
+彩虹期权模块
+
+实现最优/最差资产期权（best-of / worst-of）
+"""
+
+from typing import Literal, Sequence
+
+import numpy as np
+
+from .multi_asset_option import MultiAssetOption
+
+
+class RainbowOption(MultiAssetOption):
+    """
+    彩虹期权
+    
+    收益基于标的资产中表现最好（best）或最差（worst）的到期价格 M：
+    看涨 max(M - K, 0)，看跌 max(K - M, 0)
+    """
+    
+    __slots__ = ("kind",)
+    
+    def __init__(
+        self,
+        S: Sequence[float],
+        K: float,
+        T: float,
+        r: float,
+        sigma: Sequence[float],
+        option_type: Literal["call", "put"] = "call",
+        kind: Literal["best", "worst"] = "best",
+    ):
+        """
+        初始化彩虹期权对象
+        
+        参数:
+            S: 各标的资产当前价格
+            K: 执行价格
+            T: 到期时间（年）
+            r: 无风险利率（年化）
+            sigma: 各标的资产波动率（年化）
+            option_type: 期权类型，"call" 或 "put"
+            kind: "best" 表示最优资产，"worst" 表示最差资产
+            
+        抛出:
+            ValueError: 如果参数无效
+        """
+        super().__init__(S, K, T, r, sigma, option_type)
+        if kind not in ["best", "worst"]:
+            raise ValueError(f"彩虹期权类型必须是 'best' 或 'worst'，当前值: {kind}")
+        self._set_fields(kind=kind)
+    
+    def payoff(self, S_T: np.ndarray) -> np.ndarray:
+        """
+        计算彩虹期权收益
+        
+        参数:
+            S_T: 到期时各标的资产价格，形状为 (..., n_assets)
+            
+        返回:
+            期权收益，形状为 S_T.shape[:-1]
+        """
+        S_T = np.asarray(S_T, dtype=float)
+        extreme = S_T.max(axis=-1) if self.kind == "best" else S_T.min(axis=-1)
+        if self.is_call:
+            return np.maximum(extreme - self.K, 0.0)
+        return np.maximum(self.K - extreme, 0.0)
@@ -1,9 +1,55 @@
 """
 定价方法模块
 
-包含所有定价方法的接口和实现
+包含所有定价方法的接口和实现（延迟加载，定价引擎及其 scipy 依赖在首次使用时导入）
 """
 
-from .base import PricingMethod, PricingResult
+from typing import TYPE_CHECKING
 
-__all__ = ["PricingMethod", "PricingResult"]
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "PricingMethod": ".base",
+        "PricingResult": ".base",
+        "AdjointResult": ".adjoint",
+        "PRICING_RESULT_DTYPE": ".records",
+        "pack_results": ".records",
+        "unpack_results": ".records",
+        "ResultWriter": ".result_io",
+        "ResultReader": ".result_io",
+        "ResultCache": ".result_cache",
+        "CachedPricing": ".result_cache",
+        "AnalyticPricing": ".analytic_pricing",
+        "AutoPricing": ".auto_pricing",
+        "AutoPricingResult": ".auto_pricing",
+        "PDEPricing": ".pde_pricing",
+        "ADIPricing": ".adi_pricing",
+        "FourierPricing": ".fourier_pricing",
+        "ComputationCache": ".computation_cache",
+        "PDEOperatorCache": ".pde_cache",
+        "MCPricing": ".mc_pricing",
+        "MultiAssetMCPricing": ".multi_asset_mc_pricing",
+        "PortfolioPlanner": ".portfolio",
+        "PortfolioPlan": ".portfolio",
+        "PortfolioResult": ".portfolio",
+    },
+)
+
+if TYPE_CHECKING:  # pragma: no cover - 仅供类型检查器使用
+    from .adi_pricing import ADIPricing
+    from .adjoint import AdjointResult
+    from .analytic_pricing import AnalyticPricing
+    from .auto_pricing import AutoPricing, AutoPricingResult
+    from .base import PricingMethod, PricingResult
+    from .computation_cache import ComputationCache
+    from .fourier_pricing import FourierPricing
+    from .mc_pricing import MCPricing
+    from .multi_asset_mc_pricing import MultiAssetMCPricing
+    from .pde_cache import PDEOperatorCache
+    from .pde_pricing import PDEPricing
+    from .portfolio import PortfolioPlan, PortfolioPlanner, PortfolioResult
+    from .records import PRICING_RESULT_DTYPE, pack_results, unpack_results
+    from .result_cache import CachedPricing, ResultCache
+    from .result_io import ResultReader, ResultWriter
@@ -0,0 +1,576 @@
+"""
+ADI 定价模块
+
+使用交替方向隐式（ADI）格式求解 Heston 模型的二维定价偏微分方程
+
+在 (x = ln(S / S0), v) 网格上，算子分裂为 A = A0 + A1 + A2：
+A0 为混合导数项 rho xi v u_xv（显式处理），A1 为 x 方向项
+v/2 u_xx + (r - v/2) u_x - r/2 u，A2 为 v 方向项
+xi^2 v/2 u_vv + kappa (theta - v) u_v - r/2 u。
+每个隐式子步只沿一个方向求解三对角系统：
+
+- A1 在不同 v 行上系数不同，各行按 v 主序拼接为一个长三对角矩阵（行间耦合为零），
+  一次分解、一次回代解完所有 v 行
+- A2 的系数只依赖 v，所有 x 列（以及所有合约）共用一个三对角分解，作为多个右端项一次回代
+
+分解结果只依赖 (模型, r, 网格规格, dt)，缓存在 PDEOperatorCache 中，与现价和执行价无关
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.heston import HestonModel
+from ..options.base import Option
+from ..options.exotic import ExoticOption
+from ..utils.market_data import MarketData
+from .base import PricingMethod, PricingResult, pair_market_data
+from .computation_cache import ComputationCache
+from .pde_cache import PDEOperatorCache
+
+SCHEMES = {
+    # Hundsdorfer-Verwer: theta = 1/2 + sqrt(3)/6，二阶且对混合导数项无条件稳定
+    "hv": 0.5 + np.sqrt(3.0) / 6.0,
+    # 修正 Craig-Sneyd（MCS）: theta = 1/3
+    "cs": 1.0 / 3.0,
+}
+"""支持的 ADI 格式及其 theta 参数"""
+
+
+def _nonuniform_weights(grid: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    计算非均匀网格内部节点的中心差分权重
+
+    参数:
+        grid: 严格递增的网格节点
+
+    返回:
+        (一阶导数的 u_{i-1}, u_i, u_{i+1} 权重, 二阶导数的 u_{i-1}, u_i, u_{i+1} 权重)，
+        每个数组长度为 len(grid) - 2
+    """
+    h_low = grid[1:-1] - grid[:-2]
+    h_high = grid[2:] - grid[1:-1]
+    total = h_low + h_high
+    first = (
+        -h_high / (h_low * total),
+        (h_high - h_low) / (h_low * h_high),
+        h_low / (h_high * total),
+    )
+    second = (2.0 / (h_low * total), -2.0 / (h_low * h_high), 2.0 / (h_high * total))
+    return first + second
+
+
+def _apply_tridiagonal(
+    lower: np.ndarray,
+    main: np.ndarray,
+    upper: np.ndarray,
+    U: np.ndarray,
+    axis: int,
+) -> np.ndarray:
+    """
+    沿指定轴计算三对角算子与 U 的乘积
+
+    参数:
+        lower: 次对角系数（与 u_{k-1} 相乘，按行存储，首行不使用）
+        main: 主对角系数
+        upper: 超对角系数（与 u_{k+1} 相乘，末行不使用）
+        U: 解数组，形状为 (n_v + 1, n_x + 1, 合约数)
+        axis: 0 为 v 方向，1 为 x 方向
+
+    返回:
+        与 U 同形状的数组
+    """
+    out = main * U
+    if axis == 0:
+        out[1:] += lower[1:] * U[:-1]
+        out[:-1] += upper[:-1] * U[1:]
+    else:
+        out[:, 1:] += lower[:, 1:] * U[:, :-1]
+        out[:, :-1] += upper[:, :-1] * U[:, 1:]
+    return out
+
+
+class _ADIOperators:
+    """
+    Heston ADI 的离散算子及各方向隐式子步的三对角分解
+
+    bands 保存 A1、A2 的系数（用于显式部分），factors 按隐式权重 w = theta * dt 保存
+    (I - w A1)（长三对角）和 (I - w A2) 的 LAPACK gttrf 分解
+    """
+
+    __slots__ = ("a1", "a2", "mixed", "factors")
+
+    def __init__(
+        self,
+        a1: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        a2: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        mixed: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        factors: Dict[float, Tuple[Tuple[Any, ...], Tuple[Any, ...]]],
+    ):
+        self.a1 = a1
+        self.a2 = a2
+        self.mixed = mixed
+        self.factors = factors
+
+    def apply(self, U: np.ndarray, dx: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        计算 (A0 U, A1 U, A2 U)
+
+        参数:
+            U: 解数组，形状为 (n_v + 1, n_x + 1, 合约数)
+            dx: 对数价格步长
+
+        返回:
+            三个方向算子作用后的数组
+        """
+        a1 = _apply_tridiagonal(*self.a1, U, axis=1)
+        a2 = _apply_tridiagonal(*self.a2, U, axis=0)
+        coefficient, w_low, w_mid, w_high = self.mixed
+        U_x = (U[:, 2:] - U[:, :-2]) / (2.0 * dx)
+        a0 = np.zeros_like(U)
+        a0[1:-1, 1:-1] = coefficient * (w_low * U_x[:-2] + w_mid * U_x[1:-1] + w_high * U_x[2:])
+        return a0, a1, a2
+
+    def solve(self, rhs: np.ndarray, weight: float, axis: int) -> np.ndarray:
+        """
+        求解 (I - weight A_j) Y = rhs
+
+        参数:
+            rhs: 右端项，形状为 (n_v + 1, n_x + 1, 合约数)
+            weight: 隐式权重 theta * dt
+            axis: 0 为 v 方向（A2），1 为 x 方向（A1）
+
+        返回:
+            与 rhs 同形状的解
+        """
+        from scipy.linalg.lapack import dgttrs
+
+        shape = rhs.shape
+        factors = self.factors[weight][0 if axis == 1 else 1]
+        if axis == 1:
+            flat = rhs.reshape(shape[0] * shape[1], shape[2])
+        else:
+            flat = rhs.reshape(shape[0], shape[1] * shape[2])
+        solution, info = dgttrs(*factors, flat)
+        if info != 0:
+            raise RuntimeError(f"三对角回代失败，LAPACK info = {info}")
+        return solution.reshape(shape)
+
+
+def _factorize(lower: np.ndarray, main: np.ndarray, upper: np.ndarray, weight: float) -> Tuple:
+    """
+    分解 I - weight * A（A 以按行存储的三对角系数给出）
+
+    参数:
+        lower: 次对角系数（按行存储，首元素不使用）
+        main: 主对角系数
+        upper: 超对角系数（按行存储，末元素不使用）
+        weight: 隐式权重
+
+    返回:
+        LAPACK gttrf 的分解结果
+
+    抛出:
+        RuntimeError: 如果分解失败
+    """
+    from scipy.linalg.lapack import dgttrf
+
+    *factors, info = dgttrf(-weight * lower[1:], 1.0 - weight * main, -weight * upper[:-1])
+    if info != 0:
+        raise RuntimeError(f"三对角分解失败，LAPACK info = {info}")
+    return tuple(factors)
+
+
+def _build_adi_operators(
+    model: HestonModel,
+    r: float,
+    n_x: int,
+    dx: float,
+    v: np.ndarray,
+    weights: Sequence[float],
+) -> _ADIOperators:
+    """
+    组装 Heston 算子并按给定的隐式权重做分解
+
+    参数:
+        model: Heston 模型
+        r: 无风险利率
+        n_x: x 方向网格区间数
+        dx: 对数价格步长
+        v: 方差网格节点（非均匀，v[0] = 0）
+        weights: 需要分解的隐式权重 theta * dt
+
+    返回:
+        _ADIOperators 对象
+    """
+    n_v = v.size - 1
+    d1_low, d1_mid, d1_high, d2_low, d2_mid, d2_high = _nonuniform_weights(v)
+
+    # A1: x 方向，系数随 v 行变化，形状为 (n_v + 1, n_x + 1, 1)
+    V = v[:, np.newaxis]
+    a = 0.5 * V / dx**2
+    b = (r - 0.5 * V) / (2.0 * dx)
+    lower1 = np.broadcast_to(a - b, (n_v + 1, n_x + 1)).copy()
+    main1 = np.broadcast_to(-2.0 * a - 0.5 * r, (n_v + 1, n_x + 1)).copy()
+    upper1 = np.broadcast_to(a + b, (n_v + 1, n_x + 1)).copy()
+    # x 边界：V_SS = 0，即 v/2 (u_xx - u_x) = 0，只剩 r u_x（单侧差分）
+    lower1[:, 0], main1[:, 0], upper1[:, 0] = 0.0, -r / dx - 0.5 * r, r / dx
+    lower1[:, -1], main1[:, -1], upper1[:, -1] = -r / dx, r / dx - 0.5 * r, 0.0
+
+    # A2: v 方向，系数只依赖 v
+    drift = model.kappa * (model.theta - v)
+    diffusion = 0.5 * model.xi**2 * v
+    lower2 = np.zeros(n_v + 1)
+    main2 = np.full(n_v + 1, -0.5 * r)
+    upper2 = np.zeros(n_v + 1)
+    lower2[1:-1] = drift[1:-1] * d1_low + diffusion[1:-1] * d2_low
+    main2[1:-1] += drift[1:-1] * d1_mid + diffusion[1:-1] * d2_mid
+    upper2[1:-1] = drift[1:-1] * d1_high + diffusion[1:-1] * d2_high
+    # v = 0：扩散项消失，只剩 kappa theta u_v（前向差分，流入边界无需边界条件）
+    h0 = v[1] - v[0]
+    main2[0] += -drift[0] / h0
+    upper2[0] = drift[0] / h0
+    # v = v_max：u_v = 0（镜像虚拟点）
+    h_top = v[-1] - v[-2]
+    lower2[-1] = 2.0 * diffusion[-1] / h_top**2
+    main2[-1] += -2.0 * diffusion[-1] / h_top**2
+
+    mixed = (
+        (model.rho * model.xi * v[1:-1])[:, np.newaxis, np.newaxis],
+        d1_low[:, np.newaxis, np.newaxis],
+        d1_mid[:, np.newaxis, np.newaxis],
+        d1_high[:, np.newaxis, np.newaxis],
+    )
+    factors = {
+        weight: (
+            _factorize(lower1.ravel(), main1.ravel(), _line_upper(upper1), weight),
+            _factorize(lower2, main2, upper2, weight),
+        )
+        for weight in weights
+    }
+    return _ADIOperators(
+        a1=(
+            lower1[:, :, np.newaxis],
+            main1[:, :, np.newaxis],
+            upper1[:, :, np.newaxis],
+        ),
+        a2=(
+            lower2[:, np.newaxis, np.newaxis],
+            main2[:, np.newaxis, np.newaxis],
+            upper2[:, np.newaxis, np.newaxis],
+        ),
+        mixed=mixed,
+        factors=factors,
+    )
+
+
+def _line_upper(upper: np.ndarray) -> np.ndarray:
+    """把按行的超对角系数拼接为长三对角的超对角（末列与下一行首列之间不耦合）"""
+    flat = upper.copy()
+    flat[:, -1] = 0.0
+    return flat.ravel()
+
+
+class ADIPricing(PricingMethod):
+    """
+    Heston 模型的 ADI 有限差分定价方法
+
+    x 方向为均匀对数价格网格（现价位于中心节点），v 方向为在 0 附近加密的
+    sinh 非均匀网格，并把最近的节点移动到 v0 上，使价格无需在 v 方向插值。
+    时间方向使用 Hundsdorfer-Verwer 或修正 Craig-Sneyd 格式，前两个半步使用
+    theta = 1 的 Douglas 格式（隐式阻尼）以抑制非光滑收益带来的振荡
+
+    Delta、Gamma 由网格差分得到，Theta 由最后一个时间步得到，
+    Vega 为对初始波动率 sqrt(v0) 的网格导数，Rho 通过扰动利率重新求解
+
+    仅支持收益只依赖到期价格的普通期权
+    """
+
+    def __init__(
+        self,
+        model: HestonModel,
+        n_x: int = 100,
+        n_v: int = 50,
+        n_time: int = 50,
+        scheme: str = "hv",
+        n_std: float = 5.0,
+        v_max: Optional[float] = None,
+        damping: bool = True,
+        compute_greeks: bool = True,
+        rho_bump: float = 1e-4,
+        cache: Optional[ComputationCache] = None,
+    ):
+        """
+        初始化 ADI 定价方法
+
+        参数:
+            model: Heston 模型
+            n_x: x 方向网格区间数（必须为偶数，使现价落在网格中心节点）
+            n_v: v 方向网格区间数
+            n_time: 时间步数
+            scheme: ADI 格式，"hv"（Hundsdorfer-Verwer）或 "cs"（修正 Craig-Sneyd）
+            n_std: x 方向网格半宽，以 sqrt(max(v0, theta) * T) 的倍数表示
+            v_max: 方差网格上限；None 时取 max(1, 10 * max(v0, theta))
+            damping: 是否用两个隐式半步启动
+            compute_greeks: 是否计算 Greeks
+            rho_bump: Rho 的绝对利率扰动（中心差分）
+            cache: 算子缓存；None 时为本实例创建一个新缓存
+
+        抛出:
+            ValueError: 如果参数无效
+        """
+        if not isinstance(model, HestonModel):
+            raise ValueError(f"ADIPricing 需要 HestonModel，当前: {type(model).__name__}")
+        if n_x < 4 or n_x % 2:
+            raise ValueError(f"网格数 n_x 必须是不小于 4 的偶数，当前值: {n_x}")
+        if n_v < 4:
+            raise ValueError(f"网格数 n_v 必须不小于 4，当前值: {n_v}")
+        if n_time < 2:
+            raise ValueError(f"时间步数 n_time 必须不小于 2，当前值: {n_time}")
+        if scheme not in SCHEMES:
+            raise ValueError(f"不支持的 ADI 格式: {scheme}，可选值: {tuple(SCHEMES)}")
+        self.model = model
+        self.n_x = n_x
+        self.n_v = n_v
+        self.n_time = n_time
+        self.scheme = scheme
+        self.n_std = n_std
+        self.v_max = v_max
+        self.damping = damping
+        self.compute_greeks = compute_greeks
+        self.rho_bump = rho_bump
+        self.cache = cache if cache is not None else PDEOperatorCache()
+
+    def price(
+        self,
+        option: Option,
+        market_data: MarketData,
+    ) -> PricingResult:
+        """
+        计算期权价格和 Greeks
+
+        参数:
+            option: 期权对象实例（收益只依赖到期价格）
+            market_data: 市场数据对象（sigma 不使用，波动率由模型给出）
+
+        返回:
+            PricingResult 对象
+        """
+        return self.price_batch([option], market_data)[0]
+
+    def price_batch(
+        self,
+        options: Sequence[Option],
+        market_data: Union[MarketData, Sequence[MarketData]],
+    ) -> List[PricingResult]:
+        """
+        批量计算期权价格和 Greeks
+
+        共享 (r, T) 的合约共用网格和分解结果，作为多个右端项一起求解
+
+        参数:
+            options: 期权对象序列
+            market_data: 共用的市场数据，或与 options 一一对应的市场数据序列
+
+        返回:
+            与 options 顺序一致的 PricingResult 列表，elapsed 为组内平均耗时
+
+        抛出:
+            ValueError: 如果包含奇异期权
+        """
+        pairs = pair_market_data(options, market_data)
+        groups: Dict[Tuple[float, float], List[int]] = {}
+        for index, (option, data) in enumerate(pairs):
+            if isinstance(option, ExoticOption):
+                raise ValueError(f"ADIPricing 不支持奇异期权: {type(option).__name__}")
+            groups.setdefault(self.batch_key(option, data), []).append(index)
+
+        results: List[Optional[PricingResult]] = [None] * len(pairs)
+        for (r, T), indices in groups.items():
+            start = time.perf_counter()
+            group_options = [pairs[i][0] for i in indices]
+            spots = np.array([pairs[i][1].S for i in indices])
+            group_results = self._price_group(group_options, spots, r, T)
+            elapsed = (time.perf_counter() - start) / len(indices)
+            for i, result in zip(indices, group_results):
+                results[i] = PricingResult(**result, elapsed=elapsed)
+        return results  # type: ignore[return-value]
+
+    def batch_key(self, option: Option, market_data: MarketData) -> Tuple[float, float]:
+        """
+        返回合约在 price_batch 中的分组键
+
+        参数:
+            option: 期权对象
+            market_data: 市场数据对象
+
+        返回:
+            (r, T)，同组合约共用网格和分解结果
+        """
+        return (market_data.r, option.T)
+
+    def _grid(self, T: float) -> Tuple[np.ndarray, float, np.ndarray, int]:
+        """
+        构建 (x, v) 网格
+
+        参数:
+            T: 到期时间
+
+        返回:
+            (相对对数价格节点 x, dx, 方差节点 v, v0 所在的下标)
+        """
+        model = self.model
+        half_width = self.n_std * model.volatility_scale * np.sqrt(T)
+        x = np.linspace(-half_width, half_width, self.n_x + 1)
+
+        v_max = self.v_max
+        if v_max is None:
+            v_max = max(1.0, 10.0 * max(model.v0, model.theta))
+        # sinh 网格在 v = 0 附近加密（间距约为 v_max / 500 量级）
+        d = v_max / 500.0
+        v = d * np.sinh(np.linspace(0.0, np.arcsinh(v_max / d), self.n_v + 1))
+        # 把最近的内部节点移动到 v0 上（位移小于半个间距，网格保持单调）
+        k = int(np.clip(np.argmin(np.abs(v - model.v0)), 1, self.n_v - 1))
+        v[k] = model.v0
+        return x, x[1] - x[0], v, k
+
+    def _operators(self, r: float, dx: float, v: np.ndarray, dt: float) -> _ADIOperators:
+        """从缓存获取算子，未命中时组装并分解"""
+        theta = SCHEMES[self.scheme]
+        weights = (theta * dt, 0.5 * dt) if self.damping else (theta * dt,)
+        key = ("heston-adi", self.model, r, self.n_x, dx, tuple(v), dt, self.scheme)
+        return self.cache.get_or_build(
+            key, lambda: _build_adi_operators(self.model, r, self.n_x, dx, v, weights)
+        )
+
+    def _solve(
+        self,
+        options: Sequence[Option],
+        S_grid: np.ndarray,
+        r: float,
+        T: float,
+        dx: float,
+        v: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        从到期日向后求解到当前时刻
+
+        参数:
+            options: 同组期权
+            S_grid: x 方向价格网格，形状为 (n_x + 1, 合约数)
+            r: 无风险利率
+            T: 到期时间
+            dx: 对数价格步长
+            v: 方差网格节点
+
+        返回:
+            (当前时刻的解, 前一个时间层的解, 最后一步的步长)，
+            解的形状为 (n_v + 1, n_x + 1, 合约数)
+        """
+        dt = T / self.n_time
+        operators = self._operators(r, dx, v, dt)
+        theta = SCHEMES[self.scheme]
+        weight = theta * dt
+        payoff = np.column_stack([option.payoff(S_grid[:, j]) for j, option in enumerate(options)])
+        U = np.repeat(payoff[np.newaxis, :, :].astype(float), v.size, axis=0)
+
+        def douglas(U: np.ndarray, step: float) -> np.ndarray:
+            # theta = 1 的 Douglas 格式：(I - step A_j) Y_j = Y_{j-1} - step A_j U
+            a0, a1, a2 = operators.apply(U, dx)
+            Y = U + step * (a0 + a1 + a2)
+            Y = operators.solve(Y - step * a1, step, axis=1)
+            return operators.solve(Y - step * a2, step, axis=0)
+
+        def adi_step(U: np.ndarray) -> np.ndarray:
+            a0, a1, a2 = operators.apply(U, dx)
+            F0 = a0 + a1 + a2
+            Y0 = U + dt * F0
+            Y = operators.solve(Y0 - weight * a1, weight, axis=1)
+            Y = operators.solve(Y - weight * a2, weight, axis=0)
+            b0, b1, b2 = operators.apply(Y, dx)
+            if self.scheme == "hv":
+                Y = Y0 + 0.5 * dt * (b0 + b1 + b2 - F0)
+                Y = operators.solve(Y - weight * b1, weight, axis=1)
+                return operators.solve(Y - weight * b2, weight, axis=0)
+            # 修正 Craig-Sneyd
+            Y = Y0 + theta * dt * (b0 - a0) + (0.5 - theta) * dt * (b0 + b1 + b2 - F0)
+            Y = operators.solve(Y - weight * a1, weight, axis=1)
+            return operators.solve(Y - weight * a2, weight, axis=0)
+
+        previous, last_dt = U, dt
+        first = 0
+        if self.damping:
+            for _ in range(2):
+                previous, last_dt = U, 0.5 * dt
+                U = douglas(U, 0.5 * dt)
+            first = 1
+        for _ in range(first, self.n_time):
+            previous, last_dt = U, dt
+            U = adi_step(U)
+        return U, previous, last_dt
+
+    def _price_group(
+        self,
+        options: Sequence[Option],
+        spots: np.ndarray,
+        r: float,
+        T: float,
+    ) -> List[Dict[str, float]]:
+        """
+        求解一组共享网格的合约
+
+        参数:
+            options: 同组期权
+            spots: 各合约的现价
+            r: 无风险利率
+            T: 到期时间
+
+        返回:
+            每个合约的 PricingResult 字段字典
+        """
+        x, dx, v, k = self._grid(T)
+        S_grid = spots[np.newaxis, :] * np.exp(x)[:, np.newaxis]
+        U, previous, dt = self._solve(options, S_grid, r, T, dx, v)
+        c = self.n_x // 2
+        prices = U[k, c]
+        if not self.compute_greeks:
+            return [{"price": float(p)} for p in prices]
+
+        V_x = (U[k, c + 1] - U[k, c - 1]) / (2.0 * dx)
+        V_xx = (U[k, c + 1] - 2.0 * U[k, c] + U[k, c - 1]) / dx**2
+        delta = V_x / spots
+        gamma = (V_xx - V_x) / spots**2
+        theta = -(U[k, c] - previous[k, c]) / dt
+        w_low, w_mid, w_high = (w[k - 1] for w in _nonuniform_weights(v)[:3])
+        V_v = w_low * U[k - 1, c] + w_mid * U[k, c] + w_high * U[k + 1, c]
+        # dV/d(sqrt(v0)) = dV/dv0 * 2 sqrt(v0)
+        vega = V_v * 2.0 * np.sqrt(self.model.v0)
+
+        up = self._solve(options, S_grid, r + self.rho_bump, T, dx, v)[0]
+        down = self._solve(options, S_grid, r - self.rho_bump, T, dx, v)[0]
+        rho = (up[k, c] - down[k, c]) / (2.0 * self.rho_bump)
+
+        return [
+            {
+                "price": float(prices[j]),
+                "delta": float(delta[j]),
+                "gamma": float(gamma[j]),
+                "theta": float(theta[j]),
+                "vega": float(vega[j]),
+                "rho": float(rho[j]),
+            }
+            for j in range(len(options))
+        ]
+
+    def __repr__(self) -> str:
+        """
+        返回定价方法的字符串表示
+
+        返回:
+            定价方法的描述字符串
+        """
+        return (
+            f"ADIPricing(model={self.model!r}, n_x={self.n_x}, n_v={self.n_v}, "
+            f"n_time={self.n_time}, scheme={self.scheme!r})"
+        )
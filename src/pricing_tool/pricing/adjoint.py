@@ -0,0 +1,59 @@
+"""
+伴随法敏感度模块
+
+定义伴随（反向模式）Greeks 的结果类型和公共内核的伴随。
+
+伴随法把定价看作从参数到价格的一串运算，再沿相反方向传播价格对中间量的导数：
+- 前向一次定价
+- 反向一次扫描
+
+这样就得到价格对所有输入的导数，包括局部波动率网格上每个节点的分桶 Vega。
+计算量约为一次定价的常数倍，与敏感度个数无关
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .._slots import slotted
+from .base import PricingResult
+
+GREEK_METHODS = ("bump", "adjoint")
+"""Greeks 计算方式：扰动重定价（bump）或伴随法（adjoint）"""
+
+
+@slotted
+@dataclass(frozen=True, eq=False)
+class AdjointResult:
+    """
+    伴随法定价结果
+
+    result 中的 vega 为价格对模型波动率参数的导数；
+    几何布朗运动为 dV/dsigma，局部波动率为整个网格平移的导数（分桶 Vega 之和）。
+    含数组字段，按对象身份比较
+    """
+
+    result: PricingResult
+    """价格和 Greeks"""
+
+    model_gradient: np.ndarray
+    """价格对模型参数的梯度：几何布朗运动为 (dV/dsigma,)，局部波动率为与 local_vols 同形状的分桶 Vega"""
+
+
+def interp_adjoint(x: np.ndarray, xp: np.ndarray, bar_y: np.ndarray) -> np.ndarray:
+    """
+    np.interp(x, xp, fp) 对 fp 的伴随
+
+    参数:
+        x: 插值点
+        xp: 节点（升序）
+        bar_y: 目标函数对插值结果的伴随，与 x 同形状
+
+    返回:
+        对 fp 的伴随，与 xp 同形状（超出节点范围的点全部归到端点）
+    """
+    j = np.clip(np.searchsorted(xp, x), 1, xp.size - 1)
+    lam = np.clip((x - xp[j - 1]) / (xp[j] - xp[j - 1]), 0.0, 1.0)
+    return np.bincount(j - 1, weights=bar_y * (1.0 - lam), minlength=xp.size) + np.bincount(
+        j, weights=bar_y * lam, minlength=xp.size
+    )
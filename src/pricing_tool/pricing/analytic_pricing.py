@@ -0,0 +1,91 @@
+"""
+解析定价模块
+
+几何布朗运动下欧式期权的 Black-Scholes 闭式解（价格和全部 Greeks）
+"""
+
+import time
+from typing import Optional
+
+import numpy as np
+
+from ..models.base import Model
+from ..models.gbm import GBMModel
+from ..options.base import Option
+from ..options.exotic import ExoticOption
+from ..utils.market_data import MarketData
+from .base import PricingMethod, PricingResult
+
+
+class AnalyticPricing(PricingMethod):
+    """
+    Black-Scholes 解析定价方法
+
+    只适用于几何布朗运动下的欧式期权；没有离散化误差，
+    可作为其他数值方法的基准
+    """
+
+    def __init__(self, model: Optional[Model] = None):
+        """
+        初始化解析定价方法
+
+        参数:
+            model: GBMModel；None 时使用 MarketData.sigma
+
+        抛出:
+            ValueError: 如果模型不是几何布朗运动
+        """
+        if model is not None and not isinstance(model, GBMModel):
+            raise ValueError(f"AnalyticPricing 只支持几何布朗运动，当前模型: {type(model).__name__}")
+        self.model = model
+
+    def price(
+        self,
+        option: Option,
+        market_data: MarketData,
+    ) -> PricingResult:
+        """
+        计算期权价格和 Greeks
+
+        参数:
+            option: 欧式期权对象
+            market_data: 市场数据对象
+
+        返回:
+            PricingResult 对象
+
+        抛出:
+            ValueError: 如果是奇异期权
+        """
+        from scipy.special import ndtr
+
+        if isinstance(option, ExoticOption):
+            raise ValueError(f"AnalyticPricing 不支持奇异期权: {type(option).__name__}")
+        start = time.perf_counter()
+        sigma = self.model.sigma if self.model is not None else market_data.sigma
+        S, K, T, r = market_data.S, option.K, option.T, market_data.r
+        sqrt_T = np.sqrt(T)
+        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+        discounted_strike = K * np.exp(-r * T)
+        density = np.exp(-0.5 * d1**2) / np.sqrt(2.0 * np.pi)
+        sign = 1.0 if option.is_call else -1.0
+        N1, N2 = ndtr(sign * d1), ndtr(sign * d2)
+        return PricingResult(
+            price=float(sign * (S * N1 - discounted_strike * N2)),
+            delta=float(sign * N1),
+            gamma=float(density / (S * sigma * sqrt_T)),
+            theta=float(-S * density * sigma / (2.0 * sqrt_T) - sign * r * discounted_strike * N2),
+            vega=float(S * density * sqrt_T),
+            rho=float(sign * T * discounted_strike * N2),
+            elapsed=time.perf_counter() - start,
+        )
+
+    def __repr__(self) -> str:
+        """
+        返回定价方法的字符串表示
+
+        返回:
+            定价方法的描述字符串
+        """
+        return f"AnalyticPricing(model={self.model!r})"
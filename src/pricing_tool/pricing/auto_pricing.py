@@ -0,0 +1,462 @@
+"""
+误差预算定价模块
+
+按期权类别和模型选择定价引擎，并逐级加密网格或增加路径数，
+直到误差估计达到目标精度或耗尽时间预算
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .._slots import slotted
+from ..models.base import Model
+from ..models.gbm import GBMModel
+from ..models.local_vol import LocalVolModel
+from ..options.base import Option
+from ..options.exotic import ExoticOption
+from ..options.multi_asset_option import MultiAssetOption
+from ..utils.market_data import MarketData
+from .analytic_pricing import AnalyticPricing
+from .base import PricingMethod, PricingResult
+from .computation_cache import ComputationCache
+from .fourier_pricing import FourierPricing
+from .mc_pricing import MCPricing
+from .pde_pricing import PDEPricing
+
+METHODS = ("analytic", "fourier", "pde", "mc")
+"""按单位精度成本从低到高排列的候选引擎"""
+
+ORDER_AGREEMENT = 0.25
+"""相邻两次观察到的 PDE 收敛阶之差不超过此值时才采信该收敛阶"""
+
+GREEKS_COST_FACTOR = {"fourier": 2.0, "pde": 4.0, "mc": 7.0}
+"""尚未测得带 Greeks 定价的耗时时，假定其单位工作量耗时为只求价格的倍数
+（PDE 伴随扫描实测约 2-4 倍，MC 扰动法 Greeks 需 7 次模拟）"""
+
+
+@slotted
+@dataclass(frozen=True)
+class AutoPricingResult(PricingResult):
+    """
+    误差预算定价结果
+
+    在 PricingResult 基础上记录所选引擎、分辨率和误差估计
+    """
+    method: str = ""
+    """所选引擎（METHODS 之一）"""
+
+    resolution: Optional[int] = None
+    """最终分辨率：Fourier 为展开项数，PDE 为空间网格数（时间步数相同），MC 为路径数"""
+
+    error_estimate: Optional[float] = None
+    """价格绝对误差估计"""
+
+    converged: bool = True
+    """误差估计是否达到目标精度"""
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        将定价结果转换为字典
+
+        返回:
+            包含所有字段的字典
+        """
+        values: Dict[str, object] = dict(PricingResult.to_dict(self))
+        values.update(
+            method=self.method,
+            resolution=self.resolution,
+            error_estimate=self.error_estimate,
+            converged=self.converged,
+        )
+        return values
+
+    def __repr__(self) -> str:
+        """
+        返回定价结果的字符串表示
+
+        返回:
+            格式化的字符串
+        """
+        parts = [PricingResult.__repr__(self)[len("PricingResult("):-1], f"method={self.method}"]
+        if self.resolution is not None:
+            parts.append(f"resolution={self.resolution}")
+        if self.error_estimate is not None:
+            parts.append(f"error_estimate={self.error_estimate:.2e}")
+        parts.append(f"converged={self.converged}")
+        return f"AutoPricingResult({', '.join(parts)})"
+
+
+class AutoPricing(PricingMethod):
+    """
+    误差预算定价方法
+
+    引擎选择（取第一个适用者）：
+    - 几何布朗运动下的欧式期权：Black-Scholes 解析解（误差为 0）
+    - 有解析特征函数的模型下的欧式期权：COS 方法，展开项数逐级翻倍，
+      误差估计为相邻两级价格之差（指数收敛，估计偏保守）
+    - 一维模型下支持 PDE 的期权：Crank-Nicolson，空间网格数和时间步数同时翻倍，
+      按最坏情形的 1/2 阶做 Richardson 误差估计，光滑合约在相邻两次观察到的收敛阶
+      一致后改用观察到的收敛阶
+    - 其余单资产期权：蒙特卡洛，先用试点路径估计方差，按 n = n0 (s0 / tol)^2
+      确定路径数，误差估计为标准误（不含时间离散偏差）
+
+    每个引擎的单位工作量耗时（Fourier 每项、PDE 每个网格点、MC 每条路径）
+    在实例上按指数滑动平均记录（带 Greeks 的最终定价单独记录），用于预测下一级加密
+    连同最终 Greeks 定价的耗时：预测会超出 time_budget 时停止加密，
+    返回当前最优结果并标记未收敛
+    """
+
+    _runtime_attributes = ("cache", "costs")
+
+    def __init__(
+        self,
+        tolerance: Optional[float] = 1e-3,
+        time_budget: Optional[float] = None,
+        model: Optional[Model] = None,
+        seed: Optional[int] = None,
+        compute_greeks: bool = True,
+        max_refinements: int = 8,
+        pilot_paths: int = 10_000,
+        max_paths: int = 10_000_000,
+    ):
+        """
+        初始化误差预算定价方法
+
+        参数:
+            tolerance: 目标价格绝对误差；None 时在时间预算内尽量加密
+            time_budget: 时间预算（秒）；None 时不限时
+            model: 标的动态模型；None 时使用 MarketData.sigma 的几何布朗运动
+            seed: 蒙特卡洛随机数种子
+            compute_greeks: 是否计算 Greeks（加密过程只求价格，Greeks 只在最终分辨率上
+                计算一次：PDE 使用伴随法，蒙特卡洛在收益可微时使用伴随法）
+            max_refinements: 网格方法的最大加密次数
+            pilot_paths: 蒙特卡洛试点路径数（偶数）
+            max_paths: 蒙特卡洛最大路径数
+
+        抛出:
+            ValueError: 如果参数无效
+        """
+        if tolerance is None and time_budget is None:
+            raise ValueError("tolerance 和 time_budget 至少需要指定一个")
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError(f"目标精度 tolerance 必须大于 0，当前值: {tolerance}")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError(f"时间预算 time_budget 必须大于 0，当前值: {time_budget}")
+        if max_refinements < 1:
+            raise ValueError(f"最大加密次数 max_refinements 必须不小于 1，当前值: {max_refinements}")
+        if pilot_paths <= 0 or pilot_paths % 2:
+            raise ValueError(f"试点路径数 pilot_paths 必须是正偶数，当前值: {pilot_paths}")
+        self.tolerance = tolerance
+        self.time_budget = time_budget
+        self.model = model
+        self.seed = seed
+        self.compute_greeks = compute_greeks
+        self.max_refinements = max_refinements
+        self.pilot_paths = pilot_paths
+        self.max_paths = max(max_paths, pilot_paths)
+        self.cache = ComputationCache()
+        self.costs: Dict[str, float] = {}
+
+    def select_method(self, option: Option) -> str:
+        """
+        按期权类别和模型选择定价引擎
+
+        参数:
+            option: 期权对象
+
+        返回:
+            METHODS 之一
+
+        抛出:
+            ValueError: 如果是多资产期权
+        """
+        if isinstance(option, MultiAssetOption):
+            raise ValueError(
+                f"AutoPricing 不支持多资产期权 {type(option).__name__}，请使用 MultiAssetMCPricing"
+            )
+        model = self.model
+        if not isinstance(option, ExoticOption):
+            if model is None or isinstance(model, GBMModel):
+                return "analytic"
+            if type(model).characteristic_function is not Model.characteristic_function:
+                return "fourier"
+        one_factor = model is None or isinstance(model, (GBMModel, LocalVolModel))
+        if one_factor and (not isinstance(option, ExoticOption) or option.pde_supported):
+            return "pde"
+        return "mc"
+
+    def price(
+        self,
+        option: Option,
+        market_data: MarketData,
+    ) -> AutoPricingResult:
+        """
+        按目标精度和时间预算计算期权价格和 Greeks
+
+        参数:
+            option: 单资产期权对象
+            market_data: 市场数据对象
+
+        返回:
+            AutoPricingResult 对象，elapsed 为包括所有加密级别在内的总耗时
+        """
+        start = time.perf_counter()
+        method = self.select_method(option)
+        if method == "analytic":
+            result = AnalyticPricing(self.model).price(option, market_data)
+            if not self.compute_greeks:
+                result = PricingResult(price=result.price)
+            fields, resolution, error = result.to_dict(), None, 0.0
+        elif method == "mc":
+            fields, resolution, error = self._monte_carlo(option, market_data, start)
+        else:
+            build = self._fourier if method == "fourier" else self._pde
+            fields, resolution, error = self._refine(method, build, option, market_data, start)
+        fields["elapsed"] = time.perf_counter() - start
+        return AutoPricingResult(
+            **fields,
+            method=method,
+            resolution=resolution,
+            error_estimate=error,
+            converged=self.tolerance is None or error <= self.tolerance,
+        )
+
+    def _fourier(self, n: int, greeks: bool) -> PricingMethod:
+        return FourierPricing(n_terms=n, compute_greeks=greeks, model=self.model, cache=self.cache)
+
+    def _pde(self, n: int, greeks: bool) -> PricingMethod:
+        return PDEPricing(
+            n_space=n,
+            n_time=n,
+            compute_greeks=greeks,
+            model=self.model,
+            cache=self.cache,
+            greeks="adjoint",
+        )
+
+    def _refine(
+        self,
+        method: str,
+        build: Callable[[int, bool], PricingMethod],
+        option: Option,
+        market_data: MarketData,
+        start: float,
+    ) -> Tuple[dict, int, float]:
+        """
+        逐级翻倍网格方法的分辨率，直到误差估计达到目标或预测超出时间预算
+
+        各级只求价格；需要 Greeks 时在最终分辨率上再定价一次（PDE 复用缓存中的分解），
+        是否加密到下一级的耗时预测包含这次 Greeks 定价
+
+        参数:
+            method: 引擎名称（"fourier" 或 "pde"）
+            build: 由 (分辨率, 是否计算 Greeks) 构造定价方法的函数
+            option: 期权对象
+            market_data: 市场数据对象
+            start: 定价开始时刻
+
+        返回:
+            (最终结果字段, 分辨率, 误差估计)
+        """
+        n, work, growth = (32, 32, 2) if method == "fourier" else (50, 50 * 50, 4)
+        smooth = not (
+            isinstance(option, ExoticOption)
+            and type(option).jump_condition is not ExoticOption.jump_condition
+        )
+        prices = [self._timed(method, build(n, False), option, market_data, work).price]
+        error = float("inf")
+        for _ in range(self.max_refinements):
+            greeks_work = work * growth if self.compute_greeks else 0
+            if not self._affordable(method, work * growth, start, greeks_work):
+                break
+            n, work = 2 * n, work * growth
+            prices.append(self._timed(method, build(n, False), option, market_data, work).price)
+            error = self._error_estimate(method, prices, smooth)
+            if self.tolerance is not None and error <= self.tolerance:
+                break
+        if not self.compute_greeks:
+            return {"price": prices[-1]}, n, error
+        result = self._timed(method, build(n, True), option, market_data, work, greeks=True)
+        return result.to_dict(), n, error
+
+    @staticmethod
+    def _error_estimate(
+        method: str,
+        prices: List[float],
+        smooth: bool = True,
+    ) -> float:
+        """
+        由逐级翻倍的价格序列估计最细一级的误差
+
+        COS 指数收敛，直接取相邻两级之差。PDE 的误差估计为 |P_2n - P_n| / (2^p - 1)，
+        默认取最坏情形的收敛阶 p = 1/2。光滑合约在最近两次由相邻三级观察到的收敛阶
+        （限制在 [1/2, 2]）相差不超过 ORDER_AGREEMENT 时改用观察到的收敛阶；
+        不光滑的路径依赖合约（障碍等）的观察收敛阶不可靠，始终按 p = 1/2 估计
+
+        参数:
+            method: 引擎名称
+            prices: 各级价格
+            smooth: 合约收益是否光滑（不光滑时使用最坏情形收敛阶）
+
+        返回:
+            误差估计
+        """
+        diff = abs(prices[-1] - prices[-2])
+        if method == "fourier":
+            return diff
+        worst = diff / (np.sqrt(2.0) - 1.0)
+        if not smooth or len(prices) < 4:
+            return worst
+
+        def observed_order(coarse: float, middle: float, fine: float) -> float:
+            step = abs(middle - fine)
+            if step == 0.0:
+                return 2.0
+            ratio = abs(coarse - middle) / step
+            return min(max(np.log2(ratio), 0.5), 2.0) if ratio > 0.0 else 0.5
+
+        previous = observed_order(*prices[-4:-1])
+        order = observed_order(*prices[-3:])
+        if abs(order - previous) > ORDER_AGREEMENT:
+            return worst
+        return diff / (2.0**order - 1.0)
+
+    def _monte_carlo(
+        self,
+        option: Option,
+        market_data: MarketData,
+        start: float,
+    ) -> Tuple[dict, int, float]:
+        """
+        用试点路径的方差确定满足目标精度的路径数，再以该路径数定价
+
+        参数:
+            option: 期权对象
+            market_data: 市场数据对象
+            start: 定价开始时刻
+
+        返回:
+            (最终结果字段, 路径数, 标准误)
+        """
+        model = self.model if self.model is not None else GBMModel(market_data.sigma)
+        differentiable = (
+            type(option).payoff_gradient is not Option.payoff_gradient
+            and type(model).step_vjp is not Model.step_vjp
+        )
+
+        def build(n_paths: int, greeks: bool) -> MCPricing:
+            return MCPricing(
+                n_paths=n_paths,
+                chunk_size=min(n_paths, 50_000),
+                seed=self.seed,
+                compute_greeks=greeks,
+                model=self.model,
+                greeks="adjoint" if differentiable else "bump",
+            )
+
+        n = self.pilot_paths
+        pilot = self._timed("mc", build(n, False), option, market_data, n)
+        if self.tolerance is None:
+            target = self.max_paths
+        else:
+            # 试点方差本身有抽样误差，路径数留出 25% 余量
+            target = int(1.25 * n * (pilot.std_error / self.tolerance) ** 2) + 1
+        target = min(max(target + target % 2, n), self.max_paths)
+        if self.time_budget is not None:
+            # 最终定价（含 Greeks 时按其单位耗时）必须落在剩余预算内
+            remaining = self.time_budget - (time.perf_counter() - start)
+            affordable = int(remaining / self._unit_cost("mc", self.compute_greeks))
+            target = max(min(target, affordable - affordable % 2), n)
+        if target == n and not self.compute_greeks:
+            return pilot.to_dict(), n, pilot.std_error
+        result = self._timed(
+            "mc",
+            build(target, self.compute_greeks),
+            option,
+            market_data,
+            target,
+            greeks=self.compute_greeks,
+        )
+        return result.to_dict(), target, result.std_error
+
+    def _timed(
+        self,
+        method: str,
+        pricer: PricingMethod,
+        option: Option,
+        market_data: MarketData,
+        work: int,
+        greeks: bool = False,
+    ) -> PricingResult:
+        """
+        定价并以指数滑动平均更新该引擎的单位工作量耗时
+
+        参数:
+            method: 引擎名称
+            pricer: 定价方法
+            option: 期权对象
+            market_data: 市场数据对象
+            work: 本次工作量
+            greeks: 是否为带 Greeks 的定价（耗时记录在 "<引擎>+greeks" 下）
+
+        返回:
+            PricingResult 对象
+        """
+        start = time.perf_counter()
+        result = pricer.price(option, market_data)
+        cost = (time.perf_counter() - start) / work
+        key = f"{method}+greeks" if greeks else method
+        previous = self.costs.get(key)
+        self.costs[key] = cost if previous is None else 0.5 * (previous + cost)
+        return result
+
+    def _unit_cost(self, method: str, greeks: bool) -> float:
+        """
+        返回预测用的单位工作量耗时
+
+        参数:
+            method: 引擎名称（只求价格的耗时必须已经测得）
+            greeks: 是否带 Greeks；未测得时按 GREEKS_COST_FACTOR 倍的价格耗时估计
+
+        返回:
+            单位工作量耗时（秒）
+        """
+        cost = self.costs[method]
+        if not greeks:
+            return cost
+        return self.costs.get(f"{method}+greeks", GREEKS_COST_FACTOR[method] * cost)
+
+    def _affordable(self, method: str, work: int, start: float, greeks_work: int = 0) -> bool:
+        """
+        判断下一级工作量（连同随后的 Greeks 定价）的预测耗时是否仍在时间预算内
+
+        参数:
+            method: 引擎名称
+            work: 下一级只求价格的工作量
+            start: 定价开始时刻
+            greeks_work: 随后带 Greeks 定价的工作量（不计算 Greeks 时为 0）
+
+        返回:
+            未设时间预算或预测耗时不超出预算时为 True
+        """
+        if self.time_budget is None:
+            return True
+        predicted = self._unit_cost(method, False) * work
+        if greeks_work:
+            predicted += self._unit_cost(method, True) * greeks_work
+        return time.perf_counter() - start + predicted <= self.time_budget
+
+    def __repr__(self) -> str:
+        """
+        返回定价方法的字符串表示
+
+        返回:
+            定价方法的描述字符串
+        """
+        return (
+            f"AutoPricing(tolerance={self.tolerance}, time_budget={self.time_budget}, "
+            f"model={self.model!r})"
+        )
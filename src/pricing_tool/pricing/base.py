@@ -5,19 +5,26 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 
+from .._slots import slotted
 from ..options.base import Option
 from ..utils.market_data import MarketData
 
 
-@dataclass
+@slotted
+@dataclass(frozen=True)
 class PricingResult:
     """
     定价结果数据类
     
     包含期权价格、Greeks 和其他相关信息
+    
+    实例不可变且可哈希，使用 __slots__ 存储字段（无实例 __dict__）。__slots__ 只去掉
+    实例字典，每个活动对象仍约 96 字节外加各字段的 float 对象（每个 24 字节），
+    比带 __dict__ 时约小 1.5 倍；大量持有结果时应使用 records.pack_results 打包为
+    结构化数组，每条记录固定 64 字节，约为活动对象总占用的 1/4
     """
     price: float
     """期权价格"""
@@ -37,6 +44,12 @@ class PricingResult:
     rho: Optional[float] = None
     """Rho：价格对利率的敏感性"""
     
+    std_error: Optional[float] = None
+    """价格的标准误（MC 等统计方法）"""
+    
+    elapsed: Optional[float] = None
+    """计算耗时（秒）"""
+    
     def to_dict(self) -> Dict[str, Optional[float]]:
         """
         将定价结果转换为字典
@@ -51,6 +64,8 @@ class PricingResult:
             "theta": self.theta,
             "vega": self.vega,
             "rho": self.rho,
+            "std_error": self.std_error,
+            "elapsed": self.elapsed,
         }
     
     def __repr__(self) -> str:
@@ -71,6 +86,10 @@ class PricingResult:
             parts.append(f"vega={self.vega:.6f}")
         if self.rho is not None:
             parts.append(f"rho={self.rho:.6f}")
+        if self.std_error is not None:
+            parts.append(f"std_error={self.std_error:.6f}")
+        if self.elapsed is not None:
+            parts.append(f"elapsed={self.elapsed:.6f}")
         return f"PricingResult({', '.join(parts)})"
 
 
@@ -81,6 +100,9 @@ class PricingMethod(ABC):
     定义所有定价方法的通用接口，包括 PDE 和 MC 方法
     """
     
+    _runtime_attributes: Tuple[str, ...] = ("cache",)
+    """不影响定价结果的运行时状态属性（缓存、性能统计），计算结果缓存键时忽略"""
+    
     @abstractmethod
     def price(
         self,
@@ -102,6 +124,46 @@ class PricingMethod(ABC):
         """
         pass
     
+    def price_batch(
+        self,
+        options: Sequence[Option],
+        market_data: Union[MarketData, Sequence[MarketData]],
+    ) -> List[PricingResult]:
+        """
+        批量计算期权价格和 Greeks
+        
+        默认实现逐个调用 price；可共享计算的定价方法（如 PDE 共享网格和算子）
+        应重写此方法
+        
+        参数:
+            options: 期权对象序列
+            market_data: 所有期权共用的市场数据，或与 options 一一对应的市场数据序列
+            
+        返回:
+            与 options 顺序一致的 PricingResult 列表
+            
+        抛出:
+            ValueError: 如果市场数据序列与期权序列长度不一致
+        """
+        pairs = pair_market_data(options, market_data)
+        return [self.price(option, data) for option, data in pairs]
+    
+    def batch_key(self, option: Option, market_data: MarketData) -> Hashable:
+        """
+        返回合约在 price_batch 中的分组键
+        
+        分组键相同的合约在 price_batch 中共享计算（如 PDE 网格、MC 路径、
+        Fourier 执行价序列）。默认实现不共享计算，每个合约单独一组
+        
+        参数:
+            option: 期权对象
+            market_data: 市场数据对象
+            
+        返回:
+            可哈希的分组键
+        """
+        return (option, market_data)
+    
     def __repr__(self) -> str:
         """
         返回定价方法的字符串表示
@@ -110,3 +172,29 @@ class PricingMethod(ABC):
             定价方法的描述字符串
         """
         return f"{self.__class__.__name__}()"
+
+
+def pair_market_data(
+    options: Sequence[Option],
+    market_data: Union[MarketData, Sequence[MarketData]],
+) -> List[tuple]:
+    """
+    将期权与市场数据配对
+    
+    参数:
+        options: 期权对象序列
+        market_data: 共用的市场数据或与 options 一一对应的序列
+        
+    返回:
+        (option, market_data) 元组列表
+        
+    抛出:
+        ValueError: 如果序列长度不一致
+    """
+    if isinstance(market_data, MarketData):
+        return [(option, market_data) for option in options]
+    if len(market_data) != len(options):
+        raise ValueError(
+            f"市场数据数量必须与期权数量一致，当前: {len(market_data)} != {len(options)}"
+        )
+    return list(zip(options, market_data))
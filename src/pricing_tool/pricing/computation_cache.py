@@ -0,0 +1,96 @@
+"""
+计算缓存模块
+
+线程安全的有界 LRU 缓存，供定价引擎复用与合约条款无关的中间结果
+（PDE 算子及其分解、Fourier 特征函数取值等）
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+V = TypeVar("V")
+
+
+class ComputationCache:
+    """
+    有界 LRU 计算缓存（线程安全）
+
+    按可哈希键缓存构建代价高的中间结果，超过容量时淘汰最久未使用的条目
+    """
+
+    def __init__(self, max_entries: int = 64):
+        """
+        初始化缓存
+
+        参数:
+            max_entries: 最多缓存的条目数
+
+        抛出:
+            ValueError: 如果 max_entries 不是正数
+        """
+        if max_entries <= 0:
+            raise ValueError(f"缓存容量 max_entries 必须大于 0，当前值: {max_entries}")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key: Hashable, build: Callable[[], V]) -> V:
+        """
+        获取缓存条目，不存在时构建并缓存
+
+        参数:
+            key: 缓存键
+            build: 无参构建函数，仅在未命中时调用
+
+        返回:
+            缓存的条目
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        # 在锁外构建，避免长时间分解阻塞其他线程的命中
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """清空缓存和统计信息"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        返回缓存统计信息
+
+        返回:
+            包含 size、hits、misses、evictions 的字典
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={len(self)}, max_entries={self.max_entries})"
@@ -0,0 +1,426 @@
+"""
+Fourier 定价模块
+
+基于模型特征函数的 COS 方法（Fang-Oosterlee）和 Carr-Madan FFT 方法，
+一次计算同一 (模型, r, T) 下整条执行价序列的欧式期权价格
+
+特征函数只依赖 (模型, r, T)，与现价和执行价无关（价格关于现价一次齐次），
+因此特征函数的求值结果按 (模型, r, T, 方法参数) 缓存：
+- COS：缓存 phi(u_k) exp(-i u_k a) 和截断区间，之后每个执行价只需一次点积
+- Carr-Madan：缓存按现价归一化的看涨价格曲线 C / S0 在相对对数执行价网格上的 FFT 结果，
+  任意现价、任意执行价只需插值
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.base import Model
+from ..models.gbm import GBMModel
+from ..options.base import Option
+from ..options.exotic import ExoticOption
+from ..utils.market_data import MarketData
+from .base import PricingMethod, PricingResult, pair_market_data
+from .computation_cache import ComputationCache
+
+METHODS = ("cos", "carr_madan")
+"""支持的 Fourier 方法"""
+
+
+def cos_truncation_range(
+    model: Model, T: float, r: float, truncation: float
+) -> Tuple[float, float]:
+    """
+    COS 方法在 z = ln(S_T / S_0) 上的截断区间
+
+    由特征函数数值估计前两阶累积量（ln phi(h) = i c1 h - c2 h^2 / 2 + O(h^3)），
+    区间取 c1 -/+ truncation * sqrt(c2)
+
+    参数:
+        model: 标的动态模型
+        T: 期限
+        r: 无风险利率
+        truncation: 区间半宽（标准差的倍数）
+
+    返回:
+        (a, b)
+    """
+    h = 1e-3
+    log_phi = np.log(model.characteristic_function(np.array([h]), T, r))[0]
+    mean = float(log_phi.imag / h)
+    half_width = truncation * np.sqrt(max(-2.0 * log_phi.real / h**2, 1e-12))
+    return mean - half_width, mean + half_width
+
+
+def _check_model(model: Model) -> None:
+    """
+    检查模型是否实现了解析特征函数
+
+    参数:
+        model: 标的动态模型
+
+    抛出:
+        ValueError: 如果模型没有解析特征函数（如局部波动率模型）
+    """
+    if type(model).characteristic_function is Model.characteristic_function:
+        raise ValueError(
+            f"{type(model).__name__} 没有解析特征函数，FourierPricing 不支持，"
+            "请使用 PDE 或蒙特卡洛方法"
+        )
+
+
+def cos_payoff_integrals(
+    strikes: np.ndarray, S: float, a: float, b: float, n_terms: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    看跌期权收益在 [a, b] 上的余弦积分
+
+    d = clip(ln(K / S_0), a, b)，u_k = k pi / (b - a)：
+    psi_k = int_a^d cos(u_k (z - a)) dz，chi_k = int_a^d e^z cos(u_k (z - a)) dz，
+    看跌期权的余弦系数为 2 / (b - a) [K psi_k - S_0 chi_k]
+
+    参数:
+        strikes: 执行价数组，形状为 (M,)
+        S: 现价
+        a: 截断区间下限
+        b: 截断区间上限
+        n_terms: 级数项数
+
+    返回:
+        (psi, chi, e^d cos(u_k (d - a)))，形状均为 (n_terms, M)；
+        最后一项为 chi 对 d 的导数，用于 Gamma
+    """
+    u = (np.arange(n_terms) * np.pi / (b - a))[:, np.newaxis]
+    d = np.clip(np.log(strikes / S), a, b)[np.newaxis, :]
+    phase = u * (d - a)
+    cos_d, sin_d = np.cos(phase), np.sin(phase)
+    exp_d = np.exp(d)
+    chi = (exp_d * (cos_d + u * sin_d) - np.exp(a)) / (1.0 + u**2)
+    psi = np.empty_like(chi)
+    psi[0] = d[0] - a
+    psi[1:] = sin_d[1:] / u[1:]
+    return psi, chi, exp_d * cos_d
+
+
+class FourierPricing(PricingMethod):
+    """
+    Fourier 定价方法（欧式看涨/看跌）
+
+    COS 方法（默认）：把 ln(S_T / S_0) 的密度在 [a, b] 上展开为余弦级数，
+    看跌期权的级数系数有解析式，看涨期权由平价关系得到（数值上更稳定）。
+    n_terms 项即可达到很高精度，执行价序列为一次 (n_terms, 执行价数) 矩阵乘法，
+    Delta、Gamma 由级数对现价解析求导得到
+
+    Carr-Madan 方法：对阻尼后的看涨价格做一次 n_fft 点 FFT，O(N log N) 得到
+    整个对数执行价网格上的价格，再三次样条插值到所需执行价；不计算 Greeks
+
+    支持具有解析特征函数的模型（GBMModel、HestonModel）；不支持奇异期权
+    """
+
+    def __init__(
+        self,
+        method: str = "cos",
+        n_terms: int = 256,
+        truncation: float = 16.0,
+        n_fft: int = 4096,
+        eta: float = 0.25,
+        alpha: float = 1.5,
+        compute_greeks: bool = True,
+        model: Optional[Model] = None,
+        cache: Optional[ComputationCache] = None,
+    ):
+        """
+        初始化 Fourier 定价方法
+
+        参数:
+            method: "cos" 或 "carr_madan"
+            n_terms: COS 级数项数
+            truncation: COS 截断区间半宽，以 ln(S_T / S_0) 标准差的倍数表示
+            n_fft: Carr-Madan FFT 点数（2 的幂效率最高）
+            eta: Carr-Madan 频率网格间距
+            alpha: Carr-Madan 阻尼系数
+            compute_greeks: 是否计算 Greeks（COS 方法的 Delta、Gamma）
+            model: 标的动态模型；None 时使用 MarketData.sigma 的几何布朗运动
+            cache: 特征函数缓存；None 时为本实例创建一个新缓存
+
+        抛出:
+            ValueError: 如果参数无效，或模型没有解析特征函数
+        """
+        if method not in METHODS:
+            raise ValueError(f"不支持的 Fourier 方法: {method}，可选值: {METHODS}")
+        if n_terms < 2:
+            raise ValueError(f"级数项数 n_terms 必须不小于 2，当前值: {n_terms}")
+        if truncation <= 0:
+            raise ValueError(f"截断宽度 truncation 必须大于 0，当前值: {truncation}")
+        if n_fft < 4:
+            raise ValueError(f"FFT 点数 n_fft 必须不小于 4，当前值: {n_fft}")
+        if eta <= 0 or alpha <= 0:
+            raise ValueError(f"eta 和 alpha 必须大于 0，当前值: eta={eta}, alpha={alpha}")
+        if model is not None:
+            _check_model(model)
+        self.method = method
+        self.n_terms = n_terms
+        self.truncation = truncation
+        self.n_fft = n_fft
+        self.eta = eta
+        self.alpha = alpha
+        self.compute_greeks = compute_greeks
+        self.model = model
+        self.cache = cache if cache is not None else ComputationCache()
+
+    def price(
+        self,
+        option: Option,
+        market_data: MarketData,
+    ) -> PricingResult:
+        """
+        计算期权价格（COS 方法在 compute_greeks 时另给出 Delta、Gamma）
+
+        参数:
+            option: 欧式期权对象
+            market_data: 市场数据对象
+
+        返回:
+            PricingResult 对象
+        """
+        return self.price_batch([option], market_data)[0]
+
+    def price_batch(
+        self,
+        options: Sequence[Option],
+        market_data: Union[MarketData, Sequence[MarketData]],
+    ) -> List[PricingResult]:
+        """
+        批量计算期权价格
+
+        共享 (模型, r, T, 现价) 的合约作为一条执行价序列一次定价
+
+        参数:
+            options: 欧式期权对象序列
+            market_data: 共用的市场数据，或与 options 一一对应的市场数据序列
+
+        返回:
+            与 options 顺序一致的 PricingResult 列表，elapsed 为组内平均耗时
+
+        抛出:
+            ValueError: 如果包含奇异期权
+        """
+        pairs = pair_market_data(options, market_data)
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        for index, (option, data) in enumerate(pairs):
+            if isinstance(option, ExoticOption):
+                raise ValueError(f"FourierPricing 不支持奇异期权: {type(option).__name__}")
+            groups.setdefault(self.batch_key(option, data), []).append(index)
+
+        results: List[Optional[PricingResult]] = [None] * len(pairs)
+        for (model, r, T, S), indices in groups.items():
+            start = time.perf_counter()
+            strikes = np.array([pairs[i][0].K for i in indices])
+            is_call = np.array([pairs[i][0].is_call for i in indices])
+            if self.method == "cos":
+                prices, delta, gamma = self._cos_strip(model, strikes, is_call, S, r, T)
+                fields: Dict[str, np.ndarray] = (
+                    {"delta": delta, "gamma": gamma} if self.compute_greeks else {}
+                )
+            else:
+                prices = self._carr_madan_strip(model, strikes, is_call, S, r, T)
+                fields = {}
+            elapsed = (time.perf_counter() - start) / len(indices)
+            for j, i in enumerate(indices):
+                values = {name: float(column[j]) for name, column in fields.items()}
+                results[i] = PricingResult(price=float(prices[j]), elapsed=elapsed, **values)
+        return results  # type: ignore[return-value]
+
+    def batch_key(self, option: Option, market_data: MarketData) -> Tuple[Any, ...]:
+        """
+        返回合约在 price_batch 中的分组键
+
+        参数:
+            option: 期权对象
+            market_data: 市场数据对象
+
+        返回:
+            (模型, r, T, 现价)，同组合约构成一条执行价序列
+        """
+        model = self.model if self.model is not None else GBMModel(market_data.sigma)
+        return (model, market_data.r, option.T, market_data.S)
+
+    def price_strikes(
+        self,
+        strikes: Sequence[float],
+        T: float,
+        S: float,
+        r: float,
+        option_type: Union[str, Sequence[str]] = "call",
+        model: Optional[Model] = None,
+    ) -> np.ndarray:
+        """
+        一次计算整条执行价序列的价格（校准等内层循环使用）
+
+        参数:
+            strikes: 执行价数组
+            T: 到期时间
+            S: 现价
+            r: 无风险利率
+            option_type: "call"、"put"，或与 strikes 等长的类型序列
+            model: 标的动态模型；None 时使用实例的模型
+
+        返回:
+            与 strikes 同形状的价格数组
+
+        抛出:
+            ValueError: 如果没有可用的模型，或模型没有解析特征函数
+        """
+        model = model if model is not None else self.model
+        if model is None:
+            raise ValueError("未指定模型：请在构造时或调用时传入 model")
+        _check_model(model)
+        K = np.asarray(strikes, dtype=float)
+        is_call = np.broadcast_to(np.asarray(option_type) == "call", K.shape)
+        if self.method == "cos":
+            prices = self._cos_strip(model, K.ravel(), is_call.ravel(), S, r, T)[0]
+        else:
+            prices = self._carr_madan_strip(model, K.ravel(), is_call.ravel(), S, r, T)
+        return prices.reshape(K.shape)
+
+    def _cos_coefficients(
+        self, model: Model, r: float, T: float
+    ) -> Tuple[np.ndarray, float, float]:
+        """
+        获取 COS 级数中只依赖模型的部分（带缓存）
+
+        参数:
+            model: 标的动态模型
+            r: 无风险利率
+            T: 期限
+
+        返回:
+            (Re[phi(u_k) exp(-i u_k a)]（首项权重减半）, a, b)
+        """
+
+        def build() -> Tuple[np.ndarray, float, float]:
+            a, b = cos_truncation_range(model, T, r, self.truncation)
+            u = np.arange(self.n_terms) * np.pi / (b - a)
+            weights = (model.characteristic_function(u, T, r) * np.exp(-1j * u * a)).real
+            weights[0] *= 0.5
+            weights.setflags(write=False)
+            return weights, a, b
+
+        key = ("cos", model, r, T, self.n_terms, self.truncation)
+        return self.cache.get_or_build(key, build)
+
+    def _cos_strip(
+        self,
+        model: Model,
+        strikes: np.ndarray,
+        is_call: np.ndarray,
+        S: float,
+        r: float,
+        T: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        COS 方法计算一条执行价序列的价格、Delta 和 Gamma（看涨期权由平价关系得到）
+
+        参数:
+            model: 标的动态模型
+            strikes: 执行价数组
+            is_call: 是否为看涨期权的布尔数组
+            S: 现价
+            r: 无风险利率
+            T: 期限
+
+        返回:
+            (价格, Delta, Gamma) 数组
+        """
+        weights, a, b = self._cos_coefficients(model, r, T)
+        psi, chi, chi_slope = cos_payoff_integrals(strikes, S, a, b, self.n_terms)
+
+        discount = np.exp(-r * T)
+        scale = 2.0 / (b - a) * discount
+        put = scale * (weights @ (strikes * psi - S * chi))
+        put_delta = -scale * (weights @ chi)
+        # d 在区间内部时 dd/dS = -1/S，收益在 z = d 处为 0，只有 chi 的上限项贡献
+        inside = (np.log(strikes / S) > a) & (np.log(strikes / S) < b)
+        put_gamma = scale * (weights @ chi_slope) / S * inside
+
+        forward_value = S - strikes * discount
+        price = np.where(is_call, put + forward_value, put)
+        delta = np.where(is_call, put_delta + 1.0, put_delta)
+        return price, delta, put_gamma
+
+    def _carr_madan_curve(self, model: Model, r: float, T: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        获取按现价归一化的看涨价格曲线（带缓存）
+
+        C(K) / S_0 只依赖相对对数执行价 kappa = ln(K / S_0)，一次 FFT 得到整个网格
+
+        参数:
+            model: 标的动态模型
+            r: 无风险利率
+            T: 期限
+
+        返回:
+            (kappa 网格, C / S_0)
+        """
+
+        def build() -> Tuple[np.ndarray, np.ndarray]:
+            n, eta, alpha = self.n_fft, self.eta, self.alpha
+            spacing = 2.0 * np.pi / (n * eta)
+            v = eta * np.arange(n)
+            kappa = spacing * (np.arange(n) - n // 2)
+            phi = model.characteristic_function(v - (alpha + 1.0) * 1j, T, r)
+            psi = np.exp(-r * T) * phi / (alpha**2 + alpha - v**2 + 1j * (2.0 * alpha + 1.0) * v)
+            # Simpson 权重
+            simpson = (3.0 + (-1.0) ** (np.arange(n) + 1)) / 3.0
+            simpson[0] = 1.0 / 3.0
+            x = np.exp(-1j * v * kappa[0]) * psi * eta * simpson
+            curve = np.exp(-alpha * kappa) / np.pi * np.fft.fft(x).real
+            kappa.setflags(write=False)
+            curve.setflags(write=False)
+            return kappa, curve
+
+        key = ("carr_madan", model, r, T, self.n_fft, self.eta, self.alpha)
+        return self.cache.get_or_build(key, build)
+
+    def _carr_madan_strip(
+        self,
+        model: Model,
+        strikes: np.ndarray,
+        is_call: np.ndarray,
+        S: float,
+        r: float,
+        T: float,
+    ) -> np.ndarray:
+        """
+        Carr-Madan 方法计算一条执行价序列的价格
+
+        参数:
+            model: 标的动态模型
+            strikes: 执行价数组
+            is_call: 是否为看涨期权的布尔数组
+            S: 现价
+            r: 无风险利率
+            T: 期限
+
+        返回:
+            价格数组
+        """
+        from scipy.interpolate import CubicSpline
+
+        kappa, curve = self._carr_madan_curve(model, r, T)
+        target = np.log(strikes / S)
+        # 只在目标附近取一段网格做样条，避免对整个网格建样条
+        low = max(int(np.searchsorted(kappa, target.min())) - 4, 0)
+        high = min(int(np.searchsorted(kappa, target.max())) + 4, kappa.size)
+        call = S * CubicSpline(kappa[low:high], curve[low:high])(target)
+        return np.where(is_call, call, call - S + strikes * np.exp(-r * T))
+
+    def __repr__(self) -> str:
+        """
+        返回定价方法的字符串表示
+
+        返回:
+            定价方法的描述字符串
+        """
+        return f"FourierPricing(method={self.method!r}, model={self.model!r})"
@@ -0,0 +1,589 @@
+"""
+MC 定价模块
+
+使用蒙特卡洛模拟为期权定价，标的动态由模型给出（默认几何布朗运动）
+
+模拟时间点由期权决定：普通期权只模拟到期日一步；
+给出观察日程的奇异期权只模拟到观察日和除息日，不经过细时间网格；
+连续观察的奇异期权使用 n_steps 步的均匀网格近似，连续观察的障碍另用布朗桥
+修正相邻时间点之间的穿越概率（否则价格偏差与 sqrt(dt) 同阶）。
+没有精确转移的模型（Heston、局部波动率）再把每个区间细分为不超过 max_step 的子步。
+路径按块生成，只保存观察日的价格，内存占用与 chunk_size * 观察日数成正比
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.base import Model
+from ..models.gbm import GBMModel
+from ..models.local_vol import LocalVolModel
+from ..options.base import Option
+from ..options.exotic import ExoticOption
+from ..utils.market_data import MarketData
+from .adjoint import GREEK_METHODS, AdjointResult
+from .base import PricingMethod, PricingResult, pair_market_data
+
+
+class MCPricing(PricingMethod):
+    """
+    蒙特卡洛定价方法
+
+    价格为折现后收益的样本均值，同时给出标准误。Greeks 默认使用公共随机数
+    （同一随机种子）在扰动参数下重新模拟，以中心差分计算 Delta、Gamma、Rho，
+    几何布朗运动模型另计算 Vega；Theta 不计算
+
+    greeks="adjoint" 时改用伴随法（pathwise）：每块路径前向模拟后，沿路径反向传播
+    收益对各时间点价格的导数，一次得到 Delta、Rho 和模型参数梯度
+    （几何布朗运动的 Vega，局部波动率网格的分桶 Vega）。
+    几何布朗运动的 Gamma 由 pathwise Delta 乘以首步的似然比权重得到。
+    要求收益可导（障碍期权等不连续收益不适用）且模型实现 step_vjp
+
+    市场状态（S、r，未指定模型时还有 sigma）取自 MarketData，
+    合约条款（收益、到期时间、日程）取自期权对象
+    """
+
+    def __init__(
+        self,
+        n_paths: int = 100_000,
+        n_steps: int = 252,
+        chunk_size: int = 50_000,
+        antithetic: bool = True,
+        seed: Optional[int] = None,
+        compute_greeks: bool = True,
+        spot_bump: float = 0.01,
+        vega_bump: float = 0.01,
+        rho_bump: float = 1e-4,
+        model: Optional[Model] = None,
+        max_step: float = 1.0 / 52.0,
+        greeks: str = "bump",
+    ):
+        """
+        初始化蒙特卡洛定价方法
+
+        参数:
+            n_paths: 模拟路径总数
+            n_steps: 连续观察期权使用的时间步数
+            chunk_size: 每块模拟的路径数（限制单块内存）
+            antithetic: 是否使用对偶变量降低方差
+            seed: 随机数种子；None 时每次定价使用不同的随机数
+            compute_greeks: 是否计算 Greeks
+            spot_bump: Delta/Gamma 的相对现价扰动
+            vega_bump: Vega 的相对波动率扰动
+            rho_bump: Rho 的绝对利率扰动
+            model: 标的动态模型；None 时使用 MarketData.sigma 的几何布朗运动
+            max_step: 非精确转移模型的最大子步长（年）
+            greeks: Greeks 计算方式，"bump"（扰动重定价）或 "adjoint"（伴随法）
+
+        抛出:
+            ValueError: 如果参数无效
+        """
+        if n_paths <= 0:
+            raise ValueError(f"路径数 n_paths 必须大于 0，当前值: {n_paths}")
+        if n_steps <= 0:
+            raise ValueError(f"时间步数 n_steps 必须大于 0，当前值: {n_steps}")
+        if chunk_size <= 0:
+            raise ValueError(f"分块大小 chunk_size 必须大于 0，当前值: {chunk_size}")
+        if antithetic and (n_paths % 2 or chunk_size % 2):
+            raise ValueError("使用对偶变量时 n_paths 和 chunk_size 必须为偶数")
+        if max_step <= 0:
+            raise ValueError(f"最大子步长 max_step 必须大于 0，当前值: {max_step}")
+        if greeks not in GREEK_METHODS:
+            raise ValueError(f"不支持的 Greeks 计算方式: {greeks}，可选值: {GREEK_METHODS}")
+        self.n_paths = n_paths
+        self.n_steps = n_steps
+        self.chunk_size = chunk_size
+        self.antithetic = antithetic
+        self.seed = seed
+        self.compute_greeks = compute_greeks
+        self.spot_bump = spot_bump
+        self.vega_bump = vega_bump
+        self.rho_bump = rho_bump
+        self.model = model
+        self.max_step = max_step
+        self.greeks = greeks
+
+    def price(
+        self,
+        option: Option,
+        market_data: MarketData,
+    ) -> PricingResult:
+        """
+        计算期权价格、标准误和 Greeks
+
+        参数:
+            option: 期权对象实例
+            market_data: 市场数据对象
+
+        返回:
+            PricingResult 对象
+
+        抛出:
+            ValueError: 如果 greeks="adjoint" 而收益不可导或模型没有伴随实现
+        """
+        if self.compute_greeks and self.greeks == "adjoint":
+            return self.sensitivities(option, market_data).result
+        return self.price_batch([option], market_data)[0]
+
+    def price_batch(
+        self,
+        options: Sequence[Option],
+        market_data: Union[MarketData, Sequence[MarketData]],
+    ) -> List[PricingResult]:
+        """
+        批量计算期权价格、标准误和 Greeks
+
+        共享 (模型, 现价, r, 模拟时间点) 的合约在同一组路径上计算收益，
+        扰动法 Greeks 的每次重新模拟也由全组共享。伴随法逐个合约计算
+
+        参数:
+            options: 期权对象序列
+            market_data: 共用的市场数据，或与 options 一一对应的市场数据序列
+
+        返回:
+            与 options 顺序一致的 PricingResult 列表，elapsed 为组内平均耗时
+        """
+        if self.compute_greeks and self.greeks == "adjoint":
+            return super().price_batch(options, market_data)
+        pairs = pair_market_data(options, market_data)
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        for index, (option, data) in enumerate(pairs):
+            groups.setdefault(self.batch_key(option, data), []).append(index)
+
+        results: List[Optional[PricingResult]] = [None] * len(pairs)
+        for (model, S, r, _), indices in groups.items():
+            start = time.perf_counter()
+            group_options = [pairs[i][0] for i in indices]
+            fields = self._price_group(group_options, model, S, r)
+            elapsed = (time.perf_counter() - start) / len(indices)
+            for j, i in enumerate(indices):
+                values = {name: float(column[j]) for name, column in fields.items()}
+                results[i] = PricingResult(elapsed=elapsed, **values)
+        return results  # type: ignore[return-value]
+
+    def batch_key(self, option: Option, market_data: MarketData) -> Tuple[Any, ...]:
+        """
+        返回合约在 price_batch 中的分组键
+
+        参数:
+            option: 期权对象
+            market_data: 市场数据对象
+
+        返回:
+            (模型, 现价, r, 模拟时间点)，同组合约共享路径
+        """
+        model = self.model if self.model is not None else GBMModel(market_data.sigma)
+        times, observed_index, amounts = self.simulation_schedule(option)
+        schedule = (tuple(times), tuple(observed_index), tuple(amounts))
+        return (model, market_data.S, market_data.r, schedule)
+
+    def _price_group(
+        self,
+        options: List[Option],
+        model: Model,
+        S: float,
+        r: float,
+    ) -> Dict[str, np.ndarray]:
+        """
+        在同一组路径上为共享模拟时间点的合约定价，并用公共随机数计算扰动法 Greeks
+
+        参数:
+            options: 模拟时间点相同的期权列表
+            model: 标的动态模型
+            S: 标的资产当前价格
+            r: 无风险利率
+
+        返回:
+            结果字段名到各合约取值数组的字典
+        """
+        schedule = self.simulation_schedule(options[0])
+        seed = self._seed()
+
+        price, std_error = self._estimate(options, schedule, model, S, r, seed)
+        fields = {"price": price, "std_error": std_error}
+        if self.compute_greeks:
+            h = self.spot_bump * S
+            up, _ = self._estimate(options, schedule, model, S + h, r, seed)
+            down, _ = self._estimate(options, schedule, model, S - h, r, seed)
+            fields["delta"] = (up - down) / (2.0 * h)
+            fields["gamma"] = (up - 2.0 * price + down) / h**2
+
+            if isinstance(model, GBMModel):
+                h = self.vega_bump * model.sigma
+                up_model, down_model = GBMModel(model.sigma + h), GBMModel(model.sigma - h)
+                up, _ = self._estimate(options, schedule, up_model, S, r, seed)
+                down, _ = self._estimate(options, schedule, down_model, S, r, seed)
+                fields["vega"] = (up - down) / (2.0 * h)
+
+            h = self.rho_bump
+            up, _ = self._estimate(options, schedule, model, S, r + h, seed)
+            down, _ = self._estimate(options, schedule, model, S, r - h, seed)
+            fields["rho"] = (up - down) / (2.0 * h)
+        return fields
+
+    def sensitivities(self, option: Option, market_data: MarketData) -> AdjointResult:
+        """
+        用伴随法一次计算价格、Greeks 和模型参数梯度
+
+        参数:
+            option: 收益可导的期权对象
+            market_data: 市场数据对象
+
+        返回:
+            AdjointResult 对象（Theta 不计算；Gamma 只对几何布朗运动计算）
+
+        抛出:
+            ValueError: 如果收益不可导或模型没有伴随实现
+        """
+        start = time.perf_counter()
+        model = self.model if self.model is not None else GBMModel(market_data.sigma)
+        self._check_adjoint(option, model)
+        schedule = self.simulation_schedule(option)
+        S, r = market_data.S, market_data.r
+        rng = np.random.default_rng(self._seed())
+
+        total = total_sq = delta = gamma = bar_r = 0.0
+        bar_model: Any = 0.0
+        n_samples = 0
+        remaining = self.n_paths
+        while remaining > 0:
+            size = min(self.chunk_size, remaining)
+            payoff, chunk = self._adjoint_chunk(rng, size, schedule, model, option, S, r)
+            if self.antithetic:
+                payoff = 0.5 * (payoff[: size // 2] + payoff[size // 2 :])
+            total += payoff.sum()
+            total_sq += np.dot(payoff, payoff)
+            n_samples += payoff.size
+            delta += chunk["delta"]
+            gamma += chunk["gamma"]
+            bar_r += chunk["rho"]
+            bar_model = bar_model + chunk["model"]
+            remaining -= size
+
+        discount = np.exp(-r * option.T)
+        scale = discount / self.n_paths
+        mean = total / n_samples
+        price = float(discount * mean)
+        variance = max(total_sq / n_samples - mean**2, 0.0)
+        gradient = np.asarray(scale * bar_model, dtype=float)
+        greeks = {
+            "delta": float(scale * delta),
+            "gamma": float(scale * gamma) if isinstance(model, GBMModel) else None,
+            "vega": float(gradient.sum()),
+            "rho": float(scale * bar_r - option.T * price),
+        }
+        result = PricingResult(
+            price=price,
+            std_error=float(discount * np.sqrt(variance / max(n_samples - 1, 1))),
+            elapsed=time.perf_counter() - start,
+            **greeks,
+        )
+        return AdjointResult(result=result, model_gradient=gradient)
+
+    @staticmethod
+    def _check_adjoint(option: Option, model: Model) -> None:
+        """
+        检查期权和模型是否支持伴随法（在模拟之前拒绝，避免算到一半才失败）
+
+        参数:
+            option: 期权对象
+            model: 标的动态模型
+
+        抛出:
+            ValueError: 如果期权没有实现 payoff_gradient 或模型没有实现 step_vjp
+        """
+        if type(option).payoff_gradient is Option.payoff_gradient:
+            raise ValueError(
+                f"{type(option).__name__} 的收益不可导，伴随法不适用，请使用扰动法 Greeks"
+            )
+        if type(model).step_vjp is Model.step_vjp:
+            raise ValueError(f"{type(model).__name__} 没有伴随实现，请使用扰动法 Greeks")
+
+    def _seed(self) -> int:
+        """返回本次定价使用的随机数种子（未指定时随机生成）"""
+        if self.seed is not None:
+            return self.seed
+        return int(np.random.SeedSequence().generate_state(1)[0])
+
+    def simulation_schedule(self, option: Option) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        确定需要模拟的时间点
+
+        参数:
+            option: 期权对象
+
+        返回:
+            (模拟时间点, 观察日在模拟时间点中的下标, 各模拟时间点的分红金额)
+        """
+        if not isinstance(option, ExoticOption):
+            return np.array([option.T]), np.array([0]), np.zeros(1)
+        if option.observation_dates is not None:
+            observed = np.asarray(option.observation_dates)
+        else:
+            observed = option.T * np.arange(1, self.n_steps + 1) / self.n_steps
+        dividend_times = np.array([t for t, _ in option.dividends])
+        times = np.union1d(observed, dividend_times)
+        amounts = np.zeros(times.size)
+        for t, amount in option.dividends:
+            amounts[np.searchsorted(times, t)] += amount
+        return times, np.searchsorted(times, observed), amounts
+
+    def _estimate(
+        self,
+        options: List[Option],
+        schedule: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        model: Model,
+        S: float,
+        r: float,
+        seed: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        模拟全部路径并估计各合约的折现收益均值
+
+        参数:
+            options: 共享模拟时间点的期权列表（在同一组路径上计算收益）
+            schedule: simulation_schedule 的返回值
+            model: 标的动态模型
+            S: 标的资产当前价格
+            r: 无风险利率
+            seed: 随机数种子（相同种子产生相同的随机数，用于公共随机数 Greeks）
+
+        返回:
+            (价格数组, 标准误数组)
+        """
+        rng = np.random.default_rng(seed)
+        total = np.zeros(len(options))
+        total_sq = np.zeros(len(options))
+        n_samples = 0
+        remaining = self.n_paths
+        while remaining > 0:
+            size = min(self.chunk_size, remaining)
+            observed = self._simulate_chunk(rng, size, schedule, model, S, r)
+            survival: Dict[Tuple[float, str], np.ndarray] = {}
+            for j, option in enumerate(options):
+                barrier = (
+                    option.continuous_barrier() if isinstance(option, ExoticOption) else None
+                )
+                if barrier is not None:
+                    if barrier not in survival:
+                        survival[barrier] = self._bridge_survival(
+                            observed, schedule, model, S, barrier
+                        )
+                    payoff = option.payoff(observed, survival[barrier])  # type: ignore[call-arg]
+                elif isinstance(option, ExoticOption):
+                    payoff = option.payoff(observed)
+                else:
+                    payoff = option.payoff(observed[:, -1])
+                if self.antithetic:
+                    half = size // 2
+                    payoff = 0.5 * (payoff[:half] + payoff[half:])
+                total[j] += payoff.sum()
+                total_sq[j] += np.dot(payoff, payoff)
+            n_samples += size // 2 if self.antithetic else size
+            remaining -= size
+
+        discount = np.exp(-r * np.array([option.T for option in options]))
+        mean = total / n_samples
+        variance = np.maximum(total_sq / n_samples - mean**2, 0.0)
+        return discount * mean, discount * np.sqrt(variance / max(n_samples - 1, 1))
+
+    def _bridge_survival(
+        self,
+        observed: np.ndarray,
+        schedule: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        model: Model,
+        S: float,
+        barrier: Tuple[float, str],
+    ) -> np.ndarray:
+        """
+        计算各路径在相邻观察点之间均未触及连续观察障碍的条件概率（布朗桥）
+
+        区间内对数价格近似为方差率 v 的布朗桥，两端都未触及障碍 H 时区间内穿越的概率为
+        exp(-2 ln(S_k / H) ln(S_k+1 / H) / (v dt))。几何布朗运动下精确（含除息的区间除外），
+        局部波动率取区间起点的局部方差，其余模型取 volatility_scale 的平方
+
+        参数:
+            observed: 观察日价格，形状为 (路径数, 观察日数)
+            schedule: simulation_schedule 的返回值
+            model: 标的动态模型
+            S: 标的资产当前价格
+            barrier: (障碍价格, 方向)
+
+        返回:
+            未触及障碍的概率，形状为 (路径数,)；某一端已触及障碍的路径为 0
+        """
+        times, observed_index, _ = schedule
+        dates = np.concatenate([[0.0], times[observed_index]])
+        level = barrier[0]
+        survival = np.ones(observed.shape[0])
+        start = np.full(observed.shape[0], float(S))
+        log_start = np.full(observed.shape[0], np.log(S / level))
+        for k in range(observed.shape[1]):
+            # 除息后价格可能为 0，取下限避免 log(0)
+            log_end = np.log(np.maximum(observed[:, k], 1e-300) / level)
+            if isinstance(model, LocalVolModel):
+                variance = model.local_vol(start, dates[k]) ** 2
+            else:
+                variance = model.volatility_scale**2
+            dt = dates[k + 1] - dates[k]
+            survival *= -np.expm1(-2.0 * np.maximum(log_start * log_end, 0.0) / (variance * dt))
+            start, log_start = observed[:, k], log_end
+        return survival
+
+    def _simulate_chunk(
+        self,
+        rng: np.random.Generator,
+        size: int,
+        schedule: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        model: Model,
+        S: float,
+        r: float,
+    ) -> np.ndarray:
+        """
+        在模拟时间点之间推进一块路径
+
+        参数:
+            rng: 随机数生成器
+            size: 本块路径数（对偶变量时前后两半互为对偶）
+            schedule: simulation_schedule 的返回值
+            model: 标的动态模型
+            S: 标的资产当前价格
+            r: 无风险利率
+
+        返回:
+            观察日价格，形状为 (size, 观察日数)
+        """
+        times, observed_index, amounts = schedule
+        observed = np.empty((size, observed_index.size))
+        is_observed = np.zeros(times.size, dtype=bool)
+        is_observed[observed_index] = True
+        column = 0
+        spot = np.full(size, float(S))
+        state = model.initial_state(size)
+        previous = 0.0
+        for k, t in enumerate(times):
+            n_sub = 1 if model.exact_transition else int(np.ceil((t - previous) / self.max_step))
+            dt = (t - previous) / n_sub
+            for j in range(n_sub):
+                if self.antithetic:
+                    Z = rng.standard_normal((model.n_factors, size // 2))
+                    Z = np.concatenate([Z, -Z], axis=1)
+                else:
+                    Z = rng.standard_normal((model.n_factors, size))
+                spot, state = model.step(spot, state, previous + j * dt, dt, r, Z)
+            previous = t
+            if amounts[k]:
+                # 除息：价格下跳分红金额（不低于 0），观察日看到的是除息后价格
+                spot = np.maximum(spot - amounts[k], 0.0)
+            if is_observed[k]:
+                observed[:, column] = spot
+                column += 1
+        return observed
+
+    def _adjoint_chunk(
+        self,
+        rng: np.random.Generator,
+        size: int,
+        schedule: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        model: Model,
+        option: Option,
+        S: float,
+        r: float,
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        前向模拟一块路径并记录每个子步，再反向传播收益的导数
+
+        随机数的生成顺序与 _simulate_chunk 相同，同一种子下价格与扰动法一致
+
+        参数:
+            rng: 随机数生成器
+            size: 本块路径数
+            schedule: simulation_schedule 的返回值
+            model: 标的动态模型
+            option: 期权对象
+            S: 标的资产当前价格
+            r: 无风险利率
+
+        返回:
+            (各路径收益, 未折现的伴随累计量 {"delta", "gamma", "rho", "model"})
+        """
+        times, observed_index, amounts = schedule
+        is_observed = np.zeros(times.size, dtype=bool)
+        is_observed[observed_index] = True
+        observed = np.empty((size, observed_index.size))
+        # 每个模拟时间点的子步记录：(步首时间, 步长, 步首价格, 随机数, 步末价格)
+        tape: List[List[Tuple[float, float, np.ndarray, np.ndarray, np.ndarray]]] = []
+        ex_dividend: List[Optional[np.ndarray]] = []
+        spot = np.full(size, float(S))
+        state = model.initial_state(size)
+        previous, column = 0.0, 0
+        for k, t in enumerate(times):
+            n_sub = 1 if model.exact_transition else int(np.ceil((t - previous) / self.max_step))
+            dt = (t - previous) / n_sub
+            steps = []
+            for j in range(n_sub):
+                if self.antithetic:
+                    Z = rng.standard_normal((model.n_factors, size // 2))
+                    Z = np.concatenate([Z, -Z], axis=1)
+                else:
+                    Z = rng.standard_normal((model.n_factors, size))
+                next_spot, state = model.step(spot, state, previous + j * dt, dt, r, Z)
+                steps.append((previous + j * dt, dt, spot, Z, next_spot))
+                spot = next_spot
+            tape.append(steps)
+            previous = t
+            ex_dividend.append(spot if amounts[k] else None)
+            if amounts[k]:
+                spot = np.maximum(spot - amounts[k], 0.0)
+            if is_observed[k]:
+                observed[:, column] = spot
+                column += 1
+
+        if isinstance(option, ExoticOption):
+            payoff = option.payoff(observed)
+            gradient = option.payoff_gradient(observed)
+        else:
+            payoff = option.payoff(observed[:, -1])
+            gradient = option.payoff_gradient(observed[:, -1])[:, np.newaxis]
+
+        bar_spot = np.zeros(size)
+        bar_r = 0.0
+        bar_model: Any = 0.0
+        for k in range(times.size - 1, -1, -1):
+            if is_observed[k]:
+                column -= 1
+                bar_spot = bar_spot + gradient[:, column]
+            before_dividend = ex_dividend[k]
+            if before_dividend is not None:
+                bar_spot = bar_spot * (before_dividend > amounts[k])
+            for t, dt, start, Z, end in reversed(tape[k]):
+                first_Z, first_dt = Z, dt
+                bar_spot, bar_r_step, bar_params = model.step_vjp(start, t, dt, r, Z, end, bar_spot)
+                bar_r += bar_r_step
+                bar_model = bar_model + bar_params
+
+        chunk: Dict[str, Any] = {
+            "delta": bar_spot.sum(),
+            "gamma": 0.0,
+            "rho": bar_r,
+            "model": bar_model,
+        }
+        if isinstance(model, GBMModel):
+            # 首步似然比：d ln p(S_1 | S_0) / d S_0 = Z_1 / (S_0 sigma sqrt(dt_1))，
+            # pathwise Delta 为 h(S_1) / S_0 的形式，再对 S_0 求导得到 Gamma
+            score = first_Z[0] / (S * model.sigma * np.sqrt(first_dt)) - 1.0 / S
+            chunk["gamma"] = np.dot(bar_spot, score)
+        return payoff, chunk
+
+    def __repr__(self) -> str:
+        """
+        返回定价方法的字符串表示
+
+        返回:
+            定价方法的描述字符串
+        """
+        return (
+            f"MCPricing(n_paths={self.n_paths}, n_steps={self.n_steps}, "
+            f"antithetic={self.antithetic}, model={self.model!r})"
+        )
@@ -0,0 +1,186 @@
+"""
+多资产蒙特卡洛定价模块
+
+在相关几何布朗运动下为篮子、价差、彩虹等多资产期权定价
+
+相关系数矩阵的 Cholesky 分解按矩阵内容缓存，每个相关矩阵只分解一次；
+相关正态变量以 (路径数, 资产数) 矩阵与 Cholesky 因子相乘的方式批量生成，
+路径按块模拟，内存占用只取决于 chunk_size 和资产数量，与总路径数无关
+"""
+
+import time
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..options.multi_asset_option import MultiAssetOption
+from ..utils.market_data import CORRELATION_TOLERANCE, MultiAssetMarketData
+from .base import PricingMethod, PricingResult
+
+
+@lru_cache(maxsize=32)
+def cholesky_factor(correlation: Tuple[Tuple[float, ...], ...]) -> np.ndarray:
+    """
+    计算相关系数矩阵的因子 L（按矩阵内容缓存）
+
+    正定矩阵返回下三角 Cholesky 因子；半正定矩阵（如完全相关的资产）没有 Cholesky 分解，
+    改用特征分解因子 V sqrt(max(Λ, 0))
+
+    参数:
+        correlation: 相关系数矩阵（元组形式，可哈希）
+
+    返回:
+        只读矩阵 L，满足 L @ L.T == correlation
+
+    抛出:
+        ValueError: 如果矩阵不是半正定的
+    """
+    matrix = np.array(correlation, dtype=float).reshape(len(correlation), -1)
+    try:
+        factor = np.linalg.cholesky(matrix)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+        if eigenvalues.min() < -CORRELATION_TOLERANCE:
+            raise ValueError(
+                f"相关系数矩阵必须半正定，当前最小特征值: {eigenvalues.min():.3g}"
+            ) from None
+        factor = eigenvectors * np.sqrt(np.maximum(eigenvalues, 0.0))
+    factor.setflags(write=False)
+    return factor
+
+
+class MultiAssetMCPricing(PricingMethod):
+    """
+    多资产蒙特卡洛定价方法
+
+    按精确解一步模拟到期价格：
+    ln S_T = ln S_0 + (r - sigma^2 / 2) T + sigma sqrt(T) (Z L^T)，
+    Z 为独立标准正态矩阵，L 为相关矩阵的 Cholesky 因子（半正定时为特征分解因子）
+
+    只返回价格和标准误；多资产 Greeks 是向量，不适合 PricingResult 的标量字段
+    """
+
+    def __init__(
+        self,
+        n_paths: int = 100_000,
+        chunk_size: int = 16_384,
+        antithetic: bool = True,
+        seed: Optional[int] = None,
+    ):
+        """
+        初始化多资产蒙特卡洛定价方法
+
+        参数:
+            n_paths: 模拟路径总数
+            chunk_size: 每块模拟的路径数（限制单块内存）
+            antithetic: 是否使用对偶变量降低方差
+            seed: 随机数种子；None 时每次定价使用不同的随机数
+
+        抛出:
+            ValueError: 如果参数无效
+        """
+        if n_paths <= 0:
+            raise ValueError(f"路径数 n_paths 必须大于 0，当前值: {n_paths}")
+        if chunk_size <= 0:
+            raise ValueError(f"分块大小 chunk_size 必须大于 0，当前值: {chunk_size}")
+        if antithetic and (n_paths % 2 or chunk_size % 2):
+            raise ValueError("使用对偶变量时 n_paths 和 chunk_size 必须为偶数")
+        self.n_paths = n_paths
+        self.chunk_size = chunk_size
+        self.antithetic = antithetic
+        self.seed = seed
+
+    def price(
+        self,
+        option: MultiAssetOption,
+        market_data: MultiAssetMarketData,
+    ) -> PricingResult:
+        """
+        计算多资产期权价格
+
+        参数:
+            option: 多资产期权对象（收益只依赖到期价格）
+            market_data: 多资产市场数据
+
+        返回:
+            PricingResult 对象，包含价格、标准误和计算耗时
+
+        抛出:
+            ValueError: 如果期权与市场数据的资产数量不一致，或相关矩阵不是半正定的
+        """
+        start = time.perf_counter()
+        if option.n_assets != market_data.n_assets:
+            raise ValueError(
+                f"期权资产数量与市场数据不一致: {option.n_assets} != {market_data.n_assets}"
+            )
+        factor = cholesky_factor(market_data.correlation)
+        S0 = np.asarray(market_data.S)
+        sigma = np.asarray(market_data.sigma)
+        T = option.T
+        drift = np.log(S0) + (market_data.r - 0.5 * sigma**2) * T
+        # 把波动率缩放并入 Cholesky 因子：X = Z @ (L^T * sigma sqrt(T))
+        scaled_factor_t = factor.T * (sigma * np.sqrt(T))
+
+        rng = np.random.default_rng(self.seed)
+        total = total_sq = 0.0
+        n_samples = 0
+        remaining = self.n_paths
+        while remaining > 0:
+            size = min(self.chunk_size, remaining)
+            samples = self._simulate_chunk(option, rng, size, drift, scaled_factor_t)
+            total += samples.sum()
+            total_sq += np.dot(samples, samples)
+            n_samples += samples.size
+            remaining -= size
+
+        discount = np.exp(-market_data.r * T)
+        mean = total / n_samples
+        variance = max(total_sq / n_samples - mean**2, 0.0)
+        std_error = discount * np.sqrt(variance / max(n_samples - 1, 1))
+        return PricingResult(
+            price=float(discount * mean),
+            std_error=float(std_error),
+            elapsed=time.perf_counter() - start,
+        )
+
+    def _simulate_chunk(
+        self,
+        option: MultiAssetOption,
+        rng: np.random.Generator,
+        size: int,
+        drift: np.ndarray,
+        scaled_factor_t: np.ndarray,
+    ) -> np.ndarray:
+        """
+        模拟一块路径并计算收益样本
+
+        参数:
+            option: 多资产期权
+            rng: 随机数生成器
+            size: 本块路径数
+            drift: 各资产的对数漂移项（含 ln S_0）
+            scaled_factor_t: 按波动率缩放的相关矩阵因子转置
+
+        返回:
+            独立收益样本；使用对偶变量时为每对路径的平均收益
+        """
+        n_draws = size // 2 if self.antithetic else size
+        Z = rng.standard_normal((n_draws, drift.size))
+        X = Z @ scaled_factor_t
+        payoff = option.payoff(np.exp(drift + X))
+        if not self.antithetic:
+            return payoff
+        return 0.5 * (payoff + option.payoff(np.exp(drift - X)))
+
+    def __repr__(self) -> str:
+        """
+        返回定价方法的字符串表示
+
+        返回:
+            定价方法的描述字符串
+        """
+        return (
+            f"MultiAssetMCPricing(n_paths={self.n_paths}, chunk_size={self.chunk_size}, "
+            f"antithetic={self.antithetic})"
+        )
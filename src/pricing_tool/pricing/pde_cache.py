@@ -0,0 +1,17 @@
+"""
+PDE 算子缓存模块
+
+按 (sigma, r, 网格规格, dt) 缓存组装好的三对角算子及其 LU 分解，
+同一标的、波动率、利率和期限桶下仅执行价或障碍不同的合约可直接复用，
+批量重估时只剩回代求解的开销
+"""
+
+from .computation_cache import ComputationCache
+
+
+class PDEOperatorCache(ComputationCache):
+    """
+    有界 LRU 算子缓存（线程安全）
+
+    超过容量时淘汰最久未使用的条目
+    """
@@ -0,0 +1,927 @@
+"""
+PDE 定价模块
+
+使用有限差分法（Crank-Nicolson + Rannacher 启动步）在对数价格网格上
+求解 Black-Scholes 偏微分方程
+
+网格在对数空间均匀分布、一般以现价为中心，因此离散算子只依赖 (sigma, r, 网格规格, dt)，
+与现价、执行价和障碍无关。连续观察的敲出障碍落在网格半宽之内时，网格改为在障碍处截断
+（障碍恰为边界节点，取零边界），消除障碍落在节点之间带来的一阶误差，
+此时网格依赖现价和障碍，按二者分组。组装好的算子及其 LU 分解缓存在 PDEOperatorCache 中，
+共享网格的合约（同一波动率、利率和期限）只需回代求解；price_batch 进一步把
+同组合约作为多个右端项一次性求解
+
+离散观察日和除息日作为事件日期：时间网格在事件日期处分段对齐，
+在观察日施加期权的跳跃条件，在除息日按 V(S, t-) = V(S - D, t+) 平移解
+
+标的动态可以是几何布朗运动（默认）或局部波动率模型；局部波动率的系数随时间和价格变化，
+算子按时间层重建（不缓存），仍对共享现价的合约做多右端项求解。
+Heston 等二维模型使用 ADIPricing
+"""
+
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.base import Model
+from ..models.gbm import GBMModel
+from ..models.local_vol import LocalVolModel
+from ..options.base import Option
+from ..options.exotic import Dividend, ExoticOption
+from ..utils.market_data import MarketData
+from .adjoint import GREEK_METHODS, AdjointResult, interp_adjoint
+from .base import PricingMethod, PricingResult, pair_market_data
+from .computation_cache import ComputationCache
+from .pde_cache import PDEOperatorCache
+
+# 边界处理方式：普通期权使用线性渐近边界（V_SS = 0），奇异期权使用其 boundary_condition
+_LINEAR = "linear"
+_DIRICHLET = "dirichlet"
+
+# 事件日程：(到期前需要施加跳跃条件的观察日, 分红日程, 是否连续观察)
+_Events = Tuple[Tuple[float, ...], Tuple[Dividend, ...], bool]
+
+
+class _PDEOperators:
+    """
+    一组可复用的离散算子
+
+    Crank-Nicolson 步 (I - dt/2 L) V' = (I + dt/2 L) V 与 Rannacher 隐式半步
+    (I - dt/2 L) V' = V 的左端矩阵相同，因此只需一次三对角 LU 分解（LAPACK gttrf），
+    之后每个时间步只做回代（gttrs），所有合约作为多个右端项一起求解
+    """
+
+    __slots__ = ("bands", "factors")
+
+    def __init__(
+        self,
+        bands: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        factors: Tuple[Any, ...],
+    ):
+        self.bands = bands
+        self.factors = factors
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        """
+        求解 (I - dt/2 L) V' = rhs
+
+        参数:
+            rhs: 右端项，形状为 (网格节点数, 合约数)
+
+        返回:
+            解，形状与 rhs 相同
+        """
+        from scipy.linalg.lapack import dgttrs
+
+        solution, info = dgttrs(*self.factors, rhs)
+        if info != 0:
+            raise RuntimeError(f"三对角回代失败，LAPACK info = {info}")
+        return solution
+
+    def solve_transposed(self, rhs: np.ndarray) -> np.ndarray:
+        """
+        求解 (I - dt/2 L)^T x = rhs（伴随扫描使用，复用同一 LU 分解）
+
+        参数:
+            rhs: 右端项，形状为 (网格节点数, 合约数)
+
+        返回:
+            解，形状与 rhs 相同
+        """
+        from scipy.linalg.lapack import dgttrs
+
+        solution, info = dgttrs(*self.factors, rhs, trans="T")
+        if info != 0:
+            raise RuntimeError(f"三对角回代失败，LAPACK info = {info}")
+        return solution
+
+    def explicit_transposed(self, V: np.ndarray) -> np.ndarray:
+        """
+        计算 (I + dt/2 L)^T V（伴随扫描使用）
+
+        参数:
+            V: 伴随变量，形状为 (网格节点数, 合约数)
+
+        返回:
+            结果（Fortran 连续）
+        """
+        lower, main, upper = self.bands
+        result = np.empty_like(V, order="F")
+        np.multiply(main[:, np.newaxis], V, out=result)
+        result[:-1] += lower[:, np.newaxis] * V[1:]
+        result[1:] += upper[:, np.newaxis] * V[:-1]
+        return result
+
+    def explicit(self, V: np.ndarray) -> np.ndarray:
+        """
+        计算 Crank-Nicolson 右端 (I + dt/2 L) V
+
+        参数:
+            V: 当前时间层的解，形状为 (网格节点数, 合约数)
+
+        返回:
+            右端项（Fortran 连续，可直接用于回代）
+        """
+        lower, main, upper = self.bands
+        rhs = np.empty_like(V, order="F")
+        np.multiply(main[:, np.newaxis], V, out=rhs)
+        rhs[1:] += lower[:, np.newaxis] * V[:-1]
+        rhs[:-1] += upper[:, np.newaxis] * V[1:]
+        return rhs
+
+
+def _build_operators(
+    mode: str,
+    sigma: Union[float, np.ndarray],
+    r: float,
+    n_space: int,
+    dx: float,
+    dt: float,
+) -> _PDEOperators:
+    """
+    组装三对角算子并做 LU 分解
+
+    参数:
+        mode: 边界处理方式（"linear" 或 "dirichlet"）
+        sigma: 波动率（常数，或长度为 n_space + 1 的各网格节点波动率）
+        r: 无风险利率
+        n_space: 空间网格区间数
+        dx: 对数价格步长
+        dt: 时间步长
+
+    返回:
+        _PDEOperators 对象
+
+    抛出:
+        RuntimeError: 如果分解失败（矩阵奇异）
+    """
+    from scipy.linalg.lapack import dgttrf
+
+    n = n_space + 1
+    variance = np.broadcast_to(np.asarray(sigma, dtype=float) ** 2, (n,))
+    a = 0.5 * variance / dx**2
+    b = (r - 0.5 * variance) / (2.0 * dx)
+    lower = (a - b)[1:]
+    main = -2.0 * a - r
+    upper = (a + b)[:-1].copy()
+
+    if mode == _LINEAR:
+        # 边界处 V_SS = 0，即 dV/dtau = r V_x - r V，V_x 取单侧差分
+        main[0], upper[0] = -r / dx - r, r / dx
+        lower[-1], main[-1] = -r / dx, r / dx - r
+    else:
+        # Dirichlet 边界：L 的边界行为零，左端在边界行是单位行，右端在求解前直接覆盖
+        main[0] = upper[0] = 0.0
+        lower[-1] = main[-1] = 0.0
+
+    half = 0.5 * dt
+    *factors, info = dgttrf(-half * lower, 1.0 - half * main, -half * upper)
+    if info != 0:
+        raise RuntimeError(f"三对角分解失败，LAPACK info = {info}")
+    return _PDEOperators(
+        bands=(half * lower, 1.0 + half * main, half * upper),
+        factors=tuple(factors),
+    )
+
+
+class PDEPricing(PricingMethod):
+    """
+    有限差分 PDE 定价方法
+
+    在 x = ln(S / S0) 的均匀网格上求解 Black-Scholes PDE，时间方向使用
+    Crank-Nicolson 格式，首个时间步（以及每个事件日之后的第一步）替换为两个隐式半步
+    （Rannacher 平滑）以抑制非光滑收益带来的振荡。Delta、Gamma 由网格差分得到，
+    Theta 由最后一个时间步得到，Vega、Rho 通过在同一网格上扰动参数重新求解（扰动后的算子同样进入缓存）
+
+    市场状态（S、r，未指定模型时还有 sigma）取自 MarketData，
+    合约条款（收益、到期时间 T）取自期权对象。局部波动率模型在扰动法下不计算 Vega
+
+    greeks="adjoint" 时 Vega、Rho 改由一次伴随扫描得到（复用前向求解的 LU 分解，
+    实测约为只求价格的 2-4 倍：前向求解需记录每层的解，反向每步一次转置回代），
+    sensitivities 另给出模型参数梯度：局部波动率模型为 local_vols 网格上每个节点的分桶 Vega，
+    扰动法需为每个节点重新求解两次
+    """
+
+    def __init__(
+        self,
+        n_space: int = 200,
+        n_time: int = 200,
+        n_std: float = 5.0,
+        rannacher: bool = True,
+        compute_greeks: bool = True,
+        vega_bump: float = 0.01,
+        rho_bump: float = 1e-4,
+        cache: Optional[ComputationCache] = None,
+        model: Optional[Model] = None,
+        greeks: str = "bump",
+    ):
+        """
+        初始化 PDE 定价方法
+
+        参数:
+            n_space: 空间网格区间数（必须为偶数，使现价落在网格中心节点）
+            n_time: 时间步数
+            n_std: 网格半宽，以 sigma * sqrt(T) 的倍数表示
+            rannacher: 是否使用 Rannacher 启动步
+            compute_greeks: 是否计算 Greeks
+            vega_bump: Vega 的相对波动率扰动（中心差分）
+            rho_bump: Rho 的绝对利率扰动（中心差分）
+            cache: 算子缓存；None 时为本实例创建一个新缓存，
+                多个定价实例可传入同一缓存以共享分解结果
+            model: 标的动态模型（GBMModel 或 LocalVolModel）；
+                None 时使用 MarketData.sigma 的几何布朗运动
+            greeks: Vega、Rho 的计算方式，"bump"（扰动重新求解）或 "adjoint"（伴随扫描）
+
+        抛出:
+            ValueError: 如果网格参数无效或模型不是一维模型
+        """
+        if n_space < 4 or n_space % 2:
+            raise ValueError(f"空间网格数 n_space 必须是不小于 4 的偶数，当前值: {n_space}")
+        if n_time < 2:
+            raise ValueError(f"时间步数 n_time 必须不小于 2，当前值: {n_time}")
+        if n_std <= 0:
+            raise ValueError(f"网格半宽 n_std 必须大于 0，当前值: {n_std}")
+        if greeks not in GREEK_METHODS:
+            raise ValueError(f"不支持的 Greeks 计算方式: {greeks}，可选值: {GREEK_METHODS}")
+        self.n_space = n_space
+        self.n_time = n_time
+        self.n_std = n_std
+        self.rannacher = rannacher
+        self.compute_greeks = compute_greeks
+        self.vega_bump = vega_bump
+        self.rho_bump = rho_bump
+        self.greeks = greeks
+        if model is not None and not isinstance(model, (GBMModel, LocalVolModel)):
+            raise ValueError(
+                f"PDEPricing 只支持一维模型，{type(model).__name__} 请使用 ADIPricing"
+            )
+        self.cache = cache if cache is not None else PDEOperatorCache()
+        self.model = model
+
+    def price(
+        self,
+        option: Option,
+        market_data: MarketData,
+    ) -> PricingResult:
+        """
+        计算期权价格和 Greeks
+
+        参数:
+            option: 期权对象实例（收益只依赖到期价格）
+            market_data: 市场数据对象
+
+        返回:
+            PricingResult 对象，包含价格、Greeks 和计算耗时
+        """
+        return self.price_batch([option], market_data)[0]
+
+    def price_batch(
+        self,
+        options: Sequence[Option],
+        market_data: Union[MarketData, Sequence[MarketData]],
+    ) -> List[PricingResult]:
+        """
+        批量计算期权价格和 Greeks
+
+        共享 (模型, r, T, 边界方式, 事件日程) 的合约归为一组
+        （局部波动率模型和连续观察障碍的网格依赖现价，还需共享现价和障碍），组内合约作为同一个
+        三对角系统的多个右端项一起回代求解。可分解的期权（如敲入期权）先展开为
+        分量期权分别求解，再按权重线性组合
+
+        参数:
+            options: 期权对象序列
+            market_data: 共用的市场数据，或与 options 一一对应的市场数据序列
+
+        返回:
+            与 options 顺序一致的 PricingResult 列表，elapsed 为组内平均耗时
+
+        抛出:
+            ValueError: 如果期权不支持 PDE 定价
+        """
+        adjoint = self.compute_greeks and self.greeks == "adjoint"
+        totals = self._price_totals(options, market_data, adjoint)
+        for total in totals:
+            total.pop("model_gradient", None)
+        return [PricingResult(**total) for total in totals]
+
+    def sensitivities(self, option: Option, market_data: MarketData) -> AdjointResult:
+        """
+        用伴随法计算价格、Greeks 和模型参数梯度
+
+        参数:
+            option: 期权对象实例
+            market_data: 市场数据对象
+
+        返回:
+            AdjointResult 对象
+        """
+        return self.sensitivities_batch([option], market_data)[0]
+
+    def sensitivities_batch(
+        self,
+        options: Sequence[Option],
+        market_data: Union[MarketData, Sequence[MarketData]],
+    ) -> List[AdjointResult]:
+        """
+        批量用伴随法计算价格、Greeks 和模型参数梯度
+
+        分组方式与 price_batch 相同，组内所有合约的伴随变量作为多个右端项一起回代
+
+        参数:
+            options: 期权对象序列
+            market_data: 共用的市场数据，或与 options 一一对应的市场数据序列
+
+        返回:
+            与 options 顺序一致的 AdjointResult 列表
+        """
+        results = []
+        for total in self._price_totals(options, market_data, adjoint=True):
+            gradient = np.asarray(total.pop("model_gradient"), dtype=float)
+            results.append(AdjointResult(result=PricingResult(**total), model_gradient=gradient))
+        return results
+
+    def _price_totals(
+        self,
+        options: Sequence[Option],
+        market_data: Union[MarketData, Sequence[MarketData]],
+        adjoint: bool,
+    ) -> List[Dict[str, Any]]:
+        """
+        分组求解并按分量权重汇总每个期权的结果字段
+
+        参数:
+            options: 期权对象序列
+            market_data: 共用的市场数据，或与 options 一一对应的市场数据序列
+            adjoint: 是否用伴随扫描计算 Vega、Rho 和模型参数梯度
+
+        返回:
+            与 options 顺序一致的结果字段字典列表
+        """
+        pairs = pair_market_data(options, market_data)
+        entries: List[Tuple[int, float, Option, MarketData]] = []
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        for index, (option, data) in enumerate(pairs):
+            for weight, component in self._components(option):
+                key = self._group_key(component, data)
+                groups.setdefault(key, []).append(len(entries))
+                entries.append((index, weight, component, data))
+
+        totals: List[Dict[str, Any]] = [{} for _ in pairs]
+        for (mode, model, _, r, T, events, barrier), members in groups.items():
+            start = time.perf_counter()
+            group_options = [entries[m][2] for m in members]
+            spots = np.array([entries[m][3].S for m in members])
+            group_results = self._price_group(
+                mode, group_options, spots, model, r, T, events, adjoint, barrier
+            )
+            elapsed = (time.perf_counter() - start) / len(members)
+            for m, result in zip(members, group_results):
+                index, weight = entries[m][0], entries[m][1]
+                total = totals[index]
+                for name, value in result.items():
+                    total[name] = total.get(name, 0.0) + weight * value
+                total["elapsed"] = total.get("elapsed", 0.0) + elapsed
+        return totals
+
+    def batch_key(self, option: Option, market_data: MarketData) -> Hashable:
+        """
+        返回合约在 price_batch 中的分组键
+
+        参数:
+            option: 期权对象
+            market_data: 市场数据对象
+
+        返回:
+            各分量所在求解组的键组成的元组
+
+        抛出:
+            ValueError: 如果期权不支持 PDE 定价
+        """
+        return tuple(
+            self._group_key(component, market_data) for _, component in self._components(option)
+        )
+
+    def _group_key(self, component: Option, market_data: MarketData) -> Tuple[Any, ...]:
+        """
+        返回分量期权的求解组键：(边界方式, 模型, 现价, r, T, 事件日程, 连续观察障碍)
+
+        局部波动率模型和截断在障碍处的网格依赖现价，其余情况现价不参与分组（记为 None）
+        """
+        model = self.model if self.model is not None else GBMModel(market_data.sigma)
+        barrier = (
+            component.continuous_barrier() if isinstance(component, ExoticOption) else None
+        )
+        local = isinstance(model, LocalVolModel) or barrier is not None
+        spot_key = market_data.S if local else None
+        return (
+            self._mode(component),
+            model,
+            spot_key,
+            market_data.r,
+            component.T,
+            self._events(component),
+            barrier,
+        )
+
+    @staticmethod
+    def _mode(option: Option) -> str:
+        """返回期权使用的边界处理方式"""
+        return _DIRICHLET if isinstance(option, ExoticOption) else _LINEAR
+
+    @staticmethod
+    def _components(option: Option) -> List[Tuple[float, Option]]:
+        """
+        返回 PDE 实际求解的 (权重, 期权) 分量
+
+        参数:
+            option: 期权对象
+
+        返回:
+            分量列表；不可分解的期权返回 [(1.0, option)]
+
+        抛出:
+            ValueError: 如果期权不支持 PDE 定价
+        """
+        if not isinstance(option, ExoticOption):
+            return [(1.0, option)]
+        if not option.pde_supported:
+            raise ValueError(f"{type(option).__name__} 不支持 PDE 定价，请使用蒙特卡洛方法")
+        components = option.pde_components()
+        return [(1.0, option)] if components is None else list(components)
+
+    @staticmethod
+    def _events(option: Option) -> _Events:
+        """
+        提取期权的 PDE 事件日程
+
+        只有覆盖了 jump_condition 的期权才需要在观察日施加跳跃条件，
+        其余期权的观察日不影响 PDE 解，不参与分组和时间网格划分
+
+        参数:
+            option: 期权对象
+
+        返回:
+            (到期前的观察日, 分红日程, 是否连续观察)
+        """
+        if not isinstance(option, ExoticOption):
+            return (), (), False
+        if type(option).jump_condition is ExoticOption.jump_condition:
+            return (), option.dividends, False
+        if option.observation_dates is None:
+            return (), option.dividends, True
+        dates = tuple(t for t in option.observation_dates if t < option.T)
+        return dates, option.dividends, False
+
+    def _grid(
+        self,
+        sigma: float,
+        T: float,
+        barrier: Optional[float] = None,
+    ) -> Tuple[np.ndarray, float]:
+        """
+        构建对数价格网格
+
+        默认以现价为中心、半宽 n_std * sigma * sqrt(T)。连续观察的敲出障碍在半宽之内
+        且现价未触及障碍时，网格的一端恰为障碍，另一端延伸到约一个半宽；
+        障碍与现价之间取整数个步长使现价落在节点上（障碍离现价不足半个步长时除外）
+
+        参数:
+            sigma: 波动率（决定网格宽度）
+            T: 到期时间
+            barrier: 障碍相对现价的对数位置 ln(H / S0)（下方为负、上方为正）；None 表示无
+
+        返回:
+            (相对对数价格节点 x（升序）, dx)
+        """
+        n = self.n_space
+        half_width = self.n_std * sigma * np.sqrt(T)
+        if barrier is None or not 0.0 < abs(barrier) < half_width:
+            x = np.linspace(-half_width, half_width, n + 1)
+            return x, x[1] - x[0]
+        distance = abs(barrier)
+        m = int(round(n * distance / (distance + half_width)))
+        dx = distance / m if m >= 1 else (distance + half_width) / n
+        steps = np.arange(n + 1) * dx
+        x = barrier + steps if barrier < 0 else barrier - steps[::-1]
+        return x, dx
+
+    @staticmethod
+    def _spot_stencil(x: np.ndarray, dx: float) -> Tuple[int, np.ndarray]:
+        """
+        现价（x = 0）处的三点插值模板
+
+        现价落在节点上时即为中心差分；否则为过相邻三个节点的二次插值
+
+        参数:
+            x: 相对对数价格节点
+            dx: 对数价格步长
+
+        返回:
+            (中间节点下标 i, 形状为 (3, 3) 的权重：各行依次为值、V_x、V_xx
+            在节点 i-1, i, i+1 上的权重)
+        """
+        i = int(np.clip(np.rint(-x[0] / dx), 1, x.size - 2))
+        s = -x[i] / dx
+        weights = np.array(
+            [
+                [0.5 * s * (s - 1.0), 1.0 - s * s, 0.5 * s * (s + 1.0)],
+                [(s - 0.5) / dx, -2.0 * s / dx, (s + 0.5) / dx],
+                [1.0 / dx**2, -2.0 / dx**2, 1.0 / dx**2],
+            ]
+        )
+        return i, weights
+
+    def _segments(self, T: float, events: _Events) -> List[Tuple[float, int, float]]:
+        """
+        按事件日期把 [0, T] 切分为若干时间段
+
+        每段的步数与段长成正比（合计约 n_time 步），事件日期恰好落在时间层上。
+        步长舍入到 12 位小数，使等长的段（如每月观察）共用缓存中的同一组算子
+
+        参数:
+            T: 到期时间
+            events: _events 的返回值
+
+        返回:
+            从到期日向前排列的 (段起点时间, 步数, 步长) 列表
+        """
+        jump_dates, dividends, _ = events
+        stops = sorted({0.0, T} | set(jump_dates) | {t for t, _ in dividends}, reverse=True)
+        segments = []
+        for t_high, t_low in zip(stops[:-1], stops[1:]):
+            length = t_high - t_low
+            n_steps = max(1, int(round(self.n_time * length / T)))
+            segments.append((t_low, n_steps, round(length / n_steps, 12)))
+        return segments
+
+    def _operators(
+        self,
+        mode: str,
+        model: Model,
+        r: float,
+        dx: float,
+        dt: float,
+        S: np.ndarray,
+        t: float,
+    ) -> _PDEOperators:
+        """
+        获取一个时间步的算子
+
+        几何布朗运动的算子与时间无关，从缓存获取，未命中时组装并分解；
+        局部波动率的算子按 t 时刻各网格节点的波动率直接组装
+
+        参数:
+            mode: 边界处理方式
+            model: 标的动态模型
+            r: 无风险利率
+            dx: 对数价格步长
+            dt: 时间步长
+            S: 价格网格（同组合约共享，取第一列）
+            t: 时间步中点对应的日历时间
+
+        返回:
+            _PDEOperators 对象
+        """
+        if isinstance(model, LocalVolModel):
+            return _build_operators(mode, model.local_vol(S, t), r, self.n_space, dx, dt)
+        sigma = model.sigma  # type: ignore[attr-defined]
+        key = (mode, sigma, r, self.n_space, dx, dt)
+        return self.cache.get_or_build(
+            key, lambda: _build_operators(mode, sigma, r, self.n_space, dx, dt)
+        )
+
+    def _solve(
+        self,
+        mode: str,
+        options: Sequence[Option],
+        S_grid: np.ndarray,
+        model: Model,
+        r: float,
+        T: float,
+        dx: float,
+        events: _Events,
+        tape: Optional[List[Tuple[Any, ...]]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        从到期日向后求解到当前时刻
+
+        在每个观察日施加期权的 jump_condition（连续观察时每个时间步之后施加），
+        在每个除息日令 V(S, t-) = V(S - D, t+)（网格上线性插值）。
+        事件处收益不光滑，因此每个事件之后重新做 Rannacher 启动步
+
+        参数:
+            mode: 边界处理方式
+            options: 同组期权
+            S_grid: 价格网格，形状为 (n_space + 1, 合约数)
+            model: 标的动态模型
+            r: 无风险利率
+            T: 到期时间
+            dx: 对数价格步长
+            events: _events 的返回值
+            tape: 不为 None 时按求解顺序记录每个时间步和事件，供 _adjoint 反向扫描
+
+        返回:
+            (当前时刻的解, 前一个时间层的解, 最后一步的步长)，解的形状为 (n_space + 1, 合约数)
+        """
+        V = np.asfortranarray(
+            np.column_stack([option.payoff(S_grid[:, j]) for j, option in enumerate(options)]),
+            dtype=float,
+        )
+        boundary: Optional[Callable[[float], np.ndarray]] = None
+        boundary_r: Optional[Callable[[float], np.ndarray]] = None
+        if mode == _DIRICHLET:
+            edges = S_grid[[0, -1], :]
+
+            def evaluate(group: Sequence[Option], tau: float) -> np.ndarray:
+                return np.column_stack(
+                    [
+                        option.boundary_condition(edges[:, j], T - tau)
+                        for j, option in enumerate(group)
+                    ]
+                )
+
+            def boundary(tau: float) -> np.ndarray:
+                return evaluate(options, tau)
+
+            if tape is not None:
+                # 边界值（如贴现执行价）依赖利率，伴随扫描需要其对 r 的导数（中心差分）
+                up, down = self._shift_rate(options, self.rho_bump), self._shift_rate(
+                    options, -self.rho_bump
+                )
+
+                def boundary_r(tau: float) -> np.ndarray:
+                    return (evaluate(up, tau) - evaluate(down, tau)) / (2.0 * self.rho_bump)
+
+        jump_dates, dividends, continuous = events
+        amounts: Dict[float, float] = {}
+        for t, amount in dividends:
+            amounts[t] = amounts.get(t, 0.0) + amount
+
+        def jump(V: np.ndarray, t: float) -> np.ndarray:
+            return np.column_stack(
+                [
+                    option.jump_condition(S_grid[:, j], t, V[:, j])  # type: ignore[attr-defined]
+                    for j, option in enumerate(options)
+                ]
+            )
+
+        time_dependent = isinstance(model, LocalVolModel)
+        spots = S_grid[:, 0]
+        # 当前算子对应的 (算子, 组装时刻, 步长)；时间相关系数取步中点，Rannacher 半步的算子与完整步相同
+        current: List[Any] = []
+
+        def use_operators(tau: float, dt: float) -> None:
+            t_mid = T - tau - 0.5 * dt
+            current[:] = [self._operators(mode, model, r, dx, dt, spots, t_mid), t_mid, dt]
+
+        def step(V_in: np.ndarray, explicit: bool, tau: float) -> np.ndarray:
+            operators = current[0]
+            rhs = operators.explicit(V_in) if explicit else np.array(V_in, order="F")
+            if boundary is not None:
+                rhs[[0, -1], :] = boundary(tau)
+            V = operators.solve(rhs)
+            if tape is not None:
+                jump_time = T - tau if continuous else None
+                d_boundary = None if boundary_r is None else boundary_r(tau)
+                tape.append(("step", *current, explicit, V_in, V, jump_time, d_boundary))
+            return jump(V, T - tau) if continuous else V
+
+        tau = 0.0
+        previous, last_dt = V, 0.0
+        for t_low, n_steps, dt in self._segments(T, events):
+            use_operators(tau, dt)
+            first_cn = 0
+            if self.rannacher:
+                for _ in range(2):
+                    previous, last_dt = V, 0.5 * dt
+                    tau += 0.5 * dt
+                    V = step(V, False, tau)
+                first_cn = 1
+            for _ in range(first_cn, n_steps):
+                if time_dependent:
+                    use_operators(tau, dt)
+                previous, last_dt = V, dt
+                tau += dt
+                V = step(V, True, tau)
+            if t_low <= 0.0:
+                break
+            # 向后穿过事件日：先施加观察（看到的是除息后价格），再施加除息跳跃
+            if t_low in jump_dates:
+                V = jump(V, t_low)
+                if tape is not None:
+                    tape.append(("jump", t_low))
+            if t_low in amounts:
+                if tape is not None:
+                    tape.append(("dividend", amounts[t_low]))
+                V = np.column_stack(
+                    [
+                        np.interp(S_grid[:, j] - amounts[t_low], S_grid[:, j], V[:, j])
+                        for j in range(len(options))
+                    ]
+                )
+        return V, previous, last_dt
+
+    def _adjoint(
+        self,
+        mode: str,
+        options: Sequence[Option],
+        S_grid: np.ndarray,
+        model: Model,
+        dx: float,
+        tape: List[Tuple[Any, ...]],
+        stencil: Tuple[int, np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        沿 _solve 记录的磁带反向扫描，计算现价处价格对 r 和模型参数的导数
+
+        每个时间步 A V' = B V（隐式半步为 A V' = V），A = I - dt/2 L，B = I + dt/2 L。
+        伴随变量 lambda 从到期前一层向当前时刻的反方向传播：
+        mu = A^-T lambda，lambda <- B^T mu，该步对 L 系数的敏感度为 mu^T dt/2 dL (V + V')。
+        L 的第 i 行只依赖节点方差 sigma_i^2 和 r，因此一次扫描得到所有节点、所有时间步的敏感度；
+        网格保持不变（与扰动法一致）。Dirichlet 边界行的右端项为 boundary(tau)，
+        与上一层无关，其对 r 的导数以 mu 的边界行加权计入 dV/dr。
+        观察日跳跃条件按逐点线性（如敲出置零）处理
+
+        参数:
+            mode: 边界处理方式
+            options: 同组期权
+            S_grid: 价格网格
+            model: 标的动态模型（GBMModel 或 LocalVolModel）
+            dx: 对数价格步长
+            tape: _solve 记录的磁带
+            stencil: _spot_stencil 的返回值（伴随变量的初值为现价处的插值权重）
+
+        返回:
+            (各合约的 dV/dr, 各合约的模型参数梯度，形状为 (合约数,) + 参数形状)
+        """
+        n_contracts = len(options)
+        spots = S_grid[:, 0]
+        i, weights = stencil
+        lam = np.zeros_like(S_grid, order="F")
+        lam[i - 1 : i + 2] = weights[0][:, np.newaxis]
+        # L 的内部行对 sigma_i^2 的导数（下、主、上对角）
+        d_lower, d_main, d_upper = 0.5 / dx**2 + 0.25 / dx, -1.0 / dx**2, 0.5 / dx**2 - 0.25 / dx
+        bar_r = np.zeros(n_contracts)
+        if isinstance(model, LocalVolModel):
+            gradient = np.zeros((n_contracts,) + model.local_vols.shape)
+        else:
+            gradient = np.zeros((n_contracts, 1))
+
+        def jump_adjoint(lam: np.ndarray, t: float) -> np.ndarray:
+            return np.column_stack(
+                [
+                    option.jump_condition(S_grid[:, j], t, lam[:, j])  # type: ignore[attr-defined]
+                    for j, option in enumerate(options)
+                ]
+            )
+
+        for record in reversed(tape):
+            if record[0] == "jump":
+                lam = jump_adjoint(lam, record[1])
+                continue
+            if record[0] == "dividend":
+                lam = np.column_stack(
+                    [
+                        interp_adjoint(S_grid[:, j] - record[1], S_grid[:, j], lam[:, j])
+                        for j in range(n_contracts)
+                    ]
+                )
+                continue
+            _, operators, t_mid, dt, explicit, V_in, V_out, jump_time, d_boundary = record
+            if jump_time is not None:
+                lam = jump_adjoint(lam, jump_time)
+            mu = operators.solve_transposed(np.asfortranarray(lam))
+            g = 0.5 * dt * mu
+            W = V_in + V_out if explicit else V_out
+            inner = g[1:-1]
+            bar_variance = inner * (d_lower * W[:-2] + d_main * W[1:-1] + d_upper * W[2:])
+            bar_r += (inner * ((W[2:] - W[:-2]) / (2.0 * dx) - W[1:-1])).sum(axis=0)
+            if mode == _LINEAR:
+                bar_r += g[0] * ((-1.0 / dx - 1.0) * W[0] + W[1] / dx)
+                bar_r += g[-1] * (-W[-2] / dx + (1.0 / dx - 1.0) * W[-1])
+            if isinstance(model, LocalVolModel):
+                sigma = model.local_vol(spots[1:-1], t_mid)
+                for j in range(n_contracts):
+                    gradient[j] += model.local_vol_vjp(
+                        spots[1:-1], t_mid, 2.0 * sigma * bar_variance[:, j]
+                    )[1]
+            else:
+                sigma = model.sigma  # type: ignore[attr-defined]
+                gradient[:, 0] += 2.0 * sigma * bar_variance.sum(axis=0)
+            if d_boundary is not None:
+                bar_r += (mu[[0, -1], :] * d_boundary).sum(axis=0)
+            if mode == _DIRICHLET:
+                mu[[0, -1], :] = 0.0
+            lam = operators.explicit_transposed(mu) if explicit else mu
+        return bar_r, gradient
+
+    @staticmethod
+    def _shift_rate(options: Sequence[Option], h: float) -> List[Option]:
+        """返回利率平移 h 的期权（边界条件中的贴现随之变化）"""
+        return [option.replace(r=option.r + h) for option in options]
+
+    def _price_group(
+        self,
+        mode: str,
+        options: Sequence[Option],
+        spots: np.ndarray,
+        model: Model,
+        r: float,
+        T: float,
+        events: _Events = ((), (), False),
+        adjoint: bool = False,
+        barrier: Optional[Tuple[float, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        求解一组共享网格的合约
+
+        参数:
+            mode: 边界处理方式
+            options: 同组期权
+            spots: 各合约的现价
+            model: 标的动态模型
+            r: 无风险利率
+            T: 到期时间
+            events: 同组共用的事件日程
+            adjoint: 是否用伴随扫描计算 Vega、Rho（结果另含 model_gradient 数组）
+            barrier: 同组共用的连续观察障碍 (障碍价格, 方向)（此时组内现价相同）
+
+        返回:
+            每个合约的 PricingResult 字段字典
+        """
+        log_barrier = None if barrier is None else float(np.log(barrier[0] / spots[0]))
+        x, dx = self._grid(model.volatility_scale, T, log_barrier)
+        S_grid = spots[np.newaxis, :] * np.exp(x)[:, np.newaxis]
+        if barrier is not None:
+            # 截断网格的边界节点恰为障碍价格（避免舍入使其落在障碍内侧）
+            S_grid[x == log_barrier] = barrier[0]
+        stencil = self._spot_stencil(x, dx)
+        i, weights = stencil
+
+        def at_spot(V: np.ndarray, row: int = 0) -> np.ndarray:
+            return weights[row] @ V[i - 1 : i + 2]
+
+        tape: Optional[List[Tuple[Any, ...]]] = [] if adjoint else None
+        V, previous, dt = self._solve(mode, options, S_grid, model, r, T, dx, events, tape)
+        prices = at_spot(V)
+        if not (self.compute_greeks or adjoint):
+            return [{"price": float(p)} for p in prices]
+
+        V_x, V_xx = at_spot(V, 1), at_spot(V, 2)
+        delta = V_x / spots
+        gamma = (V_xx - V_x) / spots**2
+        theta = -(prices - at_spot(previous)) / dt
+
+        if tape is not None:
+            rho, gradient = self._adjoint(mode, options, S_grid, model, dx, tape, stencil)
+            return [
+                {
+                    "price": float(prices[j]),
+                    "delta": float(delta[j]),
+                    "gamma": float(gamma[j]),
+                    "theta": float(theta[j]),
+                    "vega": float(gradient[j].sum()),
+                    "rho": float(rho[j]),
+                    "model_gradient": gradient[j],
+                }
+                for j in range(len(options))
+            ]
+
+        h_r = self.rho_bump
+        up_options, down_options = self._shift_rate(options, h_r), self._shift_rate(options, -h_r)
+        up = self._solve(mode, up_options, S_grid, model, r + h_r, T, dx, events)[0]
+        down = self._solve(mode, down_options, S_grid, model, r - h_r, T, dx, events)[0]
+        rho = (at_spot(up) - at_spot(down)) / (2.0 * h_r)
+
+        results = [
+            {
+                "price": float(prices[j]),
+                "delta": float(delta[j]),
+                "gamma": float(gamma[j]),
+                "theta": float(theta[j]),
+                "rho": float(rho[j]),
+            }
+            for j in range(len(options))
+        ]
+        if isinstance(model, GBMModel):
+            h_sigma = self.vega_bump * model.sigma
+            up_model, down_model = GBMModel(model.sigma + h_sigma), GBMModel(model.sigma - h_sigma)
+            up = self._solve(mode, options, S_grid, up_model, r, T, dx, events)[0]
+            down = self._solve(mode, options, S_grid, down_model, r, T, dx, events)[0]
+            vega = (at_spot(up) - at_spot(down)) / (2.0 * h_sigma)
+            for j, result in enumerate(results):
+                result["vega"] = float(vega[j])
+        return results
+
+    def __repr__(self) -> str:
+        """
+        返回定价方法的字符串表示
+
+        返回:
+            定价方法的描述字符串
+        """
+        return (
+            f"PDEPricing(n_space={self.n_space}, n_time={self.n_time}, "
+            f"n_std={self.n_std}, rannacher={self.rannacher}, model={self.model!r})"
+        )
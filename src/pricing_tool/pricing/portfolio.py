@@ -0,0 +1,265 @@
+"""
+组合定价规划模块
+
+定价前先规范化 (期权, 市场数据) 对：经济上相同的合约去重，可共享计算的合约
+（同一 PDE 网格、同一组 MC 路径、同一条 Fourier 执行价序列）归为一组；
+每组只调用一次定价引擎，再按名义本金把结果分发回各个头寸
+"""
+
+import dataclasses
+import time
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .._slots import slotted
+from ..options.base import Option
+from ..utils.market_data import MarketData, MultiAssetMarketData
+from .base import PricingMethod, PricingResult, pair_market_data
+
+AnyMarketData = Union[MarketData, MultiAssetMarketData]
+
+_SCALED_FIELDS = ("price", "delta", "gamma", "theta", "vega", "rho")
+"""随名义本金线性缩放的结果字段"""
+
+
+def canonicalize(option: Option, market_data: AnyMarketData) -> Tuple[Option, AnyMarketData]:
+    """
+    规范化 (期权, 市场数据) 对
+
+    定价引擎从 MarketData 读取市场状态（S、r、sigma），从期权读取合约条款，
+    期权上的市场字段和 MarketData 上的 K、T 不影响定价。规范化把期权的市场字段
+    替换为 MarketData 的取值，把 MarketData 的 K、T 替换为期权的取值（统一为 float），
+    使经济上相同的合约得到相等且哈希相同的键。多资产市场数据原样返回
+
+    参数:
+        option: 期权对象
+        market_data: 市场数据对象
+
+    返回:
+        (规范化的期权, 规范化的市场数据)
+    """
+    if not isinstance(market_data, MarketData):
+        return option, market_data
+    S, r, sigma = float(market_data.S), float(market_data.r), float(market_data.sigma)
+    canonical = MarketData(S=S, K=float(option.K), T=float(option.T), r=r, sigma=sigma)
+    return option.replace(S=S, r=r, sigma=sigma), canonical
+
+
+@slotted
+@dataclass(frozen=True, eq=False)
+class PortfolioPlan:
+    """
+    组合定价计划
+
+    记录去重后的合约、各头寸对应的合约和名义本金，以及按定价引擎分组键
+    划分的共享计算组
+    """
+    contracts: Tuple[Tuple[Option, AnyMarketData], ...]
+    """去重后的规范化 (期权, 市场数据) 对"""
+
+    positions: np.ndarray
+    """各头寸对应的合约下标"""
+
+    notionals: np.ndarray
+    """各头寸的名义本金（份数，可为负表示空头）"""
+
+    groups: Tuple[Tuple[int, ...], ...]
+    """共享计算的合约下标组（每组调用一次定价引擎）"""
+
+    @property
+    def n_positions(self) -> int:
+        """头寸数"""
+        return int(self.positions.size)
+
+    @property
+    def n_contracts(self) -> int:
+        """去重后的合约数"""
+        return len(self.contracts)
+
+    @property
+    def n_groups(self) -> int:
+        """定价引擎调用次数"""
+        return len(self.groups)
+
+    def savings(self) -> Dict[str, float]:
+        """
+        统计去重和分组节省的工作量
+
+        返回:
+            字典，包含头寸数、合约数、组数、去掉的重复合约数、组内共享的合约数，
+            以及引擎调用次数相对逐个头寸定价的比例
+        """
+        return {
+            "positions": self.n_positions,
+            "contracts": self.n_contracts,
+            "groups": self.n_groups,
+            "duplicates": self.n_positions - self.n_contracts,
+            "shared": self.n_contracts - self.n_groups,
+            "work_ratio": self.n_groups / max(self.n_positions, 1),
+        }
+
+
+@slotted
+@dataclass(frozen=True, eq=False)
+class PortfolioResult:
+    """
+    组合定价结果
+    """
+    results: Tuple[PricingResult, ...]
+    """各头寸的结果（价格、Greeks 和标准误已乘以名义本金）"""
+
+    contract_results: Tuple[PricingResult, ...]
+    """去重后各合约的单位名义本金结果"""
+
+    plan: PortfolioPlan
+    """定价计划"""
+
+    elapsed: float
+    """规划和定价总耗时（秒）"""
+
+    @property
+    def value(self) -> float:
+        """组合总价值"""
+        return float(sum(result.price for result in self.results))
+
+
+class PortfolioPlanner:
+    """
+    组合定价规划器
+
+    按定价引擎的 batch_key 划分共享计算组：PDEPricing 按网格、MCPricing 按路径、
+    FourierPricing 按执行价序列分组，其余引擎每个合约单独一组（只去重）
+    """
+
+    def __init__(self, method: PricingMethod):
+        """
+        初始化组合定价规划器
+
+        参数:
+            method: 定价方法
+        """
+        self.method = method
+
+    def plan(
+        self,
+        options: Sequence[Option],
+        market_data: Union[AnyMarketData, Sequence[AnyMarketData]],
+        notionals: Optional[Sequence[float]] = None,
+    ) -> PortfolioPlan:
+        """
+        规范化、去重并分组
+
+        参数:
+            options: 各头寸的期权对象
+            market_data: 共用的市场数据，或与 options 一一对应的市场数据序列
+            notionals: 各头寸的名义本金；None 时均为 1
+
+        返回:
+            PortfolioPlan 对象
+
+        抛出:
+            ValueError: 如果市场数据或名义本金的数量与期权数量不一致
+        """
+        if isinstance(market_data, MultiAssetMarketData):
+            market_data = [market_data] * len(options)
+        pairs = pair_market_data(options, market_data)
+        if notionals is None:
+            weights = np.ones(len(pairs))
+        else:
+            weights = np.asarray(notionals, dtype=float)
+            if weights.shape != (len(pairs),):
+                raise ValueError(
+                    f"名义本金数量必须与期权数量一致，当前: {weights.size} != {len(pairs)}"
+                )
+
+        index: Dict[Tuple[Option, AnyMarketData], int] = {}
+        positions = np.empty(len(pairs), dtype=np.intp)
+        for k, (option, data) in enumerate(pairs):
+            positions[k] = index.setdefault(canonicalize(option, data), len(index))
+        contracts = tuple(index)
+
+        groups: Dict[Hashable, List[int]] = {}
+        for i, (option, data) in enumerate(contracts):
+            groups.setdefault(self.method.batch_key(option, data), []).append(i)
+        return PortfolioPlan(
+            contracts=contracts,
+            positions=positions,
+            notionals=weights,
+            groups=tuple(tuple(members) for members in groups.values()),
+        )
+
+    def price(
+        self,
+        options: Sequence[Option],
+        market_data: Union[AnyMarketData, Sequence[AnyMarketData]],
+        notionals: Optional[Sequence[float]] = None,
+    ) -> PortfolioResult:
+        """
+        按计划为组合定价：每组调用一次 price_batch，再按名义本金分发结果
+
+        参数:
+            options: 各头寸的期权对象
+            market_data: 共用的市场数据，或与 options 一一对应的市场数据序列
+            notionals: 各头寸的名义本金；None 时均为 1
+
+        返回:
+            PortfolioResult 对象
+        """
+        start = time.perf_counter()
+        plan = self.plan(options, market_data, notionals)
+        contract_results: List[Optional[PricingResult]] = [None] * plan.n_contracts
+        for members in plan.groups:
+            batch = self.method.price_batch(
+                [plan.contracts[i][0] for i in members],
+                [plan.contracts[i][1] for i in members],
+            )
+            for i, result in zip(members, batch):
+                contract_results[i] = result
+
+        results = tuple(
+            scale_result(contract_results[i], float(notional))  # type: ignore[arg-type]
+            for i, notional in zip(plan.positions, plan.notionals)
+        )
+        return PortfolioResult(
+            results=results,
+            contract_results=tuple(contract_results),  # type: ignore[arg-type]
+            plan=plan,
+            elapsed=time.perf_counter() - start,
+        )
+
+    def __repr__(self) -> str:
+        """
+        返回规划器的字符串表示
+
+        返回:
+            规划器的描述字符串
+        """
+        return f"PortfolioPlanner(method={self.method!r})"
+
+
+def scale_result(result: PricingResult, notional: float) -> PricingResult:
+    """
+    按名义本金缩放定价结果
+
+    价格和 Greeks 线性缩放，标准误乘以名义本金的绝对值，耗时不变；
+    PricingResult 子类的其他字段保持不变
+
+    参数:
+        result: 单位名义本金的定价结果
+        notional: 名义本金
+
+    返回:
+        缩放后的定价结果（notional 为 1 时返回原对象）
+    """
+    if notional == 1.0:
+        return result
+    changes = {
+        name: notional * getattr(result, name)
+        for name in _SCALED_FIELDS
+        if getattr(result, name) is not None
+    }
+    if result.std_error is not None:
+        changes["std_error"] = abs(notional) * result.std_error
+    return dataclasses.replace(result, **changes)
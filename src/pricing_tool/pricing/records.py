@@ -0,0 +1,63 @@
+"""
+定价结果打包模块
+
+定义 PricingResult 的 NumPy 结构化数组形式，用于批量存储和传输大量定价结果
+
+每条记录为 8 个连续的 float64（64 字节），不含对象头和指向 float 对象的指针，
+约为一个字段齐全的 PricingResult 活动对象（含字段 float 对象）占用的 1/4
+"""
+
+from dataclasses import fields
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from .base import PricingResult
+
+RESULT_FIELDS = tuple(field.name for field in fields(PricingResult))
+"""PricingResult 字段名称（与打包记录的列顺序一致）"""
+
+PRICING_RESULT_DTYPE = np.dtype([(name, np.float64) for name in RESULT_FIELDS])
+"""PricingResult 的打包记录类型，每条记录为连续的 float64 字段，缺失值用 NaN 表示"""
+
+
+def pack_results(results: Iterable[PricingResult]) -> np.ndarray:
+    """
+    将定价结果打包为结构化数组
+    
+    参数:
+        results: PricingResult 对象序列
+        
+    返回:
+        dtype 为 PRICING_RESULT_DTYPE 的一维结构化数组，None 字段存储为 NaN
+    """
+    rows = [
+        tuple(np.nan if value is None else value for value in _values(result))
+        for result in results
+    ]
+    return np.array(rows, dtype=PRICING_RESULT_DTYPE)
+
+
+def _values(result: PricingResult) -> Iterable[Optional[float]]:
+    """按 RESULT_FIELDS 顺序返回定价结果的字段取值"""
+    return (getattr(result, name) for name in RESULT_FIELDS)
+
+
+def unpack_results(records: np.ndarray) -> List[PricingResult]:
+    """
+    将结构化数组还原为定价结果对象
+    
+    参数:
+        records: dtype 与 PRICING_RESULT_DTYPE 兼容的结构化数组
+        
+    返回:
+        PricingResult 对象列表，NaN 字段还原为 None
+        
+    注意:
+        打包形式无法区分 None 与真实的 NaN，两者都会还原为 None
+    """
+    columns = [records[name].tolist() for name in RESULT_FIELDS]
+    return [
+        PricingResult(*(None if value != value else value for value in values))  # NaN != NaN
+        for values in zip(*columns)
+    ]
@@ -0,0 +1,633 @@
+"""
+定价结果磁盘缓存模块
+
+把 PricingResult 持久化到本地 SQLite 文件，进程重启或日内重复任务可直接复用。
+缓存键为 (期权, 市场数据, 定价引擎配置) 的内容哈希，条目带有引擎代码版本，
+代码变化后旧条目自动失效
+
+存储使用 WAL 日志模式（多个进程可同时读取，写入不阻塞读取）并开启 mmap 读取；
+每条记录为 PRICING_RESULT_DTYPE 的打包字节，另记录结果类型，PricingResult 子类的
+附加字段以 JSON 保存（仅依赖标准库 sqlite3 和 NumPy）
+"""
+
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import importlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
+
+from ..options.base import Option
+from ..utils.market_data import MarketData
+from .base import PricingMethod, PricingResult, pair_market_data
+from .portfolio import AnyMarketData, canonicalize
+from .records import PRICING_RESULT_DTYPE, RESULT_FIELDS, pack_results, unpack_results
+
+PathLike = Union[str, Path]
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS results ("
+    "key TEXT PRIMARY KEY, version TEXT NOT NULL, created REAL NOT NULL, "
+    "kind TEXT NOT NULL, extra TEXT, payload BLOB NOT NULL"
+    ") WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS results_created ON results (created)",
+)
+
+# 表结构版本（记录在 PRAGMA user_version 中），不一致时丢弃旧表重建
+_SCHEMA_VERSION = 2
+
+_BASE_KIND = f"{PricingResult.__module__}:{PricingResult.__qualname__}"
+
+# SQLite 单条语句的参数个数上限（旧版本为 999）
+_MAX_PARAMETERS = 900
+
+
+@functools.lru_cache(maxsize=None)
+def code_version() -> str:
+    """
+    返回定价代码版本：pricing_tool 包内全部源文件的内容哈希
+
+    返回:
+        16 位十六进制字符串；任一源文件变化时改变
+    """
+    root = Path(__file__).resolve().parents[1]
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*.py")):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def content_hash(*values: Any) -> str:
+    """
+    计算值的内容哈希
+
+    支持 None、布尔、整数、浮点、字符串、序列、字典、NumPy 数组、期权、
+    数据类以及由 __dict__ / __slots__ 描述状态的对象（按类型名和字段取值递归），
+    浮点数按 repr 编码，因此相等的数值（不论 Python 或 NumPy 类型）得到相同哈希
+
+    参数:
+        *values: 要哈希的值
+
+    返回:
+        SHA-256 十六进制字符串
+
+    抛出:
+        TypeError: 如果值的类型无法编码
+    """
+    digest = hashlib.sha256()
+    for value in values:
+        _feed(digest, value)
+    return digest.hexdigest()
+
+
+def _feed(digest: Any, value: Any) -> None:
+    """按类型标签递归地把值写入哈希"""
+    if value is None:
+        digest.update(b"N")
+    elif isinstance(value, (bool, np.bool_)):
+        digest.update(b"B1" if value else b"B0")
+    elif isinstance(value, (int, np.integer)):
+        digest.update(b"I%d;" % int(value))
+    elif isinstance(value, (float, np.floating)):
+        digest.update(b"F" + repr(float(value)).encode() + b";")
+    elif isinstance(value, str):
+        encoded = value.encode()
+        digest.update(b"S%d:" % len(encoded) + encoded)
+    elif isinstance(value, (tuple, list)):
+        digest.update(b"T%d:" % len(value))
+        for item in value:
+            _feed(digest, item)
+    elif isinstance(value, dict):
+        digest.update(b"D%d:" % len(value))
+        for name in sorted(value, key=str):
+            _feed(digest, str(name))
+            _feed(digest, value[name])
+    elif isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        digest.update(b"A" + array.dtype.str.encode() + repr(array.shape).encode())
+        digest.update(array.tobytes())
+    else:
+        digest.update(b"O" + _type_name(value).encode() + b":")
+        _feed(digest, _object_state(value))
+
+
+def _type_name(value: Any) -> str:
+    """返回值的完整类型名"""
+    cls = type(value)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _object_state(value: Any) -> Dict[str, Any]:
+    """
+    返回对象用于内容哈希的状态字典
+
+    抛出:
+        TypeError: 如果对象既不是期权、数据类，也没有 __dict__ / __slots__ 状态
+    """
+    if isinstance(value, Option):
+        return value.__getstate__()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    state = dict(getattr(value, "__dict__", {}))
+    for klass in type(value).__mro__:
+        for name in klass.__dict__.get("__slots__", ()):
+            if name not in ("__dict__", "__weakref__") and hasattr(value, name):
+                state[name] = getattr(value, name)
+    if not state:
+        raise TypeError(f"无法计算 {_type_name(value)} 的内容哈希")
+    return state
+
+
+def _result_kind(result: PricingResult) -> str:
+    """返回结果类型的 "模块:限定名" 形式（可由 _result_class 还原）"""
+    cls = type(result)
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+@functools.lru_cache(maxsize=None)
+def _result_class(kind: str) -> Optional[Type[PricingResult]]:
+    """由 _result_kind 还原结果类型；无法导入或不是 PricingResult 子类时返回 None"""
+    module_name, _, qualname = kind.partition(":")
+    try:
+        value: Any = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            value = getattr(value, name)
+    except (ImportError, AttributeError):
+        return None
+    if isinstance(value, type) and issubclass(value, PricingResult):
+        return value
+    return None
+
+
+def _extra_fields(result: PricingResult) -> Optional[str]:
+    """
+    将 PricingResult 子类的附加字段编码为 JSON（基类结果返回 None）
+
+    抛出:
+        TypeError: 如果附加字段不是 JSON 可表示的标量或序列
+    """
+    if type(result) is PricingResult:
+        return None
+    extra = {
+        field.name: getattr(result, field.name)
+        for field in dataclasses.fields(result)
+        if field.name not in RESULT_FIELDS
+    }
+    try:
+        return json.dumps(extra, default=_json_scalar)
+    except TypeError as exc:
+        raise TypeError(f"无法缓存 {_type_name(result)} 的附加字段: {exc}") from exc
+
+
+def _json_scalar(value: Any) -> Any:
+    """把 NumPy 标量转换为 Python 标量，其余类型交给 json 报错"""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} 不能编码为 JSON")
+
+
+def _restore(kind: str, extra: Optional[str], base: PricingResult) -> Optional[PricingResult]:
+    """由打包的基类字段和附加字段还原结果；结果类型已不可用时返回 None"""
+    if kind == _BASE_KIND:
+        return base
+    cls = _result_class(kind)
+    if cls is None:
+        return None
+    fields = {name: getattr(base, name) for name in RESULT_FIELDS}
+    fields.update(json.loads(extra) if extra else {})
+    return cls(**fields)
+
+
+@contextlib.contextmanager
+def _transaction(connection: sqlite3.Connection) -> Iterator[None]:
+    """立即获取写锁的事务（出错时回滚）"""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+def engine_config(method: PricingMethod) -> Dict[str, Any]:
+    """
+    返回定价引擎影响结果的配置（实例属性中去掉缓存、性能统计等运行时状态）
+
+    参数:
+        method: 定价方法
+
+    返回:
+        属性名到取值的字典
+    """
+    runtime = set(getattr(method, "_runtime_attributes", ()))
+    return {
+        name: value
+        for name, value in _object_state(method).items()
+        if name not in runtime and not name.startswith("_")
+    }
+
+
+class ResultCache:
+    """
+    定价结果的 SQLite 磁盘缓存（多进程安全）
+
+    - 多个进程可同时打开同一文件：WAL 模式下读取互不阻塞，写入串行化
+      （等待锁最多 timeout 秒）
+    - 读取不写库；超过 ttl 的条目视为未命中，由 evict 清理
+    - 按写入时间淘汰最早的条目，使条目数不超过 max_entries（每条约 100 字节）。
+      统计条目数需要扫描整表，因此每个实例累计写入约 1% 容量的条目后才检查一次，
+      条目数可暂时超出 max_entries 约 1%（每个写入进程）；evict 总是立即检查
+    - 结果保持原类型：PricingResult 子类（如 AutoPricingResult）的附加字段一并保存，
+      读取时还原为同一类型
+    - 条目记录写入时的代码版本，版本不同的条目视为未命中，由 evict 清理
+
+    连接在 fork 后的子进程中自动重建
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        ttl: Optional[float] = None,
+        max_entries: int = 1_000_000,
+        version: Optional[str] = None,
+        timeout: float = 30.0,
+        mmap_size: int = 256 * 1024 * 1024,
+    ):
+        """
+        初始化磁盘缓存（文件不存在时创建）
+
+        参数:
+            path: SQLite 文件路径
+            ttl: 条目有效期（秒）；None 时不过期
+            max_entries: 最多保留的条目数
+            version: 引擎版本；None 时使用 code_version()
+            timeout: 等待其他进程写锁的最长时间（秒）
+            mmap_size: 内存映射读取的最大字节数
+
+        抛出:
+            ValueError: 如果参数无效
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"有效期 ttl 必须大于 0，当前值: {ttl}")
+        if max_entries <= 0:
+            raise ValueError(f"缓存容量 max_entries 必须大于 0，当前值: {max_entries}")
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.version = version if version is not None else code_version()
+        self.timeout = timeout
+        self.mmap_size = mmap_size
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid = 0
+        self._trim_interval = max(1, max_entries // 100)
+        self._unchecked = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        with self._lock:
+            self._connect()
+
+    def key(self, option: Option, market_data: AnyMarketData, method: PricingMethod) -> str:
+        """
+        计算缓存键：规范化后的 (期权, 市场数据) 与引擎类型和配置的内容哈希
+
+        参数:
+            option: 期权对象
+            market_data: 市场数据对象
+            method: 定价方法
+
+        返回:
+            缓存键
+        """
+        canonical_option, canonical_data = canonicalize(option, market_data)
+        return content_hash(
+            canonical_option, canonical_data, _type_name(method), engine_config(method)
+        )
+
+    def get(self, key: str) -> Optional[PricingResult]:
+        """
+        读取缓存条目
+
+        参数:
+            key: 缓存键
+
+        返回:
+            PricingResult 对象；未命中、过期或版本不同时为 None
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, PricingResult]:
+        """
+        批量读取缓存条目
+
+        参数:
+            keys: 缓存键序列
+
+        返回:
+            命中的键到定价结果的字典（类型与写入时相同；结果类型已无法导入的条目视为未命中）
+        """
+        unique = list(dict.fromkeys(keys))
+        found: Dict[str, PricingResult] = {}
+        cutoff = float("-inf") if self.ttl is None else time.time() - self.ttl
+        with self._lock:
+            connection = self._connect()
+            for start in range(0, len(unique), _MAX_PARAMETERS):
+                chunk = unique[start:start + _MAX_PARAMETERS]
+                rows = connection.execute(
+                    "SELECT key, kind, extra, payload FROM results "
+                    "WHERE version = ? AND created >= ? "
+                    f"AND key IN ({', '.join('?' * len(chunk))})",
+                    (self.version, cutoff, *chunk),
+                ).fetchall()
+                if rows:
+                    records = np.frombuffer(
+                        b"".join(row[3] for row in rows), dtype=PRICING_RESULT_DTYPE
+                    )
+                    for (key, kind, extra, _), base in zip(rows, unpack_results(records)):
+                        result = _restore(kind, extra, base)
+                        if result is not None:
+                            found[key] = result
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put(self, key: str, result: PricingResult) -> None:
+        """
+        写入缓存条目（已存在时覆盖）
+
+        参数:
+            key: 缓存键
+            result: 定价结果（PricingResult 或其子类）
+        """
+        self.put_many([(key, result)])
+
+    def put_many(self, items: Iterable[Tuple[str, PricingResult]]) -> None:
+        """
+        在一个事务中批量写入缓存条目，累计写入足够多条目后按容量淘汰最早的条目
+
+        参数:
+            items: (缓存键, 定价结果) 序列
+
+        抛出:
+            TypeError: 如果结果子类的附加字段不能编码为 JSON
+        """
+        items = list(items)
+        if not items:
+            return
+        records = pack_results(result for _, result in items)
+        now = time.time()
+        rows = [
+            (key, self.version, now, _result_kind(result), _extra_fields(result), record.tobytes())
+            for (key, result), record in zip(items, records)
+        ]
+        with self._lock:
+            connection = self._connect()
+            with _transaction(connection):
+                connection.executemany(
+                    "INSERT OR REPLACE INTO results (key, version, created, kind, extra, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._unchecked += len(rows)
+                if self._unchecked >= self._trim_interval:
+                    self.evictions += self._trim(connection)
+
+    def get_or_price(
+        self,
+        option: Option,
+        market_data: AnyMarketData,
+        method: PricingMethod,
+    ) -> PricingResult:
+        """
+        读取缓存，未命中时定价并写入
+
+        参数:
+            option: 期权对象
+            market_data: 市场数据对象
+            method: 定价方法
+
+        返回:
+            PricingResult 对象
+        """
+        key = self.key(option, market_data, method)
+        result = self.get(key)
+        if result is None:
+            result = method.price(option, market_data)
+            self.put(key, result)
+        return result
+
+    def evict(self) -> int:
+        """
+        删除过期条目和其他代码版本的条目，并按容量淘汰最早的条目
+
+        返回:
+            删除的条目数
+        """
+        with self._lock:
+            connection = self._connect()
+            with _transaction(connection):
+                removed = connection.execute(
+                    "DELETE FROM results WHERE version != ?", (self.version,)
+                ).rowcount
+                if self.ttl is not None:
+                    removed += connection.execute(
+                        "DELETE FROM results WHERE created < ?", (time.time() - self.ttl,)
+                    ).rowcount
+                removed += self._trim(connection)
+            self.evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        """删除全部条目并清空统计信息"""
+        with self._lock:
+            connection = self._connect()
+            with _transaction(connection):
+                connection.execute("DELETE FROM results")
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        返回缓存统计信息（size 为文件中全部版本的条目数）
+
+        返回:
+            包含 size、hits、misses、evictions 的字典
+        """
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        返回当前进程的数据库连接（调用方持有 _lock）
+
+        fork 得到的子进程不能复用父进程的连接，检测到进程号变化时重新连接
+        """
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            str(self.path), timeout=self.timeout, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        with _transaction(connection):
+            (schema_version,) = connection.execute("PRAGMA user_version").fetchone()
+            if schema_version != _SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS results")
+                connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            for statement in _SCHEMA:
+                connection.execute(statement)
+        self._connection = connection
+        self._pid = os.getpid()
+        return connection
+
+    def _trim(self, connection: sqlite3.Connection) -> int:
+        """按写入时间删除最早的条目，使条目数不超过 max_entries，返回删除数"""
+        self._unchecked = 0
+        (count,) = connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        excess = count - self.max_entries
+        if excess <= 0:
+            return 0
+        return connection.execute(
+            "DELETE FROM results WHERE key IN "
+            "(SELECT key FROM results ORDER BY created LIMIT ?)",
+            (excess,),
+        ).rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connect().execute("SELECT COUNT(*) FROM results").fetchone()
+        return int(count)
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ResultCache(path={str(self.path)!r}, version={self.version!r})"
+
+
+class CachedPricing(PricingMethod):
+    """
+    带磁盘缓存的定价方法
+
+    先按缓存键批量读取，只把未命中的合约交给被包装的定价方法批量定价，
+    再把新结果一次写入缓存。命中与未命中返回相同类型的结果
+    （被包装引擎返回 PricingResult 子类时，子类字段也从缓存还原）
+    """
+
+    def __init__(self, method: PricingMethod, cache: ResultCache):
+        """
+        初始化带缓存的定价方法
+
+        参数:
+            method: 被包装的定价方法
+            cache: 磁盘缓存
+        """
+        self.method = method
+        self.cache = cache
+
+    def price(
+        self,
+        option: Option,
+        market_data: MarketData,
+    ) -> PricingResult:
+        """
+        计算期权价格和 Greeks（优先读取缓存）
+
+        参数:
+            option: 期权对象实例
+            market_data: 市场数据对象
+
+        返回:
+            PricingResult 对象
+        """
+        return self.price_batch([option], market_data)[0]
+
+    def price_batch(
+        self,
+        options: Sequence[Option],
+        market_data: Union[MarketData, Sequence[MarketData]],
+    ) -> List[PricingResult]:
+        """
+        批量计算期权价格和 Greeks，只为缓存未命中的合约调用被包装的定价方法
+
+        参数:
+            options: 期权对象序列
+            market_data: 共用的市场数据，或与 options 一一对应的市场数据序列
+
+        返回:
+            与 options 顺序一致的 PricingResult 列表
+        """
+        pairs = pair_market_data(options, market_data)
+        keys = [self.cache.key(option, data, self.method) for option, data in pairs]
+        found = self.cache.get_many(keys)
+
+        missing = list({key: i for i, key in enumerate(keys) if key not in found}.items())
+        if missing:
+            priced = self.method.price_batch(
+                [pairs[i][0] for _, i in missing], [pairs[i][1] for _, i in missing]
+            )
+            fresh = [(key, result) for (key, _), result in zip(missing, priced)]
+            self.cache.put_many(fresh)
+            found.update(fresh)
+        return [found[key] for key in keys]
+
+    def batch_key(self, option: Option, market_data: MarketData) -> Hashable:
+        """
+        返回被包装定价方法的分组键
+
+        参数:
+            option: 期权对象
+            market_data: 市场数据对象
+
+        返回:
+            可哈希的分组键
+        """
+        return self.method.batch_key(option, market_data)
+
+    def __repr__(self) -> str:
+        """
+        返回定价方法的字符串表示
+
+        返回:
+            定价方法的描述字符串
+        """
+        return f"CachedPricing(method={self.method!r}, cache={self.cache!r})"
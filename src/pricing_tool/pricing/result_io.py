@@ -0,0 +1,484 @@
+"""
+定价结果列式持久化模块
+
+将批量定价结果（价格、Greeks、标准误、耗时）分块追加写入列式文件，
+并支持内存映射读取和切片，下游风控任务无需加载整个运行结果
+
+支持的格式:
+    - "npy": 结构化 .npy 文件，可直接 numpy.load(..., mmap_mode="r") 读取（仅依赖 NumPy）
+    - "arrow": Arrow IPC 文件格式（需要 pyarrow）
+    - "parquet": Parquet 文件，每个分块写为一个 row group（需要 pyarrow）
+"""
+
+import bisect
+import importlib.util
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, List, Optional, Union
+
+import numpy as np
+
+from .base import PricingResult
+from .records import PRICING_RESULT_DTYPE, pack_results
+
+PathLike = Union[str, Path]
+
+FORMATS = ("npy", "arrow", "parquet")
+"""支持的文件格式"""
+
+_SUFFIX_FORMATS = {
+    ".npy": "npy",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+    ".parquet": "parquet",
+}
+
+_NPY_MAGIC = b"\x93NUMPY"
+_ARROW_MAGIC = b"ARROW1"
+_PARQUET_MAGIC = b"PAR1"
+
+# .npy 头部中 shape 的最大位数，预留空间以便分块追加后原地改写头部
+_NPY_SHAPE_DIGITS = 20
+
+
+def _has_pyarrow() -> bool:
+    """判断 pyarrow 是否可用（不实际导入）"""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _import_pyarrow() -> Any:
+    """
+    导入 pyarrow
+
+    返回:
+        pyarrow 模块
+
+    抛出:
+        ImportError: 如果未安装 pyarrow
+    """
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError("Arrow/Parquet 格式需要安装 pyarrow：pip install pyarrow") from exc
+    return pyarrow
+
+
+def resolve_format(path: PathLike, format: Optional[str] = None) -> str:
+    """
+    确定写入格式
+
+    参数:
+        path: 输出文件路径
+        format: 显式指定的格式；None 时根据文件后缀推断，
+            无法推断时若安装了 pyarrow 使用 "arrow"，否则使用 "npy"
+
+    返回:
+        格式名称
+
+    抛出:
+        ValueError: 如果格式不受支持
+    """
+    if format is None:
+        format = _SUFFIX_FORMATS.get(Path(path).suffix.lower())
+        if format is None:
+            format = "arrow" if _has_pyarrow() else "npy"
+    if format not in FORMATS:
+        raise ValueError(f"不支持的格式: {format}，可选值: {FORMATS}")
+    return format
+
+
+def _npy_header_text(dtype: np.dtype, length: int) -> str:
+    """生成 .npy 头部中的字典文本"""
+    descr = np.lib.format.dtype_to_descr(dtype)
+    return f"{{'descr': {descr!r}, 'fortran_order': False, 'shape': ({length},), }}"
+
+
+def _npy_header_size(dtype: np.dtype) -> int:
+    """
+    计算 .npy 头部的预留长度
+
+    参数:
+        dtype: 记录类型
+
+    返回:
+        可容纳最大记录数的头部总字节数（按 64 字节对齐）
+    """
+    widest = len(_npy_header_text(dtype, 10**_NPY_SHAPE_DIGITS - 1)) + 10 + 1
+    return -(-widest // 64) * 64
+
+
+def _npy_header(dtype: np.dtype, length: int, header_size: int) -> bytes:
+    """
+    生成固定长度的 .npy（1.0 版）头部
+
+    参数:
+        dtype: 记录类型
+        length: 记录数
+        header_size: 头部总字节数（含魔数和长度字段）
+
+    返回:
+        头部字节串
+    """
+    text = _npy_header_text(dtype, length).ljust(header_size - 10 - 1) + "\n"
+    encoded = text.encode("latin1")
+    return _NPY_MAGIC + bytes([1, 0]) + len(encoded).to_bytes(2, "little") + encoded
+
+
+class ResultWriter:
+    """
+    定价结果分块写入器
+
+    缓冲写入的结果，每满 chunk_size 条追加一个分块到文件。
+    npy 格式在每个分块写入后更新头部，因此运行过程中已写出的分块即可被内存映射读取
+
+    示例:
+        with ResultWriter("run.npy", chunk_size=65536) as writer:
+            for batch in batches:
+                writer.write(method.price_batch(batch, market_data))
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        format: Optional[str] = None,
+        chunk_size: int = 65536,
+        dtype: np.dtype = PRICING_RESULT_DTYPE,
+    ):
+        """
+        初始化写入器并创建输出文件
+
+        参数:
+            path: 输出文件路径（已存在时覆盖）
+            format: 文件格式，"npy"、"arrow" 或 "parquet"；None 时自动推断
+            chunk_size: 每个分块的记录数
+            dtype: 记录类型，默认为 PRICING_RESULT_DTYPE
+
+        抛出:
+            ValueError: 如果 chunk_size 不是正数或格式不受支持
+            ImportError: 如果 Arrow/Parquet 格式缺少 pyarrow
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"分块大小 chunk_size 必须大于 0，当前值: {chunk_size}")
+        self.path = Path(path)
+        self.format = resolve_format(path, format)
+        self.chunk_size = chunk_size
+        self.dtype = np.dtype(dtype)
+        self.rows_written = 0
+        self._pending: List[np.ndarray] = []
+        self._pending_rows = 0
+        self._closed = False
+        self._file: Optional[BinaryIO] = None
+        self._arrow_writer: Any = None
+
+        if self.format == "npy":
+            self._header_size = _npy_header_size(self.dtype)
+            self._file = open(self.path, "wb")
+            self._file.write(_npy_header(self.dtype, 0, self._header_size))
+        else:
+            pa = _import_pyarrow()
+            self._schema = pa.schema(
+                [(name, pa.from_numpy_dtype(self.dtype[name])) for name in self.dtype.names]
+            )
+            if self.format == "arrow":
+                self._arrow_writer = pa.ipc.new_file(str(self.path), self._schema)
+            else:
+                import pyarrow.parquet as pq
+
+                self._arrow_writer = pq.ParquetWriter(str(self.path), self._schema)
+
+    def write(self, results: Union[Iterable[PricingResult], np.ndarray]) -> None:
+        """
+        写入一批定价结果
+
+        参数:
+            results: PricingResult 序列，或 dtype 与写入器一致的结构化数组
+
+        抛出:
+            ValueError: 如果写入器已关闭或结构化数组类型不匹配
+        """
+        if self._closed:
+            raise ValueError("写入器已关闭")
+        if isinstance(results, np.ndarray):
+            if results.dtype != self.dtype:
+                raise ValueError(f"记录类型不匹配: {results.dtype}，期望 {self.dtype}")
+            records = results.reshape(-1)
+        else:
+            records = pack_results(results)
+        if records.size == 0:
+            return
+
+        self._pending.append(records)
+        self._pending_rows += records.size
+        while self._pending_rows >= self.chunk_size:
+            buffered = np.concatenate(self._pending)
+            self._write_chunk(buffered[: self.chunk_size])
+            rest = buffered[self.chunk_size :]
+            self._pending = [rest] if rest.size else []
+            self._pending_rows = rest.size
+
+    def flush(self) -> None:
+        """将缓冲区中不足一个分块的记录写出"""
+        if self._pending_rows:
+            self._write_chunk(np.concatenate(self._pending))
+            self._pending = []
+            self._pending_rows = 0
+
+    def close(self) -> None:
+        """写出剩余记录并关闭文件"""
+        if self._closed:
+            return
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+        if self._arrow_writer is not None:
+            self._arrow_writer.close()
+        self._closed = True
+
+    def _write_chunk(self, records: np.ndarray) -> None:
+        """
+        追加一个分块
+
+        参数:
+            records: 待写入的结构化数组
+        """
+        if self.format == "npy":
+            assert self._file is not None
+            self._file.write(np.ascontiguousarray(records).tobytes())
+            self.rows_written += records.size
+            # 先写数据再改写头部，保证读者看到的记录数总是已落盘的
+            self._file.flush()
+            self._file.seek(0)
+            self._file.write(_npy_header(self.dtype, self.rows_written, self._header_size))
+            self._file.seek(0, 2)
+            self._file.flush()
+        else:
+            pa = _import_pyarrow()
+            arrays = [pa.array(records[name]) for name in self.dtype.names]
+            batch = pa.RecordBatch.from_arrays(arrays, schema=self._schema)
+            if self.format == "arrow":
+                self._arrow_writer.write_batch(batch)
+            else:
+                self._arrow_writer.write_table(pa.Table.from_batches([batch]))
+            self.rows_written += records.size
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"ResultWriter(path={str(self.path)!r}, format={self.format!r}, "
+            f"chunk_size={self.chunk_size}, rows_written={self.rows_written})"
+        )
+
+
+class ResultReader:
+    """
+    定价结果读取器
+
+    以内存映射方式打开结果文件，按需切片读取，文件格式根据文件头自动识别。
+    Parquet 文件打开时只读取元数据，切片只解码覆盖到的 row group，单列读取只解码该列。
+    用完后调用 close（或使用 with 语句）释放文件句柄和内存映射
+
+    示例:
+        with ResultReader("run.npy") as reader:
+            prices = reader.column("price")[1000:2000]
+            records = reader[1000:2000]
+    """
+
+    def __init__(self, path: PathLike):
+        """
+        打开结果文件
+
+        参数:
+            path: 结果文件路径
+
+        抛出:
+            ValueError: 如果无法识别文件格式
+            ImportError: 如果 Arrow/Parquet 文件缺少 pyarrow
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            magic = f.read(6)
+        self._records: Optional[np.ndarray] = None
+        self._table: Any = None
+        self._parquet: Any = None
+        self._source: Any = None
+        self._row_group_starts: List[int] = []
+        self._closed = False
+
+        if magic.startswith(_NPY_MAGIC):
+            self.format = "npy"
+            self._records = np.load(self.path, mmap_mode="r")
+        elif magic.startswith(_ARROW_MAGIC):
+            self.format = "arrow"
+            pa = _import_pyarrow()
+            self._source = pa.memory_map(str(self.path), "r")
+            self._table = pa.ipc.open_file(self._source).read_all()
+        elif magic.startswith(_PARQUET_MAGIC):
+            self.format = "parquet"
+            _import_pyarrow()
+            import pyarrow.parquet as pq
+
+            self._parquet = pq.ParquetFile(str(self.path), memory_map=True)
+            metadata = self._parquet.metadata
+            start = 0
+            for i in range(metadata.num_row_groups):
+                self._row_group_starts.append(start)
+                start += metadata.row_group(i).num_rows
+        else:
+            raise ValueError(f"无法识别的结果文件格式: {self.path}")
+
+    @property
+    def dtype(self) -> np.dtype:
+        """记录类型"""
+        self._check_open()
+        if self._records is not None:
+            return self._records.dtype
+        schema = self._table.schema if self._parquet is None else self._parquet.schema_arrow
+        return np.dtype([(field.name, field.type.to_pandas_dtype()) for field in schema])
+
+    @property
+    def names(self) -> List[str]:
+        """列名称"""
+        return list(self.dtype.names)
+
+    def __len__(self) -> int:
+        self._check_open()
+        if self._records is not None:
+            return self._records.shape[0]
+        if self._parquet is not None:
+            return self._parquet.metadata.num_rows
+        return self._table.num_rows
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        读取单列
+
+        参数:
+            name: 列名称（如 "price"、"delta"、"std_error"）
+
+        返回:
+            一维数组；npy 格式为内存映射视图，Arrow 格式尽量零拷贝，Parquet 格式只解码该列
+
+        抛出:
+            KeyError: 如果列不存在
+            ValueError: 如果读取器已关闭
+        """
+        if name not in self.names:
+            raise KeyError(f"结果文件中不存在列: {name}")
+        if self._records is not None:
+            return self._records[name]
+        if self._parquet is not None:
+            return self._parquet.read(columns=[name]).column(name).to_numpy()
+        return self._table.column(name).to_numpy()
+
+    def __getitem__(self, index: Union[int, slice]) -> np.ndarray:
+        """
+        按行切片读取
+
+        参数:
+            index: 行号或切片
+
+        返回:
+            结构化数组（单行时为 numpy.void 记录）
+
+        抛出:
+            ValueError: 如果读取器已关闭
+        """
+        self._check_open()
+        if self._records is not None:
+            return self._records[index]
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self.to_records()[index]
+            table = self._slice(start, max(stop - start, 0))
+        else:
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("行号超出范围")
+            table = self._slice(index, 1)
+        records = self._table_to_records(table)
+        return records if isinstance(index, slice) else records[0]
+
+    def to_records(self) -> np.ndarray:
+        """
+        读取全部记录
+
+        返回:
+            结构化数组（npy 格式为内存映射，不会复制数据）
+
+        抛出:
+            ValueError: 如果读取器已关闭
+        """
+        self._check_open()
+        if self._records is not None:
+            return self._records
+        table = self._table if self._parquet is None else self._parquet.read()
+        return self._table_to_records(table)
+
+    def close(self) -> None:
+        """
+        关闭文件句柄并释放内存映射
+
+        已返回给调用方的 npy 内存映射视图和 Arrow 数组在被释放前仍保持映射有效
+        """
+        if self._closed:
+            return
+        if self._parquet is not None:
+            self._parquet.close()
+        if self._source is not None:
+            self._source.close()
+        self._records = self._table = self._parquet = self._source = None
+        self._closed = True
+
+    def _check_open(self) -> None:
+        """
+        检查读取器未关闭
+
+        抛出:
+            ValueError: 如果读取器已关闭
+        """
+        if self._closed:
+            raise ValueError("读取器已关闭")
+
+    def _slice(self, start: int, length: int) -> Any:
+        """
+        读取连续的行
+
+        参数:
+            start: 起始行号
+            length: 行数
+
+        返回:
+            Arrow 表；Parquet 格式只读取与 [start, start + length) 相交的 row group
+        """
+        if self._parquet is None:
+            return self._table.slice(start, length)
+        if length == 0:
+            return self._parquet.schema_arrow.empty_table()
+        first = bisect.bisect_right(self._row_group_starts, start) - 1
+        last = bisect.bisect_right(self._row_group_starts, start + length - 1)
+        table = self._parquet.read_row_groups(range(first, last))
+        return table.slice(start - self._row_group_starts[first], length)
+
+    def _table_to_records(self, table: Any) -> np.ndarray:
+        """将 Arrow 表转换为结构化数组"""
+        records = np.empty(table.num_rows, dtype=self.dtype)
+        for name in self.dtype.names:
+            records[name] = table.column(name).to_numpy()
+        return records
+
+    def __enter__(self) -> "ResultReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        rows = "closed" if self._closed else len(self)
+        return f"ResultReader(path={str(self.path)!r}, format={self.format!r}, rows={rows})"
@@ -1,9 +1,23 @@
 """
 工具模块
 
-包含市场数据、参数验证、结果格式化等工具函数
+包含市场数据、参数验证、结果格式化等工具函数（延迟加载）
 """
 
-from .market_data import MarketData
+from typing import TYPE_CHECKING
 
-__all__ = ["MarketData"]
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "MarketData": ".market_data",
+        "MarketDataBatch": ".market_data",
+        "MultiAssetMarketData": ".market_data",
+        "iter_market_data": ".market_loader",
+    },
+)
+
+if TYPE_CHECKING:  # pragma: no cover - 仅供类型检查器使用
+    from .market_data import MarketData, MarketDataBatch, MultiAssetMarketData
+    from .market_loader import iter_market_data
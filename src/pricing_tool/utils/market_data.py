@@ -1,19 +1,29 @@
 """
 市场数据模块
 
-定义市场数据的数据类和验证方法
+定义市场数据的数据类、批量列式表示和验证方法
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import FrozenInstanceError, dataclass
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union
 
+import numpy as np
 
-@dataclass
+from .._slots import slotted
+
+CORRELATION_TOLERANCE = 1e-10
+"""相关系数矩阵最小特征值允许的负向舍入误差（半正定判定）"""
+
+
+@slotted
+@dataclass(frozen=True)
 class MarketData:
     """
     市场数据数据类
     
     包含期权定价所需的所有市场数据参数
+    
+    实例不可变且可哈希，使用 __slots__ 存储字段（无实例 __dict__）
     """
     S: float
     """标的资产当前价格"""
@@ -84,3 +94,259 @@ class MarketData:
             f"MarketData(S={self.S:.2f}, K={self.K:.2f}, "
             f"T={self.T:.4f}, r={self.r:.4f}, sigma={self.sigma:.4f})"
         )
+
+
+class MarketDataBatch:
+    """
+    批量市场数据
+    
+    以 NumPy 列存储多条市场数据（每个字段一个一维 float64 数组），
+    用于批量定价，避免逐条构造 MarketData 对象
+    """
+    
+    __slots__ = ("S", "K", "T", "r", "sigma")
+    
+    FIELDS = ("S", "K", "T", "r", "sigma")
+    """字段名称（与 MarketData 一致）"""
+    
+    def __init__(
+        self,
+        S: np.ndarray,
+        K: np.ndarray,
+        T: np.ndarray,
+        r: np.ndarray,
+        sigma: np.ndarray,
+        validate: bool = True,
+    ):
+        """
+        初始化批量市场数据
+        
+        参数:
+            S: 标的资产当前价格数组
+            K: 执行价格数组
+            T: 到期时间（年）数组
+            r: 无风险利率（年化）数组
+            sigma: 波动率（年化）数组
+            validate: 是否立即执行向量化验证
+            
+        抛出:
+            ValueError: 如果各列长度不一致，或 validate=True 且参数无效
+        """
+        columns = [
+            np.asarray(column, dtype=np.float64).reshape(-1) for column in (S, K, T, r, sigma)
+        ]
+        lengths = {column.shape[0] for column in columns}
+        if len(lengths) > 1:
+            raise ValueError(f"各列长度必须一致，当前长度: {[c.shape[0] for c in columns]}")
+        for name, column in zip(self.FIELDS, columns):
+            object.__setattr__(self, name, column)
+        if validate:
+            self.validate()
+    
+    def validate(self, row_offset: int = 0) -> None:
+        """
+        向量化验证市场数据参数的有效性
+        
+        检查规则与 MarketData.validate 一致，另外拒绝 NaN/无穷等非有限值
+        
+        参数:
+            row_offset: 报告行号时加上的偏移（如本批数据在文件中的起始行）
+        
+        抛出:
+            ValueError: 如果参数无效，信息中包含第一条无效记录的行号
+        """
+        for name in self.FIELDS:
+            column = getattr(self, name)
+            bad = ~np.isfinite(column)
+            if bad.any():
+                row = int(np.argmax(bad))
+                raise ValueError(
+                    f"第 {row + row_offset} 行 {name} 必须是有限数值，当前值: {column[row]}"
+                )
+        checks = (
+            ("S", "标的资产价格 S 必须大于 0"),
+            ("K", "执行价格 K 必须大于 0"),
+            ("T", "到期时间 T 必须大于 0"),
+            ("sigma", "波动率 sigma 必须大于 0"),
+        )
+        for name, message in checks:
+            column = getattr(self, name)
+            bad = column <= 0
+            if bad.any():
+                row = int(np.argmax(bad))
+                raise ValueError(f"第 {row + row_offset} 行{message}，当前值: {column[row]}")
+    
+    @classmethod
+    def from_market_data(cls, items: Sequence[MarketData]) -> "MarketDataBatch":
+        """
+        由 MarketData 对象序列构造批量市场数据
+        
+        参数:
+            items: MarketData 对象序列
+            
+        返回:
+            MarketDataBatch 对象（各对象已验证，不再重复验证）
+        """
+        return cls(
+            *(
+                np.array([getattr(item, name) for item in items], dtype=np.float64)
+                for name in cls.FIELDS
+            ),
+            validate=False,
+        )
+    
+    def __len__(self) -> int:
+        return self.S.shape[0]
+    
+    def __getitem__(
+        self,
+        index: Union[int, slice, np.ndarray],
+    ) -> Union[MarketData, "MarketDataBatch"]:
+        """
+        按行取值
+        
+        参数:
+            index: 行号、切片或布尔/整数索引数组
+            
+        返回:
+            行号时返回 MarketData 对象，否则返回 MarketDataBatch 视图或副本
+        """
+        if isinstance(index, (int, np.integer)):
+            return MarketData(*(float(getattr(self, name)[index]) for name in self.FIELDS))
+        columns = (getattr(self, name)[index] for name in self.FIELDS)
+        return MarketDataBatch(*columns, validate=False)
+    
+    def __iter__(self) -> Iterator[MarketData]:
+        for i in range(len(self)):
+            yield self[i]  # type: ignore[misc]
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"MarketDataBatch 是不可变对象，不能修改属性 {name!r}")
+    
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """
+        将批量市场数据转换为列字典
+        
+        返回:
+            字段名称 -> 数组 的字典
+        """
+        return {name: getattr(self, name) for name in self.FIELDS}
+    
+    def __repr__(self) -> str:
+        """
+        返回批量市场数据的字符串表示
+        
+        返回:
+            格式化的字符串
+        """
+        return f"MarketDataBatch(size={len(self)})"
+
+
+@slotted
+@dataclass(frozen=True)
+class MultiAssetMarketData:
+    """
+    多资产市场数据数据类
+    
+    包含多资产期权定价所需的各标的现价、波动率、相关系数矩阵和无风险利率。
+    序列参数在初始化时转换为元组，因此实例不可变且可哈希（可用作缓存键）
+    """
+    S: Tuple[float, ...]
+    """各标的资产当前价格"""
+    
+    sigma: Tuple[float, ...]
+    """各标的资产波动率（年化）"""
+    
+    correlation: Tuple[Tuple[float, ...], ...]
+    """相关系数矩阵（按行存储）"""
+    
+    r: float
+    """无风险利率（年化）"""
+    
+    def __post_init__(self) -> None:
+        """
+        规范化序列参数并验证有效性
+        
+        抛出:
+            ValueError: 如果参数无效
+        """
+        object.__setattr__(self, "S", tuple(float(s) for s in self.S))
+        object.__setattr__(self, "sigma", tuple(float(s) for s in self.sigma))
+        object.__setattr__(
+            self,
+            "correlation",
+            tuple(tuple(float(c) for c in row) for row in np.asarray(self.correlation).tolist()),
+        )
+        self.validate()
+    
+    def validate(self) -> None:
+        """
+        验证多资产市场数据参数的有效性
+        
+        抛出:
+            ValueError: 如果参数无效
+        """
+        n = len(self.S)
+        if n == 0:
+            raise ValueError("标的资产数量必须至少为 1")
+        if len(self.sigma) != n:
+            raise ValueError(f"波动率数量必须与标的资产数量一致，当前: {len(self.sigma)} != {n}")
+        if min(self.S) <= 0:
+            raise ValueError(f"标的资产价格 S 必须大于 0，当前值: {self.S}")
+        if min(self.sigma) <= 0:
+            raise ValueError(f"波动率 sigma 必须大于 0，当前值: {self.sigma}")
+        corr = self.correlation_matrix
+        if corr.shape != (n, n):
+            raise ValueError(f"相关系数矩阵形状必须为 ({n}, {n})，当前: {corr.shape}")
+        if not np.allclose(corr, corr.T):
+            raise ValueError("相关系数矩阵必须对称")
+        if not np.allclose(np.diag(corr), 1.0):
+            raise ValueError("相关系数矩阵对角线必须为 1")
+        if np.abs(corr).max() > 1.0:
+            raise ValueError("相关系数必须在 [-1, 1] 之间")
+        smallest = float(np.linalg.eigvalsh(corr).min())
+        if smallest < -CORRELATION_TOLERANCE:
+            raise ValueError(f"相关系数矩阵必须半正定，当前最小特征值: {smallest:.3g}")
+    
+    @property
+    def n_assets(self) -> int:
+        """
+        标的资产数量
+        
+        返回:
+            标的资产个数
+        """
+        return len(self.S)
+    
+    @property
+    def correlation_matrix(self) -> np.ndarray:
+        """
+        相关系数矩阵
+        
+        返回:
+            形状为 (n_assets, n_assets) 的数组
+        """
+        return np.atleast_2d(np.array(self.correlation, dtype=float))
+    
+    def to_dict(self) -> dict:
+        """
+        将多资产市场数据转换为字典
+        
+        返回:
+            包含所有字段的字典
+        """
+        return {
+            "S": list(self.S),
+            "sigma": list(self.sigma),
+            "correlation": [list(row) for row in self.correlation],
+            "r": self.r,
+        }
+    
+    def __repr__(self) -> str:
+        """
+        返回多资产市场数据的字符串表示
+        
+        返回:
+            格式化的字符串
+        """
+        return f"MultiAssetMarketData(n_assets={self.n_assets}, r={self.r:.4f})"
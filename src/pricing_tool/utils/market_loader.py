@@ -0,0 +1,234 @@
+"""
+市场快照批量加载模块
+
+将 CSV 或 Parquet 格式的每日行情快照按块流式读入 NumPy 列，
+每块经过向量化验证后以 MarketDataBatch 形式产出，
+配合 prefetch 参数可在后台线程预读，使数据加载与定价计算重叠
+"""
+
+import queue
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+from .market_data import MarketDataBatch
+
+PathLike = Union[str, Path]
+
+_SENTINEL = object()
+
+
+def iter_market_data(
+    path: PathLike,
+    chunk_size: int = 100_000,
+    columns: Optional[Dict[str, str]] = None,
+    format: Optional[str] = None,
+    delimiter: str = ",",
+    validate: bool = True,
+    prefetch: int = 0,
+) -> Iterator[MarketDataBatch]:
+    """
+    按块流式读取市场快照
+
+    参数:
+        path: 快照文件路径
+        chunk_size: 每块的最大行数
+        columns: 字段名称 -> 文件列名 的映射（字段为 S、K、T、r、sigma），
+            未给出的字段使用同名列
+        format: "csv" 或 "parquet"；None 时根据文件后缀推断（非 .parquet 均按 CSV 处理）
+        delimiter: CSV 分隔符
+        validate: 是否对每块执行向量化验证（规则与 MarketData.validate 一致）
+        prefetch: 后台预读的块数；0 表示在调用方线程中同步读取
+
+    返回:
+        MarketDataBatch 生成器
+
+    抛出:
+        ValueError: 如果参数无效、缺少必需列或数据验证失败（行号为文件内的全局行号）
+        ImportError: 如果读取 Parquet 时未安装 pyarrow
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"分块大小 chunk_size 必须大于 0，当前值: {chunk_size}")
+    if prefetch < 0:
+        raise ValueError(f"预读块数 prefetch 不能为负数，当前值: {prefetch}")
+    mapping = {name: name for name in MarketDataBatch.FIELDS}
+    mapping.update(columns or {})
+    if format is None:
+        format = "parquet" if Path(path).suffix.lower() == ".parquet" else "csv"
+
+    if format == "csv":
+        chunks = _iter_csv(Path(path), chunk_size, mapping, delimiter)
+    elif format == "parquet":
+        chunks = _iter_parquet(Path(path), chunk_size, mapping)
+    else:
+        raise ValueError(f"不支持的格式: {format}，可选值: ('csv', 'parquet')")
+
+    batches = _to_batches(chunks, validate)
+    if prefetch:
+        batches = _prefetch(batches, prefetch)
+    return batches
+
+
+def _to_batches(
+    chunks: Iterator[List[np.ndarray]],
+    validate: bool,
+) -> Iterator[MarketDataBatch]:
+    """
+    将列块转换为 MarketDataBatch，验证失败时报告文件内的全局行号（从 0 开始，不含表头）
+
+    参数:
+        chunks: 按 S、K、T、r、sigma 顺序排列的列数组块
+        validate: 是否执行向量化验证
+
+    返回:
+        MarketDataBatch 生成器
+    """
+    offset = 0
+    for chunk in chunks:
+        batch = MarketDataBatch(*chunk, validate=False)
+        if validate:
+            batch.validate(row_offset=offset)
+        offset += len(batch)
+        yield batch
+
+
+def _iter_csv(
+    path: Path,
+    chunk_size: int,
+    mapping: Dict[str, str],
+    delimiter: str,
+) -> Iterator[List[np.ndarray]]:
+    """
+    按块读取 CSV 文件（首行为列名）
+
+    参数:
+        path: 文件路径
+        chunk_size: 每块行数
+        mapping: 字段名称 -> 文件列名
+        delimiter: 分隔符
+
+    返回:
+        列数组块生成器
+    """
+    with open(path, "r", newline="") as f:
+        header = [name.strip() for name in f.readline().rstrip("\r\n").split(delimiter)]
+        usecols = [_column_index(header, mapping[name], path) for name in MarketDataBatch.FIELDS]
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            data = np.loadtxt(
+                lines,
+                delimiter=delimiter,
+                usecols=usecols,
+                dtype=np.float64,
+                ndmin=2,
+            )
+            if data.shape[0]:
+                yield [np.ascontiguousarray(data[:, i]) for i in range(len(usecols))]
+
+
+def _column_index(header: List[str], name: str, path: Path) -> int:
+    """
+    查找列在表头中的位置
+
+    抛出:
+        ValueError: 如果列不存在
+    """
+    try:
+        return header.index(name)
+    except ValueError:
+        raise ValueError(f"{path} 缺少列: {name}，现有列: {header}") from None
+
+
+def _iter_parquet(
+    path: Path,
+    chunk_size: int,
+    mapping: Dict[str, str],
+) -> Iterator[List[np.ndarray]]:
+    """
+    按块读取 Parquet 文件（只读取所需列）
+
+    参数:
+        path: 文件路径
+        chunk_size: 每块行数
+        mapping: 字段名称 -> 文件列名
+
+    返回:
+        列数组块生成器
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("读取 Parquet 需要安装 pyarrow：pip install pyarrow") from exc
+
+    parquet_file = pq.ParquetFile(str(path))
+    source_names = [mapping[name] for name in MarketDataBatch.FIELDS]
+    available = parquet_file.schema_arrow.names
+    for name in source_names:
+        if name not in available:
+            raise ValueError(f"{path} 缺少列: {name}，现有列: {available}")
+    for record_batch in parquet_file.iter_batches(batch_size=chunk_size, columns=source_names):
+        yield [
+            np.asarray(
+                record_batch.column(i).to_numpy(zero_copy_only=False),
+                dtype=np.float64,
+            )
+            for i in range(len(source_names))
+        ]
+
+
+def _prefetch(iterator: Iterator[Any], depth: int) -> Iterator[Any]:
+    """
+    在后台线程中预读迭代器
+
+    参数:
+        iterator: 源迭代器
+        depth: 队列中最多缓存的元素数
+
+    返回:
+        与源迭代器产出相同元素的生成器；源迭代器中的异常在调用方线程重新抛出
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def offer(item: Any) -> bool:
+        """放入队列，调用方已停止消费时放弃并返回 False"""
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterator:
+                if not offer(item):
+                    return
+        except BaseException as exc:  # 转交给调用方线程
+            offer(exc)
+            return
+        finally:
+            # 调用方提前停止时关闭源生成器，释放其持有的文件句柄
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        offer(_SENTINEL)
+
+    worker = threading.Thread(target=produce, name="market-data-prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _SENTINEL:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
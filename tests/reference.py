@@ -0,0 +1,80 @@
+"""
+测试共用的基准公式和模型
+
+Black-Scholes 解析解、连续观察障碍期权解析解、Heston 半解析解以及由偏斜隐含波动率曲面构造的局部波动率模型，
+供多个测试模块作为参考值使用
+"""
+
+import numpy as np
+from scipy.integrate import quad
+from scipy.stats import norm
+
+from src.pricing_tool.models.local_vol import LocalVolModel
+
+MATURITIES = np.array([0.25, 0.5, 1.0, 2.0])
+LOG_MONEYNESS = np.linspace(-1.0, 1.0, 41)
+
+
+def skew_implied_vol(y):
+    """带偏斜和微笑的隐含波动率（与期限无关）"""
+    return 0.2 - 0.1 * y + 0.05 * y**2
+
+
+def skew_model():
+    """由偏斜隐含波动率曲面构造的局部波动率模型"""
+    implied = np.tile(skew_implied_vol(LOG_MONEYNESS), (MATURITIES.size, 1))
+    return LocalVolModel.from_implied_vol(100.0, 0.05, MATURITIES, LOG_MONEYNESS, implied)
+
+
+def black_scholes(S, K, T, r, sigma, option_type="call"):
+    """Black-Scholes 解析价格和 Greeks（用作基准）"""
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+    discount = K * np.exp(-r * T)
+    if option_type == "call":
+        price = S * norm.cdf(d1) - discount * norm.cdf(d2)
+        delta = norm.cdf(d1)
+        rho = T * discount * norm.cdf(d2)
+        theta = -S * norm.pdf(d1) * sigma / (2 * np.sqrt(T)) - r * discount * norm.cdf(d2)
+    else:
+        price = discount * norm.cdf(-d2) - S * norm.cdf(-d1)
+        delta = norm.cdf(d1) - 1.0
+        rho = -T * discount * norm.cdf(-d2)
+        theta = -S * norm.pdf(d1) * sigma / (2 * np.sqrt(T)) + r * discount * norm.cdf(-d2)
+    gamma = norm.pdf(d1) / (S * sigma * np.sqrt(T))
+    vega = S * norm.pdf(d1) * np.sqrt(T)
+    return dict(price=price, delta=delta, gamma=gamma, theta=theta, vega=vega, rho=rho)
+
+
+def down_and_out_call(S, K, T, r, sigma, barrier):
+    """连续观察向下敲出看涨期权的解析价格（barrier <= K，Reiner-Rubinstein 镜像公式）"""
+    exponent = 2.0 * r / sigma**2 - 1.0
+    mirror = black_scholes(barrier**2 / S, K, T, r, sigma)["price"]
+    return black_scholes(S, K, T, r, sigma)["price"] - (barrier / S) ** exponent * mirror
+
+
+def heston_call(S, K, T, r, model):
+    """Heston 看涨期权半解析价格（Albrecher 等的稳定形式，数值积分）"""
+    kappa, theta, xi, rho, v0 = model.kappa, model.theta, model.xi, model.rho, model.v0
+
+    def cf(u):
+        beta = kappa - rho * xi * 1j * u
+        d = np.sqrt(beta**2 + xi**2 * (1j * u + u**2))
+        g = (beta - d) / (beta + d)
+        C = kappa * theta / xi**2 * (
+            (beta - d) * T - 2.0 * np.log((1.0 - g * np.exp(-d * T)) / (1.0 - g))
+        )
+        D = (beta - d) / xi**2 * (1.0 - np.exp(-d * T)) / (1.0 - g * np.exp(-d * T))
+        return np.exp(C + D * v0 + 1j * u * (np.log(S) + r * T))
+
+    k = np.log(K)
+
+    def integrand_1(u):
+        return (np.exp(-1j * u * k) * cf(u - 1j) / (1j * u * cf(-1j))).real
+
+    def integrand_2(u):
+        return (np.exp(-1j * u * k) * cf(u) / (1j * u)).real
+
+    P1 = 0.5 + quad(integrand_1, 1e-8, 200.0, limit=400)[0] / np.pi
+    P2 = 0.5 + quad(integrand_2, 1e-8, 200.0, limit=400)[0] / np.pi
+    return S * P1 - K * np.exp(-r * T) * P2
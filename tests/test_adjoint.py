@@ -0,0 +1,201 @@
+"""
+测试伴随法 Greeks
+
+以公共随机数的扰动法和有限差分重定价为基准，验证 MC 和 PDE 的伴随 Greeks、
+局部波动率分桶 Vega，以及收益和插值内核的伴随
+"""
+
+import numpy as np
+import pytest
+
+from src.pricing_tool.models.heston import HestonModel
+from src.pricing_tool.models.local_vol import LocalVolModel
+from src.pricing_tool.options.asian_option import AsianOption
+from src.pricing_tool.options.barrier_option import BarrierOption
+from src.pricing_tool.options.european_option import EuropeanOption
+from src.pricing_tool.options.lookback_option import LookbackOption
+from src.pricing_tool.pricing.mc_pricing import MCPricing
+from src.pricing_tool.pricing.pde_pricing import PDEPricing
+from src.pricing_tool.utils.market_data import MarketData
+from tests.reference import skew_model
+
+MARKET = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+MONTHLY = [i / 12 for i in range(1, 13)]
+KWARGS = dict(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+
+
+def bumped_bucket(model, index, h):
+    """把局部波动率网格的一个节点扰动 h"""
+    local_vols = model.local_vols.copy()
+    local_vols[index] += h
+    return LocalVolModel(model.spot, model.rate, model.times, model.log_moneyness, local_vols)
+
+
+class TestKernelAdjoints:
+    """测试收益和局部波动率插值的伴随"""
+
+    @pytest.mark.parametrize(
+        "option",
+        [
+            AsianOption(**KWARGS, observation_dates=MONTHLY),
+            AsianOption(**KWARGS, average_type="geometric", observation_dates=MONTHLY),
+            LookbackOption(**KWARGS, option_type="put", observation_dates=MONTHLY),
+            LookbackOption(**KWARGS, lookback_type="floating", observation_dates=MONTHLY),
+        ],
+    )
+    def test_payoff_gradient(self, option):
+        """测试路径依赖收益的导数与有限差分一致"""
+        paths = np.random.default_rng(0).uniform(80.0, 120.0, (5, 12))
+        gradient = option.payoff_gradient(paths)
+        h = 1e-6
+        for column in range(12):
+            up, down = paths.copy(), paths.copy()
+            up[:, column] += h
+            down[:, column] -= h
+            expected = (option.payoff(up) - option.payoff(down)) / (2 * h)
+            np.testing.assert_allclose(gradient[:, column], expected, atol=1e-6)
+
+    def test_local_vol_vjp(self):
+        """测试局部波动率插值对价格和网格节点的伴随"""
+        model = skew_model()
+        S, t, bar = np.array([60.0, 95.0, 130.0]), 0.6, np.array([1.0, 2.0, 3.0])
+        bar_S, bar_grid = model.local_vol_vjp(S, t, bar)
+        h = 1e-6
+
+        expected_S = (model.local_vol(S + h, t) - model.local_vol(S - h, t)) / (2 * h) * bar
+        np.testing.assert_allclose(bar_S, expected_S, atol=1e-8)
+        for index in zip(*np.nonzero(bar_grid)):
+            moved = bumped_bucket(model, index, h)
+            expected = np.dot(bar, moved.local_vol(S, t) - model.local_vol(S, t)) / h
+            assert bar_grid[index] == pytest.approx(expected, rel=1e-6)
+
+    def test_barrier_not_differentiable(self):
+        """测试不连续收益拒绝伴随法"""
+        barrier = BarrierOption(**KWARGS, observation_dates=MONTHLY)
+        with pytest.raises(ValueError, match="扰动法"):
+            MCPricing(n_paths=1000, seed=0, greeks="adjoint").price(barrier, MARKET)
+
+
+class TestMCAdjoint:
+    """测试 MC 伴随 Greeks"""
+
+    @pytest.mark.parametrize(
+        "option",
+        [
+            EuropeanOption(S=100.0, K=105.0, T=1.0, r=0.05, sigma=0.2),
+            AsianOption(**KWARGS, observation_dates=MONTHLY, dividends=[(0.5, 2.0)]),
+        ],
+    )
+    def test_matches_bumped_greeks(self, option):
+        """测试与公共随机数扰动法一致，价格完全相同"""
+        bump = MCPricing(n_paths=100_000, seed=1).price(option, MARKET)
+        adjoint = MCPricing(n_paths=100_000, seed=1, greeks="adjoint").price(option, MARKET)
+
+        assert adjoint.price == bump.price
+        assert adjoint.delta == pytest.approx(bump.delta, abs=2e-3)
+        assert adjoint.gamma == pytest.approx(bump.gamma, abs=2e-3)
+        assert adjoint.vega == pytest.approx(bump.vega, rel=1e-2)
+        assert adjoint.rho == pytest.approx(bump.rho, rel=1e-3)
+
+    def test_local_vol_bucketed_vega(self):
+        """测试局部波动率分桶 Vega 与单节点扰动重定价一致"""
+        model = skew_model()
+        option = EuropeanOption(S=100.0, K=105.0, T=1.0, r=0.05, sigma=0.2)
+        method = MCPricing(n_paths=20_000, seed=3, model=model)
+        sensitivities = method.sensitivities(option, MARKET)
+        gradient = sensitivities.model_gradient
+        index = np.unravel_index(np.argmax(gradient), gradient.shape)
+        h = 1e-3
+
+        def price(m):
+            return MCPricing(n_paths=20_000, seed=3, model=m, compute_greeks=False).price(
+                option, MARKET
+            ).price
+
+        expected = price(bumped_bucket(model, index, h)) - price(bumped_bucket(model, index, -h))
+        assert gradient.shape == model.local_vols.shape
+        assert gradient[index] == pytest.approx(expected / (2 * h), rel=1e-3)
+        assert sensitivities.result.vega == pytest.approx(gradient.sum())
+
+    def test_heston_not_supported(self):
+        """测试没有伴随实现的模型"""
+        option = EuropeanOption(**KWARGS)
+        model = HestonModel(0.04, 1.5, 0.04, 0.5, -0.7)
+        method = MCPricing(n_paths=1000, seed=0, greeks="adjoint", model=model)
+        with pytest.raises(ValueError, match="伴随"):
+            method.price(option, MARKET)
+
+    def test_invalid_greek_method(self):
+        """测试无效的 Greeks 计算方式"""
+        with pytest.raises(ValueError):
+            MCPricing(greeks="aad")
+        with pytest.raises(ValueError):
+            PDEPricing(greeks="aad")
+
+
+class TestPDEAdjoint:
+    """测试 PDE 伴随 Greeks"""
+
+    @pytest.mark.parametrize(
+        "option",
+        [
+            EuropeanOption(S=100.0, K=105.0, T=1.0, r=0.05, sigma=0.2, option_type="put"),
+            BarrierOption(
+                **KWARGS, barrier=120.0, observation_dates=MONTHLY, dividends=[(0.5, 2.0)]
+            ),
+            BarrierOption(**KWARGS, barrier=120.0, knock="in", observation_dates=MONTHLY),
+            BarrierOption(**KWARGS, barrier=130.0),
+        ],
+    )
+    def test_matches_bumped_greeks(self, option):
+        """测试 Vega、Rho 与扰动重新求解一致，其余字段完全相同"""
+        bump = PDEPricing().price(option, MARKET)
+        adjoint = PDEPricing(greeks="adjoint").price(option, MARKET)
+
+        assert (adjoint.price, adjoint.delta, adjoint.gamma, adjoint.theta) == (
+            bump.price, bump.delta, bump.gamma, bump.theta
+        )
+        assert adjoint.vega == pytest.approx(bump.vega, abs=5e-3)
+        assert adjoint.rho == pytest.approx(bump.rho, abs=1e-4)
+
+    def test_rho_includes_boundary_discounting(self):
+        """测试窄网格上 Dirichlet 边界的贴现执行价计入 Rho，与利率整体平移重定价一致"""
+        option = BarrierOption(**KWARGS, barrier=80.0, direction="down")
+        h = 1e-4
+
+        def price(shift):
+            data = MarketData(S=100.0, K=100.0, T=1.0, r=0.05 + shift, sigma=0.2)
+            method = PDEPricing(n_std=1.5, compute_greeks=False)
+            return method.price(option.replace(r=0.05 + shift), data).price
+
+        expected = (price(h) - price(-h)) / (2 * h)
+        assert PDEPricing(n_std=1.5, greeks="adjoint").price(option, MARKET).rho == (
+            pytest.approx(expected, rel=1e-7)
+        )
+        assert PDEPricing(n_std=1.5).price(option, MARKET).rho == pytest.approx(expected, rel=1e-7)
+
+    def test_local_vol_bucketed_vega(self):
+        """测试局部波动率分桶 Vega 与单节点扰动重新求解一致"""
+        model = skew_model()
+        option = BarrierOption(**KWARGS, barrier=120.0, observation_dates=MONTHLY)
+        sensitivities = PDEPricing(model=model).sensitivities(option, MARKET)
+        gradient = sensitivities.model_gradient
+        index = np.unravel_index(np.argmax(np.abs(gradient)), gradient.shape)
+        h = 1e-4
+
+        def price(m):
+            return PDEPricing(model=m, compute_greeks=False).price(option, MARKET).price
+
+        bucket = price(bumped_bucket(model, index, h)) - price(bumped_bucket(model, index, -h))
+        assert gradient[index] == pytest.approx(bucket / (2 * h), rel=1e-5)
+        assert sensitivities.result.vega == pytest.approx(gradient.sum())
+
+    def test_batch_matches_single(self):
+        """测试批量伴随与逐个计算一致"""
+        options = [EuropeanOption(S=100.0, K=K, T=1.0, r=0.05, sigma=0.2) for K in (90.0, 110.0)]
+        method = PDEPricing(model=skew_model())
+        batch = method.sensitivities_batch(options, MARKET)
+
+        for option, result in zip(options, batch):
+            single = method.sensitivities(option, MARKET)
+            np.testing.assert_allclose(result.model_gradient, single.model_gradient, atol=1e-12)
@@ -0,0 +1,201 @@
+"""
+测试误差预算定价模块
+
+验证引擎选择规则、各引擎达到目标精度、时间预算下的提前停止，
+以及解析定价与 Black-Scholes 公式的一致性
+"""
+
+import pickle
+import time
+
+import numpy as np
+import pytest
+
+from src.pricing_tool.models.heston import HestonModel
+from src.pricing_tool.models.local_vol import LocalVolModel
+from src.pricing_tool.options.asian_option import AsianOption
+from src.pricing_tool.options.barrier_option import BarrierOption
+from src.pricing_tool.options.basket_option import BasketOption
+from src.pricing_tool.options.european_option import EuropeanOption
+from src.pricing_tool.pricing.analytic_pricing import AnalyticPricing
+from src.pricing_tool.pricing.auto_pricing import AutoPricing, AutoPricingResult
+from src.pricing_tool.pricing.pde_pricing import PDEPricing
+from src.pricing_tool.utils.market_data import MarketData
+from tests.reference import black_scholes, down_and_out_call, heston_call
+
+MARKET = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+KWARGS = dict(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+HESTON = HestonModel(v0=0.04, kappa=1.5, theta=0.04, xi=0.8, rho=-0.7)
+LOCAL_VOL = LocalVolModel(
+    100.0, 0.05, [0.5, 1.0], [-1.0, 0.0, 1.0], np.array([[0.3, 0.2, 0.18], [0.28, 0.2, 0.19]])
+)
+
+
+class TestAnalyticPricing:
+    """测试 Black-Scholes 解析定价"""
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_matches_black_scholes(self, option_type):
+        """测试价格和全部 Greeks 与 Black-Scholes 公式一致"""
+        option = EuropeanOption(**dict(KWARGS, K=110.0), option_type=option_type)
+        result = AnalyticPricing().price(option, MARKET)
+        expected = black_scholes(100.0, 110.0, 1.0, 0.05, 0.2, option_type)
+
+        for name, value in expected.items():
+            assert getattr(result, name) == pytest.approx(value, rel=1e-12)
+
+    def test_invalid_inputs(self):
+        """测试非几何布朗运动模型和奇异期权"""
+        with pytest.raises(ValueError, match="几何布朗运动"):
+            AnalyticPricing(HESTON)
+        with pytest.raises(ValueError, match="奇异期权"):
+            AnalyticPricing().price(BarrierOption(**KWARGS), MARKET)
+
+
+class TestAutoPricing:
+    """测试误差预算定价方法"""
+
+    @pytest.mark.parametrize(
+        "model, option, method",
+        [
+            (None, EuropeanOption(**KWARGS), "analytic"),
+            (HESTON, EuropeanOption(**KWARGS), "fourier"),
+            (LOCAL_VOL, EuropeanOption(**KWARGS), "pde"),
+            (None, BarrierOption(**KWARGS), "pde"),
+            (None, AsianOption(**KWARGS), "mc"),
+            (HESTON, BarrierOption(**KWARGS), "mc"),
+        ],
+    )
+    def test_select_method(self, model, option, method):
+        """测试按期权类别和模型选择引擎"""
+        assert AutoPricing(model=model).select_method(option) == method
+
+    def test_analytic(self):
+        """测试几何布朗运动下的欧式期权直接使用解析解"""
+        result = AutoPricing().price(EuropeanOption(**KWARGS), MARKET)
+
+        assert isinstance(result, AutoPricingResult)
+        assert result.method == "analytic"
+        assert result.error_estimate == 0.0
+        assert result.price == pytest.approx(black_scholes(100.0, 100.0, 1.0, 0.05, 0.2)["price"])
+
+    def test_fourier_reaches_tolerance(self):
+        """测试 Heston 欧式期权的 COS 展开项数逐级翻倍至目标精度"""
+        result = AutoPricing(tolerance=1e-6, model=HESTON).price(EuropeanOption(**KWARGS), MARKET)
+
+        assert result.method == "fourier"
+        assert result.converged
+        assert result.error_estimate <= 1e-6
+        assert result.price == pytest.approx(heston_call(100.0, 100.0, 1.0, 0.05, HESTON), abs=1e-5)
+
+    def test_pde_reaches_tolerance(self):
+        """测试局部波动率下的 PDE 网格加密至目标精度，且 Greeks 由伴随法给出"""
+        pricer = AutoPricing(tolerance=1e-3, model=LOCAL_VOL)
+        result = pricer.price(EuropeanOption(**KWARGS), MARKET)
+        reference = PDEPricing(n_space=3200, n_time=3200, compute_greeks=False, model=LOCAL_VOL)
+        expected = reference.price(EuropeanOption(**KWARGS), MARKET).price
+
+        assert result.method == "pde"
+        assert result.converged
+        assert result.price == pytest.approx(expected, abs=2e-3)
+        assert result.vega is not None
+        assert pricer.costs["pde"] > 0.0
+
+    def test_barrier_error_estimate_bounds_true_error(self):
+        """测试连续观察障碍的误差估计不低于相对解析解的真实误差"""
+        option = BarrierOption(**KWARGS, barrier=90.0, direction="down")
+        result = AutoPricing(tolerance=1e-2).price(option, MARKET)
+        error = abs(result.price - down_and_out_call(100.0, 100.0, 1.0, 0.05, 0.2, 90.0))
+
+        assert result.converged
+        assert error <= result.error_estimate <= 1e-2
+
+    def test_error_estimate_order(self):
+        """测试只有相邻两次观察到的收敛阶一致时才采信，否则按 1/2 阶的最坏情形估计"""
+        worst = 3e-3 / (np.sqrt(2.0) - 1.0)
+        second_order = [1.064, 1.016, 1.004, 1.001]
+        erratic = [1.0, 1.012, 1.015, 1.018]
+
+        assert AutoPricing._error_estimate("pde", second_order[1:]) == pytest.approx(worst)
+        assert AutoPricing._error_estimate("pde", second_order) == pytest.approx(1e-3)
+        assert AutoPricing._error_estimate("pde", second_order, smooth=False) == pytest.approx(
+            worst
+        )
+        assert AutoPricing._error_estimate("pde", erratic) == pytest.approx(worst)
+
+    def test_time_budget_includes_greeks_pass(self):
+        """测试加密的耗时预测包含最终的 Greeks 定价"""
+        pricer = AutoPricing(time_budget=1.0)
+        pricer.costs["pde"] = 1e-6
+        start = time.perf_counter()
+
+        assert pricer._affordable("pde", 200_000, start)
+        assert not pricer._affordable("pde", 200_000, start, greeks_work=200_000)
+        pricer.costs["pde+greeks"] = 1e-6
+        assert pricer._affordable("pde", 200_000, start, greeks_work=200_000)
+
+    def test_greeks_only_at_final_resolution(self):
+        """测试加密过程只求价格，Greeks 只在最终分辨率上计算一次"""
+        pricer = AutoPricing(tolerance=1e-3, model=LOCAL_VOL)
+        builds = []
+        build = pricer._pde
+
+        def recording(n, greeks):
+            builds.append((n, greeks))
+            return build(n, greeks)
+
+        pricer._pde = recording
+        result = pricer.price(EuropeanOption(**KWARGS), MARKET)
+
+        assert [greeks for _, greeks in builds].count(True) == 1
+        assert builds[-1] == (result.resolution, True)
+        assert result.delta is not None and result.vega is not None
+
+    @pytest.mark.parametrize("model", [None, HESTON, LOCAL_VOL])
+    def test_without_greeks(self, model):
+        """测试 compute_greeks=False 时各引擎都只给出价格"""
+        result = AutoPricing(model=model, compute_greeks=False).price(
+            EuropeanOption(**KWARGS), MARKET
+        )
+
+        assert (result.delta, result.gamma, result.vega) == (None, None, None)
+
+    def test_mc_paths_from_pilot(self):
+        """测试蒙特卡洛路径数由试点方差确定，标准误达到目标精度"""
+        result = AutoPricing(tolerance=0.02, seed=7).price(AsianOption(**KWARGS), MARKET)
+
+        assert result.method == "mc"
+        assert result.resolution > 10_000
+        assert result.error_estimate == result.std_error
+        assert result.std_error <= 0.025
+
+    def test_time_budget_stops_refinement(self):
+        """测试预测超出时间预算时停止加密，返回当前结果并标记未收敛"""
+        pricer = AutoPricing(tolerance=1e-9, time_budget=0.2)
+        result = pricer.price(BarrierOption(**KWARGS), MARKET)
+
+        assert result.method == "pde"
+        assert not result.converged
+        assert result.elapsed < 1.0
+        assert result.error_estimate > 1e-9
+
+    def test_result_serialization(self):
+        """测试结果可 pickle，字典中包含引擎选择"""
+        result = AutoPricing(model=HESTON).price(EuropeanOption(**KWARGS), MARKET)
+
+        assert pickle.loads(pickle.dumps(result)) == result
+        assert result.to_dict()["method"] == "fourier"
+        assert "method=fourier" in repr(result)
+        assert not hasattr(result, "__dict__")
+
+    def test_invalid_inputs(self):
+        """测试无效参数和多资产期权"""
+        with pytest.raises(ValueError, match="time_budget"):
+            AutoPricing(tolerance=None)
+        with pytest.raises(ValueError):
+            AutoPricing(tolerance=-1.0)
+        with pytest.raises(ValueError):
+            AutoPricing(pilot_paths=1001)
+        basket = BasketOption(S=[100.0, 100.0], K=100.0, T=1.0, r=0.05, sigma=[0.2, 0.3])
+        with pytest.raises(ValueError, match="多资产"):
+            AutoPricing().select_method(basket)
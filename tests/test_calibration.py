@@ -0,0 +1,129 @@
+"""
+测试校准模块
+
+用已知参数的模型生成报价曲面，验证校准器能恢复参数、热启动减少迭代，
+以及特征函数解析梯度的正确性
+"""
+
+import dataclasses
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from src.pricing_tool.calibration.calibrator import ModelCalibrator, QuoteChain
+from src.pricing_tool.models.gbm import GBMModel
+from src.pricing_tool.models.heston import HestonModel
+from src.pricing_tool.models.local_vol import LocalVolModel
+from src.pricing_tool.options.european_option import EuropeanOption
+from src.pricing_tool.pricing.fourier_pricing import FourierPricing
+from src.pricing_tool.utils.market_data import MarketData
+
+TRUE_HESTON = HestonModel(v0=0.05, kappa=2.0, theta=0.06, xi=0.7, rho=-0.65)
+MATURITIES = np.repeat([0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0], 25)
+STRIKES = np.tile(np.linspace(70.0, 140.0, 25), 8)
+TYPES = np.where(STRIKES >= 100.0, "call", "put")
+
+
+def surface(model):
+    """由模型生成 200 个报价的曲面（价外期权）"""
+    pricer = FourierPricing(model=model, n_terms=512, truncation=20.0)
+    prices = np.empty_like(STRIKES)
+    for T in np.unique(MATURITIES):
+        mask = MATURITIES == T
+        prices[mask] = pricer.price_strikes(STRIKES[mask], T, 100.0, 0.03, TYPES[mask])
+    return QuoteChain(100.0, 0.03, STRIKES, MATURITIES, prices, TYPES)
+
+
+@dataclass(frozen=True)
+class NoGradientGBM(GBMModel):
+    """没有解析梯度的模型（校准退化为有限差分）"""
+
+    def characteristic_function_gradient(self, u, T, r):
+        raise NotImplementedError
+
+
+class TestGradient:
+    """测试特征函数的解析梯度"""
+
+    @pytest.mark.parametrize("model", [GBMModel(0.25), TRUE_HESTON])
+    def test_matches_finite_difference(self, model):
+        """测试解析梯度与中心差分一致（期限可广播）"""
+        u = np.linspace(0.0, 30.0, 7)[np.newaxis, :]
+        T = np.array([[0.25], [2.0]])
+        gradient = model.characteristic_function_gradient(u, T, 0.03)
+
+        for i, field in enumerate(dataclasses.fields(model)):
+            h = 1e-6
+            value = getattr(model, field.name)
+            up = dataclasses.replace(model, **{field.name: value + h})
+            down = dataclasses.replace(model, **{field.name: value - h})
+            expected = (
+                up.characteristic_function(u, T, 0.03) - down.characteristic_function(u, T, 0.03)
+            ) / (2 * h)
+            np.testing.assert_allclose(gradient[i], expected, atol=1e-7)
+
+
+class TestModelCalibrator:
+    """测试模型校准器"""
+
+    def test_heston_recovers_parameters(self):
+        """测试从 200 个报价的曲面恢复 Heston 参数，且在亚秒级完成"""
+        quotes = surface(TRUE_HESTON)
+        initial = HestonModel(v0=0.04, kappa=1.0, theta=0.04, xi=0.5, rho=-0.3)
+        result = ModelCalibrator().calibrate(quotes, initial)
+
+        assert result.success
+        assert result.elapsed < 1.0
+        assert result.max_abs_error < 1e-5
+        for field in dataclasses.fields(TRUE_HESTON):
+            assert getattr(result.model, field.name) == pytest.approx(
+                getattr(TRUE_HESTON, field.name), rel=1e-4
+            )
+
+    def test_warm_start(self):
+        """测试以前一日参数热启动只需更少的迭代"""
+        calibrator = ModelCalibrator()
+        yesterday = calibrator.calibrate(
+            surface(TRUE_HESTON), HestonModel(v0=0.04, kappa=1.0, theta=0.04, xi=0.5, rho=-0.3)
+        )
+        today_model = dataclasses.replace(TRUE_HESTON, v0=0.055, rho=-0.6)
+        cold = calibrator.calibrate(
+            surface(today_model), HestonModel(v0=0.04, kappa=1.0, theta=0.04, xi=0.5, rho=-0.3)
+        )
+        warm = calibrator.calibrate(surface(today_model), yesterday.model)
+
+        assert warm.model.v0 == pytest.approx(0.055, rel=1e-4)
+        assert warm.iterations < cold.iterations
+
+    def test_gbm_from_options(self):
+        """测试由期权对象构造报价链并校准 GBM 波动率"""
+        market = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+        options = [
+            EuropeanOption(S=100.0, K=K, T=T, r=0.05, sigma=0.2)
+            for T in (0.5, 1.0)
+            for K in (90.0, 100.0, 110.0)
+        ]
+        true_market = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.27)
+        prices = [FourierPricing().price(option, true_market).price for option in options]
+        quotes = QuoteChain.from_options(options, prices, market)
+
+        analytic = ModelCalibrator().calibrate(quotes, GBMModel(0.2))
+        numeric = ModelCalibrator().calibrate(quotes, NoGradientGBM(0.2))
+
+        assert analytic.model.sigma == pytest.approx(0.27, rel=1e-6)
+        assert numeric.model.sigma == pytest.approx(0.27, rel=1e-6)
+        assert isinstance(numeric.model, NoGradientGBM)
+
+    def test_invalid_inputs(self):
+        """测试无效报价链和不可校准的模型"""
+        with pytest.raises(ValueError, match="长度"):
+            QuoteChain(100.0, 0.05, [90.0, 100.0], [1.0], [12.0, 8.0])
+        with pytest.raises(ValueError):
+            QuoteChain(100.0, 0.05, [100.0], [1.0], [8.0], ["straddle"])
+        quotes = QuoteChain(100.0, 0.05, [100.0], [1.0], [10.45])
+        local_vol = LocalVolModel(100.0, 0.05, [1.0], [-1.0, 0.0, 1.0], np.full((1, 3), 0.2))
+        with pytest.raises(ValueError, match="参数化模型"):
+            ModelCalibrator().calibrate(quotes, local_vol)
+        with pytest.raises(ValueError, match="bounds"):
+            ModelCalibrator(bounds={"v0": (0.0, 1.0)}).calibrate(quotes, TRUE_HESTON)
@@ -0,0 +1,32 @@
+"""
+测试欧式期权模块
+"""
+
+import numpy as np
+
+from src.pricing_tool.options.european_option import EuropeanOption
+
+
+class TestEuropeanOption:
+    """测试 EuropeanOption"""
+
+    def test_default_type_is_call(self):
+        """测试默认期权类型为看涨"""
+        option = EuropeanOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+
+        assert option.is_call is True
+
+    def test_payoff(self):
+        """测试看涨/看跌收益"""
+        S_T = np.array([80.0, 100.0, 120.0])
+        call = EuropeanOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, option_type="call")
+        put = EuropeanOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, option_type="put")
+
+        np.testing.assert_array_almost_equal(call.payoff(S_T), [0.0, 0.0, 20.0])
+        np.testing.assert_array_almost_equal(put.payoff(S_T), [20.0, 0.0, 0.0])
+
+    def test_repr(self):
+        """测试字符串表示"""
+        option = EuropeanOption(S=100.0, K=90.0, T=1.0, r=0.05, sigma=0.2)
+
+        assert repr(option).startswith("EuropeanOption(S=100.00, K=90.00")
@@ -0,0 +1,154 @@
+"""
+测试奇异期权模块
+
+验证障碍/亚式/回望期权收益、观察日程和分红日程的验证与规范化
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from src.pricing_tool.options.asian_option import AsianOption
+from src.pricing_tool.options.barrier_option import BarrierOption
+from src.pricing_tool.options.lookback_option import LookbackOption
+
+PATHS = np.array(
+    [
+        [100.0, 125.0, 110.0],
+        [95.0, 105.0, 115.0],
+        [90.0, 80.0, 85.0],
+    ]
+)
+
+
+class TestSchedules:
+    """测试观察日程和分红日程"""
+
+    def test_observation_dates_sorted_and_end_at_maturity(self):
+        """测试观察日升序、去重并以到期日结尾"""
+        option = AsianOption(100.0, 100.0, 1.0, 0.05, 0.2, observation_dates=[0.5, 0.25, 0.5])
+
+        assert option.observation_dates == (0.25, 0.5, 1.0)
+        assert option.is_discretely_monitored
+
+    def test_continuous_monitoring_by_default(self):
+        """测试默认连续观察"""
+        option = BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2)
+
+        assert option.observation_dates is None
+        assert not option.is_discretely_monitored
+        assert option.dividends == ()
+
+    @pytest.mark.parametrize("dates", [[0.0, 0.5], [0.5, 1.5]])
+    def test_invalid_observation_dates(self, dates):
+        """测试观察日不在 (0, T] 内时报错"""
+        with pytest.raises(ValueError, match="观察日"):
+            BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, observation_dates=dates)
+
+    def test_dividends_sorted_and_truncated_at_maturity(self):
+        """测试分红按时间排序，到期后的分红被忽略"""
+        option = BarrierOption(
+            100.0, 100.0, 1.0, 0.05, 0.2, dividends=[(0.75, 1.0), (0.25, 2.0), (1.5, 3.0)]
+        )
+
+        assert option.dividends == ((0.25, 2.0), (0.75, 1.0))
+
+    @pytest.mark.parametrize("dividend", [(0.0, 1.0), (0.5, -1.0)])
+    def test_invalid_dividends(self, dividend):
+        """测试无效分红报错"""
+        with pytest.raises(ValueError):
+            BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, dividends=[dividend])
+
+    def test_schedule_part_of_identity(self):
+        """测试日程参与相等比较、哈希和序列化"""
+        a = BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, observation_dates=[0.5])
+        b = BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, observation_dates=[0.5])
+        c = BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2)
+
+        assert a == b and hash(a) == hash(b)
+        assert a != c
+        assert pickle.loads(pickle.dumps(a)) == a
+
+
+class TestPayoffs:
+    """测试收益函数"""
+
+    def test_barrier_out_and_in(self):
+        """测试敲出和敲入收益互补"""
+        kwargs = dict(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, barrier=120.0)
+        out = BarrierOption(knock="out", **kwargs).payoff(PATHS)
+        knock_in = BarrierOption(knock="in", **kwargs).payoff(PATHS)
+
+        np.testing.assert_array_almost_equal(out, [0.0, 15.0, 0.0])
+        np.testing.assert_array_almost_equal(knock_in, [10.0, 0.0, 0.0])
+
+    def test_down_barrier(self):
+        """测试向下敲出"""
+        option = BarrierOption(
+            100.0, 80.0, 1.0, 0.05, 0.2, option_type="call", barrier=85.0, direction="down"
+        )
+
+        np.testing.assert_array_almost_equal(option.payoff(PATHS), [30.0, 35.0, 0.0])
+
+    def test_barrier_one_dimensional_input(self):
+        """测试一维输入视为只在到期日观察"""
+        option = BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, barrier=120.0)
+
+        np.testing.assert_array_almost_equal(option.payoff(np.array([110.0, 130.0])), [10.0, 0.0])
+
+    def test_barrier_survival_weights(self):
+        """测试布朗桥未触及概率：敲出乘以概率，敲入取互补概率，已触及的路径不受影响"""
+        kwargs = dict(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, barrier=120.0)
+        survival = np.array([0.5, 0.8, 0.3])
+        out = BarrierOption(knock="out", **kwargs).payoff(PATHS, survival)
+        knock_in = BarrierOption(knock="in", **kwargs).payoff(PATHS, survival)
+
+        np.testing.assert_array_almost_equal(out, [0.0, 12.0, 0.0])
+        np.testing.assert_array_almost_equal(knock_in, [10.0, 3.0, 0.0])
+        assert BarrierOption(**kwargs).continuous_barrier() == (120.0, "up")
+        assert BarrierOption(observation_dates=[1.0], **kwargs).continuous_barrier() is None
+
+    def test_invalid_barrier(self):
+        """测试无效障碍参数"""
+        with pytest.raises(ValueError):
+            BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, barrier=-1.0)
+        with pytest.raises(ValueError):
+            BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, direction="sideways")
+
+    def test_knock_in_components(self):
+        """测试敲入期权分解为 普通期权 - 敲出期权"""
+        option = BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, barrier=120.0, knock="in")
+        (w1, vanilla), (w2, knock_out) = option.pde_components()
+
+        total = w1 * vanilla.payoff(PATHS) + w2 * knock_out.payoff(PATHS)
+        np.testing.assert_array_almost_equal(total, option.payoff(PATHS))
+
+    def test_asian_payoff(self):
+        """测试算术和几何平均收益"""
+        arithmetic = AsianOption(100.0, 100.0, 1.0, 0.05, 0.2)
+        geometric = AsianOption(100.0, 100.0, 1.0, 0.05, 0.2, average_type="geometric")
+
+        np.testing.assert_array_almost_equal(
+            arithmetic.payoff(PATHS), np.maximum(PATHS.mean(axis=1) - 100.0, 0.0)
+        )
+        expected = np.maximum(np.exp(np.log(PATHS).mean(axis=1)) - 100.0, 0.0)
+        np.testing.assert_array_almost_equal(geometric.payoff(PATHS), expected)
+
+    def test_lookback_payoff(self):
+        """测试固定和浮动执行价回望收益"""
+        fixed = LookbackOption(100.0, 100.0, 1.0, 0.05, 0.2)
+        floating = LookbackOption(100.0, 100.0, 1.0, 0.05, 0.2, lookback_type="floating")
+
+        np.testing.assert_array_almost_equal(fixed.payoff(PATHS), [25.0, 15.0, 0.0])
+        np.testing.assert_array_almost_equal(floating.payoff(PATHS), [10.0, 20.0, 5.0])
+
+    def test_path_dependent_options_not_pde_supported(self):
+        """测试依赖平均值或极值的期权不支持 PDE"""
+        assert not AsianOption.pde_supported
+        assert not LookbackOption.pde_supported
+        assert BarrierOption.pde_supported
+        with pytest.raises(ValueError, match="不支持一维 PDE 定价"):
+            AsianOption(100.0, 100.0, 1.0, 0.05, 0.2).boundary_condition(np.array([1.0]), 0.0)
+        with pytest.raises(ValueError, match="不支持一维 PDE 定价"):
+            LookbackOption(100.0, 100.0, 1.0, 0.05, 0.2).boundary_condition(np.array([1.0]), 0.0)
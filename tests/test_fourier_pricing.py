@@ -0,0 +1,133 @@
+"""
+测试 Fourier 定价模块
+
+以 Black-Scholes 公式和 Heston 半解析公式为基准，验证 COS 和 Carr-Madan 方法
+的执行价序列定价、Greeks 和特征函数缓存
+"""
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from src.pricing_tool.models.gbm import GBMModel
+from src.pricing_tool.models.heston import HestonModel
+from src.pricing_tool.models.local_vol import LocalVolModel
+from src.pricing_tool.options.barrier_option import BarrierOption
+from src.pricing_tool.options.european_option import EuropeanOption
+from src.pricing_tool.pricing.computation_cache import ComputationCache
+from src.pricing_tool.pricing.fourier_pricing import FourierPricing
+from src.pricing_tool.utils.market_data import MarketData
+from tests.reference import heston_call
+
+HESTON = HestonModel(v0=0.04, kappa=1.5, theta=0.04, xi=0.8, rho=-0.7)
+MARKET = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+STRIKES = np.array([70.0, 85.0, 100.0, 115.0, 130.0])
+
+
+def bs_price(S, K, T, r, sigma, option_type="call"):
+    """Black-Scholes 价格、Delta 和 Gamma"""
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+    call = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+    gamma = norm.pdf(d1) / (S * sigma * np.sqrt(T))
+    if option_type == "call":
+        return call, norm.cdf(d1), gamma
+    return call - S + K * np.exp(-r * T), norm.cdf(d1) - 1.0, gamma
+
+
+class TestCharacteristicFunction:
+    """测试模型特征函数"""
+
+    @pytest.mark.parametrize("model", [GBMModel(0.2), HESTON])
+    def test_normalization_and_martingale(self, model):
+        """测试 phi(0) = 1，且 E[S_T / S_0] = phi(-i) = exp(rT)"""
+        phi = model.characteristic_function(np.array([0.0, -1j]), 2.0, 0.05)
+
+        assert phi[0] == pytest.approx(1.0)
+        assert phi[1] == pytest.approx(np.exp(0.1))
+
+    def test_local_vol_not_supported(self):
+        """测试没有解析特征函数的模型"""
+        model = LocalVolModel(100.0, 0.05, [1.0], [-1.0, 0.0, 1.0], np.full((1, 3), 0.2))
+
+        with pytest.raises(ValueError, match="没有解析特征函数"):
+            FourierPricing(model=model)
+        with pytest.raises(ValueError, match="没有解析特征函数"):
+            FourierPricing().price_strikes(STRIKES, 1.0, 100.0, 0.05, model=model)
+
+
+class TestFourierPricing:
+    """测试 Fourier 定价方法"""
+
+    @pytest.mark.parametrize("method", ["cos", "carr_madan"])
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_gbm_strip_matches_black_scholes(self, method, option_type):
+        """测试几何布朗运动下的执行价序列与 Black-Scholes 一致"""
+        prices = FourierPricing(method=method, model=GBMModel(0.2)).price_strikes(
+            STRIKES, 1.0, 100.0, 0.05, option_type
+        )
+        expected = bs_price(100.0, STRIKES, 1.0, 0.05, 0.2, option_type)[0]
+
+        np.testing.assert_allclose(prices, expected, atol=1e-5)
+
+    @pytest.mark.parametrize("method", ["cos", "carr_madan"])
+    def test_heston_matches_semi_analytic(self, method):
+        """测试 Heston 模型下与半解析公式一致"""
+        prices = FourierPricing(method=method, model=HESTON).price_strikes(
+            STRIKES, 1.0, 100.0, 0.05
+        )
+        expected = [heston_call(100.0, K, 1.0, 0.05, HESTON) for K in STRIKES]
+
+        np.testing.assert_allclose(prices, expected, atol=1e-4)
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_cos_greeks(self, option_type):
+        """测试 COS 方法的 Delta、Gamma 与 Black-Scholes 一致"""
+        option = EuropeanOption(S=100.0, K=110.0, T=1.0, r=0.05, sigma=0.2, option_type=option_type)
+        result = FourierPricing().price(option, MARKET)
+        price, delta, gamma = bs_price(100.0, 110.0, 1.0, 0.05, 0.2, option_type)
+
+        assert result.price == pytest.approx(price, abs=1e-8)
+        assert result.delta == pytest.approx(delta, abs=1e-8)
+        assert result.gamma == pytest.approx(gamma, abs=1e-8)
+        assert result.vega is None
+
+    def test_batch_groups_by_maturity_and_caches(self):
+        """测试批量定价按 (模型, r, T, 现价) 分组，相同期限复用特征函数"""
+        method = FourierPricing(model=HESTON)
+        options = [
+            EuropeanOption(S=100.0, K=K, T=T, r=0.05, sigma=0.2)
+            for T in (0.5, 1.0)
+            for K in STRIKES
+        ]
+        results = method.price_batch(options, MARKET)
+        shifted = MarketData(S=105.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+        method.price_batch(options[5:], shifted)
+
+        assert type(method.cache) is ComputationCache
+        assert len(method.cache) == 2
+        assert method.cache.stats()["hits"] == 1
+        for option, result in zip(options[5:], results[5:]):
+            assert result.price == pytest.approx(
+                heston_call(100.0, option.K, 1.0, 0.05, HESTON), abs=1e-4
+            )
+
+    def test_market_sigma_used_without_model(self):
+        """测试未指定模型时使用 MarketData.sigma"""
+        option = EuropeanOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+        result = FourierPricing(method="carr_madan").price(option, MARKET)
+
+        assert result.price == pytest.approx(bs_price(100.0, 100.0, 1.0, 0.05, 0.2)[0], abs=1e-5)
+        assert result.delta is None
+
+    def test_invalid_arguments(self):
+        """测试无效参数和不支持的期权"""
+        with pytest.raises(ValueError):
+            FourierPricing(method="fft")
+        with pytest.raises(ValueError):
+            FourierPricing(n_terms=1)
+        with pytest.raises(ValueError, match="model"):
+            FourierPricing().price_strikes(STRIKES, 1.0, 100.0, 0.05)
+        barrier = BarrierOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+        with pytest.raises(ValueError, match="奇异期权"):
+            FourierPricing().price(barrier, MARKET)
@@ -0,0 +1,107 @@
+"""
+测试 Heston 模型定价
+
+以半解析公式为基准，验证 QE 蒙特卡洛和 ADI 有限差分（HV、Craig-Sneyd）的精度
+"""
+
+import numpy as np
+import pytest
+
+from src.pricing_tool.models.heston import HestonModel
+from src.pricing_tool.options.barrier_option import BarrierOption
+from src.pricing_tool.options.european_option import EuropeanOption
+from src.pricing_tool.pricing.adi_pricing import ADIPricing
+from src.pricing_tool.pricing.mc_pricing import MCPricing
+from src.pricing_tool.utils.market_data import MarketData
+from tests.reference import heston_call
+
+MODEL = HestonModel(v0=0.04, kappa=1.5, theta=0.04, xi=0.8, rho=-0.7)
+MARKET = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+
+
+class TestHestonMC:
+    """测试 Heston QE 蒙特卡洛"""
+
+    @pytest.mark.parametrize("K", [80.0, 100.0, 120.0])
+    def test_matches_semi_analytic(self, K):
+        """测试价格与半解析公式一致"""
+        option = EuropeanOption(S=100.0, K=K, T=1.0, r=0.05, sigma=0.2)
+        method = MCPricing(n_paths=100_000, seed=1, model=MODEL, compute_greeks=False)
+        result = method.price(option, MARKET)
+
+        assert result.price == pytest.approx(heston_call(100.0, K, 1.0, 0.05, MODEL), abs=4e-2)
+
+    def test_intervals_subdivided_by_max_step(self):
+        """测试非精确转移模型按 max_step 细分时间步，收敛到相同价格"""
+        option = EuropeanOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+        coarse = MCPricing(n_paths=50_000, seed=3, model=MODEL, max_step=1.0, compute_greeks=False)
+        fine = MCPricing(n_paths=50_000, seed=3, model=MODEL, max_step=1 / 26, compute_greeks=False)
+        expected = heston_call(100.0, 100.0, 1.0, 0.05, MODEL)
+        result = fine.price(option, MARKET)
+
+        assert result.price == pytest.approx(expected, abs=4 * result.std_error)
+        assert result.price != coarse.price(option, MARKET).price
+
+    def test_discrete_barrier_under_heston(self):
+        """测试 Heston 下的离散障碍期权（敲入 + 敲出 = 普通期权）"""
+        method = MCPricing(n_paths=20_000, seed=5, model=MODEL, compute_greeks=False)
+        dates = [i / 12 for i in range(1, 13)]
+        kwargs = dict(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, observation_dates=dates)
+        out = method.price(BarrierOption(barrier=120.0, knock="out", **kwargs), MARKET)
+        knock_in = method.price(BarrierOption(barrier=120.0, knock="in", **kwargs), MARKET)
+        vanilla = method.price(BarrierOption(barrier=np.inf, **kwargs), MARKET)
+
+        assert out.price + knock_in.price == pytest.approx(vanilla.price, rel=1e-10)
+
+
+class TestADIPricing:
+    """测试 Heston ADI 有限差分"""
+
+    @pytest.mark.parametrize("scheme", ["hv", "cs"])
+    def test_matches_semi_analytic(self, scheme):
+        """测试看涨/看跌价格与半解析公式一致（批量求解）"""
+        options = [
+            EuropeanOption(S=100.0, K=K, T=1.0, r=0.05, sigma=0.2, option_type=kind)
+            for K in (80.0, 100.0, 120.0)
+            for kind in ("call", "put")
+        ]
+        results = ADIPricing(MODEL, scheme=scheme, compute_greeks=False).price_batch(
+            options, MARKET
+        )
+
+        for option, result in zip(options, results):
+            call = heston_call(100.0, option.K, 1.0, 0.05, MODEL)
+            expected = call if option.is_call else call - 100.0 + option.K * np.exp(-0.05)
+            assert result.price == pytest.approx(expected, abs=5e-2)
+
+    def test_greeks(self):
+        """测试 Greeks 与有限差分重定价一致"""
+        option = EuropeanOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+        method = ADIPricing(MODEL)
+        result = method.price(option, MARKET)
+        up = method.price(option, MarketData(S=101.0, K=100.0, T=1.0, r=0.05, sigma=0.2))
+        down = method.price(option, MarketData(S=99.0, K=100.0, T=1.0, r=0.05, sigma=0.2))
+
+        assert result.delta == pytest.approx((up.price - down.price) / 2.0, abs=5e-3)
+        assert 0.0 < result.gamma < 0.05
+        assert result.vega > 0 and result.rho > 0 and result.theta < 0
+
+    def test_factorizations_cached(self):
+        """测试相同 (r, T) 的重复定价复用分解结果"""
+        option = EuropeanOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+        method = ADIPricing(MODEL, compute_greeks=False)
+        method.price(option, MARKET)
+        method.price(option, MarketData(S=110.0, K=100.0, T=1.0, r=0.05, sigma=0.2))
+
+        assert method.cache.stats()["hits"] == 1
+        assert len(method.cache) == 1
+
+    def test_invalid_arguments(self):
+        """测试无效参数和不支持的期权"""
+        with pytest.raises(ValueError):
+            ADIPricing(MODEL, scheme="douglas")
+        with pytest.raises(ValueError):
+            ADIPricing(MODEL, n_x=101)
+        barrier = BarrierOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+        with pytest.raises(ValueError, match="奇异期权"):
+            ADIPricing(MODEL).price(barrier, MARKET)
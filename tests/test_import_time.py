@@ -0,0 +1,105 @@
+"""
+测试包导入开销
+
+验证 pricing_tool 及其子包为延迟加载，冷启动不导入 scipy 和定价引擎，
+并在独立子进程中检查导入时间预算
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# 冷启动导入 pricing_tool 的时间预算（秒），远高于实际耗时以容忍 CI 抖动
+IMPORT_BUDGET_SECONDS = 0.25
+
+
+def _run_cold(code: str) -> dict:
+    """
+    在全新的解释器中执行代码，返回其输出的 JSON
+
+    参数:
+        code: 待执行的代码，需在最后打印一个 JSON 对象
+
+    返回:
+        解析后的 JSON 字典
+    """
+    prelude = f"import sys, json, time\nsys.path.insert(0, {str(SRC_DIR)!r})\n"
+    completed = subprocess.run(
+        [sys.executable, "-c", prelude + code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class TestLazyImports:
+    """测试延迟加载行为"""
+
+    def test_import_package_is_lightweight(self):
+        """测试导入主包不加载子模块和重量级依赖"""
+        result = _run_cold(
+            "import pricing_tool, pricing_tool.options, pricing_tool.pricing, pricing_tool.utils\n"
+            "print(json.dumps({m: m in sys.modules for m in "
+            "['numpy', 'scipy', 'pricing_tool.options.base', 'pricing_tool.pricing.base', "
+            "'pricing_tool.utils.market_data']}))"
+        )
+
+        assert result == {
+            "numpy": False,
+            "scipy": False,
+            "pricing_tool.options.base": False,
+            "pricing_tool.pricing.base": False,
+            "pricing_tool.utils.market_data": False,
+        }
+
+    def test_attribute_access_loads_on_demand(self):
+        """测试首次访问属性时才加载对应模块，且不加载 scipy"""
+        result = _run_cold(
+            "import pricing_tool\n"
+            "cls = pricing_tool.PricingResult\n"
+            "print(json.dumps({'name': cls.__name__, "
+            "'loaded': 'pricing_tool.pricing.base' in sys.modules, "
+            "'scipy': 'scipy' in sys.modules, "
+            "'cached': 'PricingResult' in vars(pricing_tool)}))"
+        )
+
+        assert result == {"name": "PricingResult", "loaded": True, "scipy": False, "cached": True}
+
+    def test_subpackage_attribute_access(self):
+        """测试通过子包访问的类与直接导入的类一致"""
+        from src.pricing_tool import options, pricing, utils
+        from src.pricing_tool.options.base import Option
+        from src.pricing_tool.pricing.base import PricingMethod
+        from src.pricing_tool.utils.market_data import MarketData
+
+        assert options.Option is Option
+        assert pricing.PricingMethod is PricingMethod
+        assert utils.MarketData is MarketData
+        assert "Option" in dir(options)
+
+    def test_unknown_attribute_raises(self):
+        """测试访问不存在的属性时抛出 AttributeError"""
+        import src.pricing_tool as pricing_tool
+
+        with pytest.raises(AttributeError):
+            pricing_tool.does_not_exist
+
+
+class TestImportTimeBudget:
+    """测试冷启动导入时间预算"""
+
+    def test_cold_import_within_budget(self):
+        """测试冷启动导入 pricing_tool 的耗时在预算之内"""
+        result = _run_cold(
+            "start = time.perf_counter()\n"
+            "import pricing_tool, pricing_tool.options, pricing_tool.pricing, pricing_tool.utils\n"
+            "print(json.dumps({'elapsed': time.perf_counter() - start}))"
+        )
+
+        assert result["elapsed"] < IMPORT_BUDGET_SECONDS
@@ -4,9 +4,10 @@
 验证 MarketData 数据类的功能
 """
 
+import numpy as np
 import pytest
 
-from src.pricing_tool.utils.market_data import MarketData
+from src.pricing_tool.utils.market_data import MarketData, MarketDataBatch
 
 
 class TestMarketData:
@@ -105,3 +106,56 @@ class TestMarketData:
         assert "T=1.0000" in repr_str
         assert "r=0.0500" in repr_str
         assert "sigma=0.2000" in repr_str
+
+
+class TestMarketDataBatch:
+    """测试 MarketDataBatch 批量市场数据"""
+    
+    def test_batch_creation(self):
+        """测试创建批量市场数据"""
+        batch = MarketDataBatch(
+            S=[100.0, 110.0],
+            K=[100.0, 100.0],
+            T=[1.0, 0.5],
+            r=[0.05, -0.01],
+            sigma=[0.2, 0.3],
+        )
+        
+        assert len(batch) == 2
+        assert batch.S.dtype == np.float64
+        assert batch[1] == MarketData(S=110.0, K=100.0, T=0.5, r=-0.01, sigma=0.3)
+        assert len(batch[:1]) == 1
+        assert list(batch)[0] == MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+    
+    def test_batch_validation_reports_row(self):
+        """测试向量化验证报告第一条无效记录的行号"""
+        with pytest.raises(ValueError, match="第 2 行波动率 sigma 必须大于 0"):
+            MarketDataBatch(
+                S=[100.0, 100.0, 100.0],
+                K=[100.0, 100.0, 100.0],
+                T=[1.0, 1.0, 1.0],
+                r=[0.05, 0.05, 0.05],
+                sigma=[0.2, 0.2, 0.0],
+            )
+    
+    def test_batch_validation_rejects_nan(self):
+        """测试向量化验证拒绝缺失值"""
+        with pytest.raises(ValueError, match="第 0 行 T 必须是有限数值"):
+            MarketDataBatch(S=[100.0], K=[100.0], T=[np.nan], r=[0.05], sigma=[0.2])
+    
+    def test_batch_length_mismatch(self):
+        """测试各列长度不一致"""
+        with pytest.raises(ValueError, match="各列长度必须一致"):
+            MarketDataBatch(S=[100.0, 1.0], K=[100.0], T=[1.0], r=[0.05], sigma=[0.2])
+    
+    def test_batch_from_market_data(self):
+        """测试由 MarketData 对象构造"""
+        items = [
+            MarketData(S=100.0, K=90.0, T=1.0, r=0.05, sigma=0.2),
+            MarketData(S=100.0, K=110.0, T=1.0, r=0.05, sigma=0.25),
+        ]
+        
+        batch = MarketDataBatch.from_market_data(items)
+        
+        np.testing.assert_array_equal(batch.K, [90.0, 110.0])
+        assert list(batch) == items
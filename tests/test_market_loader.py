@@ -0,0 +1,139 @@
+"""
+测试市场快照批量加载模块
+
+验证 CSV/Parquet 分块读取、列名映射、向量化验证和后台预读
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.pricing_tool.utils.market_data import MarketDataBatch
+from src.pricing_tool.utils.market_loader import iter_market_data
+
+
+def write_csv(path, rows, header="S,K,T,r,sigma"):
+    """写出测试用 CSV 快照"""
+    lines = [header] + [",".join(str(v) for v in row) for row in rows]
+    path.write_text("\n".join(lines) + "\n")
+
+
+ROWS = [(100.0 + i, 100.0, 1.0, 0.05, 0.2) for i in range(10)]
+
+
+class TestCsvLoader:
+    """测试 CSV 快照加载"""
+
+    def test_chunks(self, tmp_path):
+        """测试按块读取"""
+        path = tmp_path / "snapshot.csv"
+        write_csv(path, ROWS)
+
+        batches = list(iter_market_data(path, chunk_size=4))
+
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert all(isinstance(b, MarketDataBatch) for b in batches)
+        np.testing.assert_array_equal(
+            np.concatenate([b.S for b in batches]), [row[0] for row in ROWS]
+        )
+
+    def test_column_mapping(self, tmp_path):
+        """测试列名映射和多余列"""
+        path = tmp_path / "snapshot.csv"
+        write_csv(
+            path,
+            [("AAPL", 100.0, 0.2, 95.0, 0.5, 0.03)],
+            header="ticker,spot,vol,strike,expiry,rate",
+        )
+
+        (batch,) = iter_market_data(
+            path,
+            columns={"S": "spot", "K": "strike", "T": "expiry", "r": "rate", "sigma": "vol"},
+        )
+
+        assert batch[0].to_dict() == {"S": 100.0, "K": 95.0, "T": 0.5, "r": 0.03, "sigma": 0.2}
+
+    def test_missing_column(self, tmp_path):
+        """测试缺少必需列"""
+        path = tmp_path / "snapshot.csv"
+        write_csv(path, [(100.0, 100.0, 1.0, 0.05)], header="S,K,T,r")
+
+        with pytest.raises(ValueError, match="缺少列: sigma"):
+            list(iter_market_data(path))
+
+    def test_validation_global_row(self, tmp_path):
+        """测试验证失败时报告全局行号"""
+        path = tmp_path / "snapshot.csv"
+        rows = list(ROWS)
+        rows[6] = (100.0, 100.0, 0.0, 0.05, 0.2)
+        write_csv(path, rows)
+
+        batches = iter_market_data(path, chunk_size=4)
+        next(batches)
+        with pytest.raises(ValueError, match="第 6 行到期时间 T 必须大于 0"):
+            next(batches)
+
+    def test_prefetch(self, tmp_path):
+        """测试后台预读结果与同步读取一致"""
+        path = tmp_path / "snapshot.csv"
+        write_csv(path, ROWS)
+
+        eager = [b.S for b in iter_market_data(path, chunk_size=3)]
+        prefetched = [b.S for b in iter_market_data(path, chunk_size=3, prefetch=2)]
+
+        assert len(eager) == len(prefetched) == 4
+        for a, b in zip(eager, prefetched):
+            np.testing.assert_array_equal(a, b)
+
+    def test_prefetch_propagates_errors(self, tmp_path):
+        """测试后台预读时的异常在调用方抛出"""
+        path = tmp_path / "snapshot.csv"
+        write_csv(path, [(100.0, -1.0, 1.0, 0.05, 0.2)])
+
+        with pytest.raises(ValueError, match="执行价格 K 必须大于 0"):
+            list(iter_market_data(path, prefetch=1))
+
+    def test_prefetch_abandoned_early(self, tmp_path):
+        """测试调用方提前停止后，后台线程在源已读完或已出错时也能退出"""
+        path = tmp_path / "snapshot.csv"
+        write_csv(path, ROWS[:2])
+        invalid = tmp_path / "invalid.csv"
+        write_csv(invalid, [ROWS[0], (100.0, -1.0, 1.0, 0.05, 0.2)])
+
+        for source in (path, invalid):
+            batches = iter_market_data(source, chunk_size=1, prefetch=1)
+            next(batches)
+            # 等待后台线程读完源文件并阻塞在已满的队列上
+            time.sleep(0.2)
+            batches.close()
+            workers = [t for t in threading.enumerate() if t.name == "market-data-prefetch"]
+            for worker in workers:
+                worker.join(timeout=2.0)
+            assert not any(worker.is_alive() for worker in workers)
+
+    def test_invalid_arguments(self, tmp_path):
+        """测试无效参数"""
+        with pytest.raises(ValueError, match="chunk_size 必须大于 0"):
+            iter_market_data(tmp_path / "x.csv", chunk_size=0)
+        with pytest.raises(ValueError, match="不支持的格式"):
+            iter_market_data(tmp_path / "x.csv", format="xlsx")
+
+
+class TestParquetLoader:
+    """测试 Parquet 快照加载（需要 pyarrow）"""
+
+    def test_chunks(self, tmp_path):
+        """测试按块读取 Parquet"""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "snapshot.parquet"
+        columns = list(zip(*ROWS))
+        table = pa.table({name: list(col) for name, col in zip(MarketDataBatch.FIELDS, columns)})
+        pq.write_table(table, str(path))
+
+        batches = list(iter_market_data(path, chunk_size=4))
+
+        assert sum(len(b) for b in batches) == 10
+        np.testing.assert_array_equal(batches[0].S, [100.0, 101.0, 102.0, 103.0])
@@ -0,0 +1,174 @@
+"""
+测试蒙特卡洛定价模块
+
+验证欧式期权精度、按日程模拟、障碍/亚式期权、离散分红，以及与 PDE 跳跃条件的一致性
+"""
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from src.pricing_tool.options.asian_option import AsianOption
+from src.pricing_tool.options.barrier_option import BarrierOption
+from src.pricing_tool.options.european_option import EuropeanOption
+from src.pricing_tool.pricing.mc_pricing import MCPricing
+from src.pricing_tool.pricing.pde_pricing import PDEPricing
+from src.pricing_tool.utils.market_data import MarketData
+from tests.reference import down_and_out_call
+
+MARKET = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+MONTHLY = [i / 12 for i in range(1, 13)]
+
+
+def bs_call(S, K, T, r, sigma):
+    """Black-Scholes 看涨期权价格和 Delta"""
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d1 - sigma * np.sqrt(T))
+    return price, norm.cdf(d1)
+
+
+def geometric_asian_call(S, K, r, sigma, dates):
+    """离散几何平均亚式看涨期权的解析价格"""
+    t = np.asarray(dates)
+    mean = np.log(S) + (r - 0.5 * sigma**2) * t.mean()
+    variance = sigma**2 * np.minimum.outer(t, t).sum() / t.size**2
+    d2 = (mean - np.log(K)) / np.sqrt(variance)
+    forward = np.exp(mean + 0.5 * variance)
+    return np.exp(-r * t[-1]) * (
+        forward * norm.cdf(d2 + np.sqrt(variance)) - K * norm.cdf(d2)
+    )
+
+
+class TestMCPricing:
+    """测试蒙特卡洛定价"""
+
+    def test_european_matches_black_scholes(self):
+        """测试欧式期权价格和 Delta 与 Black-Scholes 一致"""
+        option = EuropeanOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+        result = MCPricing(n_paths=200_000, seed=1).price(option, MARKET)
+        price, delta = bs_call(100.0, 100.0, 1.0, 0.05, 0.2)
+
+        assert result.price == pytest.approx(price, abs=4 * result.std_error)
+        assert result.delta == pytest.approx(delta, abs=1e-2)
+        assert result.theta is None
+        assert result.elapsed > 0
+
+    def test_schedule_simulates_only_observation_dates(self):
+        """测试给出日程时只模拟观察日，连续观察时使用 n_steps 网格"""
+        method = MCPricing(n_steps=252)
+        monthly = BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, observation_dates=MONTHLY)
+        continuous = BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2)
+        european = EuropeanOption(100.0, 100.0, 1.0, 0.05, 0.2)
+
+        assert method.simulation_schedule(monthly)[0].size == 12
+        assert method.simulation_schedule(continuous)[0].size == 252
+        assert method.simulation_schedule(european)[0].size == 1
+
+    def test_dividend_dates_merged_into_schedule(self):
+        """测试除息日并入模拟时间点，但不作为观察日"""
+        option = BarrierOption(
+            100.0, 100.0, 1.0, 0.05, 0.2, observation_dates=[0.5], dividends=[(0.25, 2.0)]
+        )
+        times, observed, amounts = MCPricing().simulation_schedule(option)
+
+        np.testing.assert_array_almost_equal(times, [0.25, 0.5, 1.0])
+        np.testing.assert_array_equal(observed, [1, 2])
+        np.testing.assert_array_almost_equal(amounts, [2.0, 0.0, 0.0])
+
+    def test_continuous_barrier_bridge_matches_closed_form(self):
+        """测试布朗桥修正后粗时间网格上的连续观察障碍价格与解析解一致"""
+        option = BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, barrier=90.0, direction="down")
+        method = MCPricing(n_paths=200_000, n_steps=12, seed=11, compute_greeks=False)
+        result = method.price(option, MARKET)
+        expected = down_and_out_call(100.0, 100.0, 1.0, 0.05, 0.2, 90.0)
+
+        assert result.price == pytest.approx(expected, abs=4 * result.std_error)
+
+    def test_knock_in_plus_knock_out_equals_vanilla(self):
+        """测试同一随机数下敲入 + 敲出 = 普通期权"""
+        method = MCPricing(n_paths=50_000, seed=3, compute_greeks=False)
+        kwargs = dict(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, observation_dates=MONTHLY)
+        out = method.price(BarrierOption(barrier=115.0, knock="out", **kwargs), MARKET)
+        knock_in = method.price(BarrierOption(barrier=115.0, knock="in", **kwargs), MARKET)
+        vanilla = method.price(BarrierOption(barrier=np.inf, **kwargs), MARKET)
+
+        assert out.price + knock_in.price == pytest.approx(vanilla.price, rel=1e-10)
+
+    def test_geometric_asian_matches_closed_form(self):
+        """测试离散几何平均亚式期权与解析解一致"""
+        option = AsianOption(
+            100.0, 100.0, 1.0, 0.05, 0.2, average_type="geometric", observation_dates=MONTHLY
+        )
+        result = MCPricing(n_paths=200_000, seed=5, compute_greeks=False).price(option, MARKET)
+        expected = geometric_asian_call(100.0, 100.0, 0.05, 0.2, MONTHLY)
+
+        assert result.price == pytest.approx(expected, abs=4 * result.std_error)
+
+    def test_dividends_lower_call_price(self):
+        """测试离散分红降低看涨期权价格"""
+        method = MCPricing(n_paths=50_000, seed=7, compute_greeks=False)
+        plain = BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, barrier=np.inf)
+        paying = BarrierOption(
+            100.0, 100.0, 1.0, 0.05, 0.2, barrier=np.inf, dividends=[(0.25, 2.0), (0.75, 2.0)]
+        )
+
+        assert method.price(paying, MARKET).price < method.price(plain, MARKET).price - 1.0
+
+    def test_seed_reproducible(self):
+        """测试相同种子结果可复现"""
+        option = EuropeanOption(100.0, 100.0, 1.0, 0.05, 0.2)
+        a = MCPricing(n_paths=10_000, seed=11, compute_greeks=False).price(option, MARKET)
+        b = MCPricing(n_paths=10_000, seed=11, compute_greeks=False).price(option, MARKET)
+
+        assert a.price == b.price
+
+    def test_invalid_parameters(self):
+        """测试无效参数"""
+        with pytest.raises(ValueError):
+            MCPricing(n_paths=0)
+        with pytest.raises(ValueError):
+            MCPricing(n_steps=0)
+        with pytest.raises(ValueError):
+            MCPricing(n_paths=1001, antithetic=True)
+
+
+class TestPDEJumpConditions:
+    """测试 PDE 在观察日和除息日的跳跃条件"""
+
+    @pytest.mark.parametrize("knock", ["out", "in"])
+    def test_discrete_barrier_agrees_with_mc(self, knock):
+        """测试离散观察障碍期权的 PDE 价格与 MC 一致"""
+        option = BarrierOption(
+            100.0, 100.0, 1.0, 0.05, 0.2, barrier=120.0, knock=knock, observation_dates=MONTHLY
+        )
+        mc = MCPricing(n_paths=200_000, seed=13, compute_greeks=False).price(option, MARKET)
+        pde = PDEPricing(n_space=400, n_time=400).price(option, MARKET)
+
+        assert pde.price == pytest.approx(mc.price, abs=4 * mc.std_error + 5e-3)
+
+    def test_dividend_call_agrees_with_mc(self):
+        """测试带离散分红的看涨期权 PDE 价格与 MC 一致"""
+        option = BarrierOption(
+            100.0, 100.0, 1.0, 0.05, 0.2, barrier=np.inf, dividends=[(0.25, 2.0), (0.75, 2.0)]
+        )
+        mc = MCPricing(n_paths=200_000, seed=17, compute_greeks=False).price(option, MARKET)
+        pde = PDEPricing(n_space=400, n_time=400).price(option, MARKET)
+
+        assert pde.price == pytest.approx(mc.price, abs=4 * mc.std_error + 5e-3)
+
+    def test_equal_segments_share_cached_operators(self):
+        """测试等长的观察区间共用缓存中的同一组算子"""
+        option = BarrierOption(
+            100.0, 100.0, 1.0, 0.05, 0.2, barrier=120.0, observation_dates=MONTHLY
+        )
+        method = PDEPricing(n_time=240, compute_greeks=False)
+        method.price(option, MARKET)
+
+        assert len(method.cache) == 1
+
+    def test_path_dependent_option_rejected(self):
+        """测试 PDE 拒绝依赖平均值的期权"""
+        option = AsianOption(100.0, 100.0, 1.0, 0.05, 0.2)
+
+        with pytest.raises(ValueError, match="不支持 PDE"):
+            PDEPricing().price(option, MARKET)
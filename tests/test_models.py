@@ -0,0 +1,158 @@
+"""
+测试模型模块
+
+验证几何布朗运动、Heston 和局部波动率模型的参数验证、模拟步进，
+以及 MC/PDE 定价方法对模型的支持
+"""
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from src.pricing_tool.models.gbm import GBMModel
+from src.pricing_tool.models.heston import HestonModel
+from src.pricing_tool.models.local_vol import LocalVolModel
+from src.pricing_tool.options.european_option import EuropeanOption
+from src.pricing_tool.pricing.mc_pricing import MCPricing
+from src.pricing_tool.pricing.pde_pricing import PDEPricing
+from src.pricing_tool.utils.market_data import MarketData
+from tests.reference import LOG_MONEYNESS, MATURITIES, skew_implied_vol, skew_model
+
+MARKET = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+
+
+def bs_call(S, K, T, r, sigma):
+    """Black-Scholes 看涨期权价格"""
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    return S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d1 - sigma * np.sqrt(T))
+
+
+class TestModelParameters:
+    """测试模型参数验证"""
+
+    def test_gbm_validation(self):
+        """测试几何布朗运动参数验证"""
+        with pytest.raises(ValueError, match="波动率"):
+            GBMModel(sigma=0.0)
+        assert GBMModel(0.2) == GBMModel(0.2)
+        assert GBMModel(0.2).exact_transition
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [("v0", 0.0), ("kappa", -1.0), ("theta", 0.0), ("xi", 0.0), ("rho", 1.0)],
+    )
+    def test_heston_validation(self, field, value):
+        """测试 Heston 参数验证"""
+        params = dict(v0=0.04, kappa=1.5, theta=0.04, xi=0.5, rho=-0.7)
+        params[field] = value
+
+        with pytest.raises(ValueError):
+            HestonModel(**params)
+
+    def test_heston_feller(self):
+        """测试 Feller 条件判断"""
+        assert HestonModel(0.04, 2.0, 0.04, 0.3, -0.7).feller_satisfied
+        assert not HestonModel(0.04, 1.5, 0.04, 0.8, -0.7).feller_satisfied
+
+    def test_models_immutable(self):
+        """测试模型不可变"""
+        from dataclasses import FrozenInstanceError
+
+        with pytest.raises(FrozenInstanceError):
+            HestonModel(0.04, 1.5, 0.04, 0.5, -0.7).v0 = 0.1
+        with pytest.raises(FrozenInstanceError):
+            skew_model().spot = 1.0
+
+
+class TestHestonQE:
+    """测试 Heston QE 离散格式"""
+
+    def test_variance_nonnegative_and_mean_reverting(self):
+        """测试方差非负，且条件均值与精确矩一致"""
+        model = HestonModel(v0=0.04, kappa=1.5, theta=0.09, xi=1.0, rho=-0.7)
+        rng = np.random.default_rng(0)
+        n = 400_000
+        S, v = np.full(n, 100.0), model.initial_state(n)
+        S, v = model.step(S, v, 0.0, 0.5, 0.05, rng.standard_normal((2, n)))
+
+        expected = model.theta + (model.v0 - model.theta) * np.exp(-model.kappa * 0.5)
+        assert v.min() >= 0.0
+        assert v.mean() == pytest.approx(expected, rel=1e-2)
+
+    def test_forward_is_martingale(self):
+        """测试折现后的价格近似为鞅"""
+        model = HestonModel(v0=0.04, kappa=1.5, theta=0.04, xi=0.5, rho=-0.7)
+        rng = np.random.default_rng(1)
+        n = 200_000
+        S, v = np.full(n, 100.0), model.initial_state(n)
+        for k in range(52):
+            S, v = model.step(S, v, k / 52, 1 / 52, 0.05, rng.standard_normal((2, n)))
+
+        assert np.exp(-0.05) * S.mean() == pytest.approx(100.0, rel=2e-3)
+
+
+class TestLocalVol:
+    """测试 Dupire 局部波动率"""
+
+    def test_flat_implied_vol_gives_flat_local_vol(self):
+        """测试平坦隐含波动率曲面得到相同的平坦局部波动率"""
+        implied = np.full((MATURITIES.size, LOG_MONEYNESS.size), 0.25)
+        model = LocalVolModel.from_implied_vol(100.0, 0.05, MATURITIES, LOG_MONEYNESS, implied)
+
+        np.testing.assert_allclose(model.local_vols, 0.25, rtol=1e-10)
+        np.testing.assert_allclose(model.local_vol(np.array([50.0, 100.0, 300.0]), 0.7), 0.25)
+
+    def test_invalid_grid(self):
+        """测试无效网格"""
+        with pytest.raises(ValueError):
+            LocalVolModel(100.0, 0.05, [0.5, 1.0], [-1.0, 0.0, 1.0], np.full((2, 2), 0.2))
+        with pytest.raises(ValueError):
+            LocalVolModel(100.0, 0.05, [1.0, 0.5], [-1.0, 0.0, 1.0], np.full((2, 3), 0.2))
+
+    @pytest.mark.parametrize("K", [90.0, 110.0])
+    def test_pde_reprices_implied_vol_surface(self, K):
+        """测试局部波动率 PDE 重新得到隐含波动率曲面对应的价格"""
+        option = EuropeanOption(S=100.0, K=K, T=1.0, r=0.05, sigma=0.2)
+        y = np.log(K / (100.0 * np.exp(0.05)))
+        expected = bs_call(100.0, K, 1.0, 0.05, skew_implied_vol(y))
+
+        result = PDEPricing(model=skew_model()).price(option, MARKET)
+
+        assert result.price == pytest.approx(expected, abs=2e-2)
+        assert result.vega is None
+
+    def test_mc_agrees_with_pde(self):
+        """测试局部波动率 MC 与 PDE 一致"""
+        option = EuropeanOption(S=100.0, K=110.0, T=1.0, r=0.05, sigma=0.2)
+        model = skew_model()
+        mc = MCPricing(n_paths=100_000, seed=2, model=model, compute_greeks=False)
+        mc_result = mc.price(option, MARKET)
+        pde_result = PDEPricing(model=model, compute_greeks=False).price(option, MARKET)
+
+        assert mc_result.price == pytest.approx(pde_result.price, abs=4 * mc_result.std_error)
+
+
+class TestEngineModels:
+    """测试定价方法的模型参数"""
+
+    def test_explicit_gbm_matches_market_sigma(self):
+        """测试显式 GBM 模型与使用 MarketData.sigma 等价"""
+        option = EuropeanOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+
+        default = PDEPricing().price(option, MARKET)
+        explicit = PDEPricing(model=GBMModel(0.2)).price(option, MARKET)
+
+        assert explicit.price == default.price
+        assert explicit.vega == default.vega
+
+    def test_model_overrides_market_sigma(self):
+        """测试显式模型覆盖 MarketData.sigma"""
+        option = EuropeanOption(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+        result = PDEPricing(model=GBMModel(0.3)).price(option, MARKET)
+
+        assert result.price == pytest.approx(bs_call(100.0, 100.0, 1.0, 0.05, 0.3), abs=5e-3)
+
+    def test_pde_rejects_heston(self):
+        """测试一维 PDE 拒绝二维模型"""
+        with pytest.raises(ValueError, match="ADIPricing"):
+            PDEPricing(model=HestonModel(0.04, 1.5, 0.04, 0.5, -0.7))
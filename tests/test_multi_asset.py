@@ -0,0 +1,210 @@
+"""
+测试多资产期权和多资产蒙特卡洛定价模块
+
+验证篮子/彩虹期权收益、多资产市场数据验证、Cholesky 缓存和定价精度
+"""
+
+import time
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from src.pricing_tool.options.basket_option import BasketOption
+from src.pricing_tool.options.rainbow_option import RainbowOption
+from src.pricing_tool.pricing.multi_asset_mc_pricing import MultiAssetMCPricing, cholesky_factor
+from src.pricing_tool.utils.market_data import MultiAssetMarketData
+
+
+def bs_call(S, K, T, r, sigma):
+    """Black-Scholes 看涨期权价格"""
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    return S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d1 - sigma * np.sqrt(T))
+
+
+def two_asset_market(rho=0.5):
+    """两资产市场数据"""
+    return MultiAssetMarketData(
+        S=(100.0, 95.0), sigma=(0.2, 0.3), correlation=[[1.0, rho], [rho, 1.0]], r=0.05
+    )
+
+
+class TestMultiAssetOptions:
+    """测试多资产期权类型"""
+
+    def test_basket_payoff(self):
+        """测试篮子期权收益"""
+        option = BasketOption(S=(100.0, 100.0), K=100.0, T=1.0, r=0.05, sigma=(0.2, 0.2))
+        S_T = np.array([[110.0, 100.0], [90.0, 100.0]])
+
+        np.testing.assert_array_almost_equal(option.payoff(S_T), [5.0, 0.0])
+        assert option.weights == (0.5, 0.5)
+        assert option.n_assets == 2
+
+    def test_spread_payoff(self):
+        """测试价差期权（负权重）收益，K 可以为 0"""
+        option = BasketOption(
+            S=(100.0, 100.0), K=0.0, T=1.0, r=0.05, sigma=(0.2, 0.2), weights=(1.0, -1.0)
+        )
+
+        np.testing.assert_array_almost_equal(option.payoff(np.array([[110.0, 100.0]])), [10.0])
+
+    def test_rainbow_payoff(self):
+        """测试最优/最差资产期权收益"""
+        S_T = np.array([[110.0, 90.0]])
+        best = RainbowOption(S=(100.0, 100.0), K=100.0, T=1.0, r=0.05, sigma=(0.2, 0.2))
+        worst = RainbowOption(
+            S=(100.0, 100.0), K=100.0, T=1.0, r=0.05, sigma=(0.2, 0.2),
+            option_type="put", kind="worst",
+        )
+
+        np.testing.assert_array_almost_equal(best.payoff(S_T), [10.0])
+        np.testing.assert_array_almost_equal(worst.payoff(S_T), [10.0])
+
+    def test_validation(self):
+        """测试参数验证"""
+        with pytest.raises(ValueError, match="波动率数量必须与标的资产数量一致"):
+            BasketOption(S=(100.0, 100.0), K=100.0, T=1.0, r=0.05, sigma=(0.2,))
+        with pytest.raises(ValueError, match="权重数量必须与标的资产数量一致"):
+            BasketOption(S=(100.0, 100.0), K=100.0, T=1.0, r=0.05, sigma=(0.2, 0.2), weights=(1,))
+        with pytest.raises(ValueError, match="彩虹期权类型"):
+            RainbowOption(S=(100.0,), K=100.0, T=1.0, r=0.05, sigma=(0.2,), kind="median")
+
+    def test_hashable_and_repr(self):
+        """测试多资产期权可哈希，字符串表示包含各资产参数"""
+        option = BasketOption(S=(100.0, 95.0), K=100.0, T=1.0, r=0.05, sigma=(0.2, 0.3))
+
+        assert hash(option) == hash(
+            BasketOption(S=[100.0, 95.0], K=100.0, T=1.0, r=0.05, sigma=[0.2, 0.3])
+        )
+        assert "S=(100.00, 95.00)" in repr(option)
+
+
+class TestMultiAssetMarketData:
+    """测试多资产市场数据"""
+
+    def test_normalized_and_hashable(self):
+        """测试序列参数规范化为元组"""
+        market = two_asset_market()
+
+        assert market.correlation == ((1.0, 0.5), (0.5, 1.0))
+        assert hash(market) == hash(two_asset_market())
+        assert market.correlation_matrix.shape == (2, 2)
+
+    def test_validation(self):
+        """测试相关系数矩阵验证"""
+        kwargs = dict(S=(1.0, 1.0), sigma=(0.2, 0.2), r=0.0)
+
+        with pytest.raises(ValueError, match="必须对称"):
+            MultiAssetMarketData(correlation=[[1, 0.5], [0.2, 1]], **kwargs)
+        with pytest.raises(ValueError, match="对角线必须为 1"):
+            MultiAssetMarketData(correlation=[[2, 0], [0, 1]], **kwargs)
+        with pytest.raises(ValueError, match="形状必须为"):
+            MultiAssetMarketData(correlation=[[1.0]], **kwargs)
+
+
+class TestMultiAssetMCPricing:
+    """测试多资产蒙特卡洛定价"""
+
+    def test_single_asset_matches_black_scholes(self):
+        """测试单资产篮子与 Black-Scholes 一致"""
+        option = BasketOption(S=(100.0,), K=100.0, T=1.0, r=0.05, sigma=(0.2,))
+        market = MultiAssetMarketData(S=(100.0,), sigma=(0.2,), correlation=[[1.0]], r=0.05)
+
+        result = MultiAssetMCPricing(n_paths=200_000, seed=1).price(option, market)
+
+        expected = bs_call(100.0, 100.0, 1.0, 0.05, 0.2)
+        assert result.price == pytest.approx(expected, abs=4 * result.std_error)
+        assert 0 < result.std_error < 0.05
+
+    def test_exchange_option_matches_margrabe(self):
+        """测试交换期权与 Margrabe 公式一致"""
+        market = two_asset_market(rho=0.5)
+        option = BasketOption(
+            S=market.S, K=0.0, T=1.0, r=0.05, sigma=market.sigma, weights=(1.0, -1.0)
+        )
+        sigma = np.sqrt(0.2**2 + 0.3**2 - 2 * 0.5 * 0.2 * 0.3)
+        d1 = (np.log(100.0 / 95.0) + 0.5 * sigma**2) / sigma
+        expected = 100.0 * norm.cdf(d1) - 95.0 * norm.cdf(d1 - sigma)
+
+        result = MultiAssetMCPricing(n_paths=400_000, seed=2).price(option, market)
+
+        assert result.price == pytest.approx(expected, abs=4 * result.std_error)
+
+    def test_best_plus_worst_equals_sum_of_calls(self):
+        """测试 best-of 与 worst-of 看涨之和等于两个单资产看涨之和"""
+        market = two_asset_market(rho=0.3)
+        kwargs = dict(S=market.S, K=100.0, T=1.0, r=0.05, sigma=market.sigma)
+        method = MultiAssetMCPricing(n_paths=400_000, seed=3)
+
+        best = method.price(RainbowOption(kind="best", **kwargs), market)
+        worst = method.price(RainbowOption(kind="worst", **kwargs), market)
+        expected = bs_call(100.0, 100.0, 1.0, 0.05, 0.2) + bs_call(95.0, 100.0, 1.0, 0.05, 0.3)
+
+        tolerance = 4 * (best.std_error + worst.std_error)
+        assert best.price + worst.price == pytest.approx(expected, abs=tolerance)
+
+    def test_seed_reproducible(self):
+        """测试固定种子可复现"""
+        market = two_asset_market()
+        option = BasketOption(S=market.S, K=100.0, T=1.0, r=0.05, sigma=market.sigma)
+
+        a = MultiAssetMCPricing(n_paths=10_000, chunk_size=1_000, seed=7).price(option, market)
+        b = MultiAssetMCPricing(n_paths=10_000, chunk_size=1_000, seed=7).price(option, market)
+
+        assert a.price == b.price
+
+    def test_cholesky_cached_per_correlation(self):
+        """测试 Cholesky 分解按相关矩阵缓存"""
+        cholesky_factor.cache_clear()
+        market = two_asset_market()
+        option = BasketOption(S=market.S, K=100.0, T=1.0, r=0.05, sigma=market.sigma)
+        method = MultiAssetMCPricing(n_paths=1_000, seed=0)
+
+        method.price(option, market)
+        method.price(option, two_asset_market())
+
+        info = cholesky_factor.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert not cholesky_factor(market.correlation).flags.writeable
+
+    def test_not_positive_semidefinite(self):
+        """测试相关矩阵不是半正定时在构造市场数据和分解时报错"""
+        corr = [[1.0, 0.9, -0.9], [0.9, 1.0, 0.9], [-0.9, 0.9, 1.0]]
+
+        with pytest.raises(ValueError, match="必须半正定"):
+            MultiAssetMarketData(S=(1.0,) * 3, sigma=(0.2,) * 3, correlation=corr, r=0.0)
+        with pytest.raises(ValueError, match="必须半正定"):
+            cholesky_factor(tuple(map(tuple, corr)))
+
+    def test_perfect_correlation(self):
+        """测试完全相关（半正定）的资产可以定价，篮子退化为单资产"""
+        corr = ((1.0, 1.0), (1.0, 1.0))
+        market = MultiAssetMarketData(S=(100.0, 100.0), sigma=(0.2, 0.2), correlation=corr, r=0.05)
+        option = BasketOption(S=market.S, K=100.0, T=1.0, r=0.05, sigma=market.sigma)
+        factor = cholesky_factor(corr)
+
+        np.testing.assert_allclose(factor @ factor.T, corr, atol=1e-12)
+        result = MultiAssetMCPricing(n_paths=200_000, seed=3).price(option, market)
+        assert result.price == pytest.approx(10.4506, abs=4 * result.std_error)
+
+    def test_asset_count_mismatch(self):
+        """测试期权与市场数据资产数量不一致"""
+        option = BasketOption(S=(100.0,), K=100.0, T=1.0, r=0.05, sigma=(0.2,))
+
+        with pytest.raises(ValueError, match="资产数量与市场数据不一致"):
+            MultiAssetMCPricing(n_paths=100).price(option, two_asset_market())
+
+    def test_fifty_asset_throughput(self):
+        """测试 50 资产篮子在合理时间内完成定价"""
+        n = 50
+        corr = np.full((n, n), 0.3) + 0.7 * np.eye(n)
+        market = MultiAssetMarketData(S=(100.0,) * n, sigma=(0.25,) * n, correlation=corr, r=0.03)
+        option = BasketOption(S=market.S, K=100.0, T=1.0, r=0.03, sigma=market.sigma)
+
+        start = time.perf_counter()
+        result = MultiAssetMCPricing(n_paths=100_000, seed=4).price(option, market)
+        elapsed = time.perf_counter() - start
+
+        assert result.price > 0
+        assert elapsed < 5.0
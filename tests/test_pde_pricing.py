@@ -0,0 +1,143 @@
+"""
+测试 PDE 定价模块
+
+验证 Crank-Nicolson 求解精度、Greeks、批量求解以及算子缓存的复用和淘汰
+"""
+
+import numpy as np
+import pytest
+
+from src.pricing_tool.options.barrier_option import BarrierOption
+from src.pricing_tool.options.european_option import EuropeanOption
+from src.pricing_tool.options.exotic import ExoticOption
+from src.pricing_tool.pricing.pde_cache import PDEOperatorCache
+from src.pricing_tool.pricing.pde_pricing import PDEPricing
+from src.pricing_tool.utils.market_data import MarketData
+from tests.reference import black_scholes, down_and_out_call
+
+
+class DirichletCall(ExoticOption):
+    """使用解析边界条件的看涨期权（走 Dirichlet 边界分支）"""
+
+    __slots__ = ()
+
+    def payoff(self, S_T):
+        return np.maximum(S_T - self.K, 0.0)
+
+    def boundary_condition(self, S, t):
+        return np.maximum(S - self.K * np.exp(-self.r * (self.T - t)), 0.0)
+
+
+MARKET = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+
+
+class TestPDEAccuracy:
+    """测试 PDE 定价精度"""
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    @pytest.mark.parametrize("K", [80.0, 100.0, 120.0])
+    def test_price_and_greeks_match_black_scholes(self, option_type, K):
+        """测试价格和 Greeks 与 Black-Scholes 一致"""
+        option = EuropeanOption(S=100.0, K=K, T=1.0, r=0.05, sigma=0.2, option_type=option_type)
+
+        result = PDEPricing().price(option, MARKET)
+        expected = black_scholes(100.0, K, 1.0, 0.05, 0.2, option_type)
+
+        assert result.price == pytest.approx(expected["price"], abs=5e-3)
+        assert result.delta == pytest.approx(expected["delta"], abs=1e-3)
+        assert result.gamma == pytest.approx(expected["gamma"], abs=1e-4)
+        assert result.theta == pytest.approx(expected["theta"], abs=2e-2)
+        assert result.vega == pytest.approx(expected["vega"], abs=3e-2)
+        assert result.rho == pytest.approx(expected["rho"], abs=2e-2)
+        assert result.elapsed is not None
+
+    def test_dirichlet_boundary(self):
+        """测试奇异期权的 Dirichlet 边界分支"""
+        option = DirichletCall(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, option_type="call")
+
+        result = PDEPricing(compute_greeks=False).price(option, MARKET)
+
+        expected = black_scholes(100.0, 100.0, 1.0, 0.05, 0.2)["price"]
+        assert result.price == pytest.approx(expected, abs=5e-3)
+        assert result.delta is None
+
+    def test_continuous_barrier_matches_closed_form(self):
+        """测试连续观察敲出障碍（网格截断在障碍处）与解析解一致且二阶收敛"""
+        option = BarrierOption(100.0, 100.0, 1.0, 0.05, 0.2, barrier=90.0, direction="down")
+        expected = down_and_out_call(100.0, 100.0, 1.0, 0.05, 0.2, 90.0)
+
+        errors = [
+            abs(PDEPricing(n_space=n, n_time=n).price(option, MARKET).price - expected)
+            for n in (100, 200)
+        ]
+        assert errors[1] < 1e-3
+        assert errors[0] / errors[1] > 3.0
+
+    def test_invalid_grid(self):
+        """测试无效的网格参数"""
+        with pytest.raises(ValueError, match="n_space 必须是不小于 4 的偶数"):
+            PDEPricing(n_space=101)
+        with pytest.raises(ValueError, match="n_time 必须不小于 2"):
+            PDEPricing(n_time=1)
+
+
+class TestPDEBatchAndCache:
+    """测试批量求解和算子缓存"""
+
+    def test_batch_matches_single(self):
+        """测试批量求解与逐个求解结果一致"""
+        options = [
+            EuropeanOption(S=100.0, K=K, T=1.0, r=0.05, sigma=0.2, option_type=t)
+            for K in (90.0, 100.0, 110.0)
+            for t in ("call", "put")
+        ]
+        markets = [MARKET, MarketData(S=105.0, K=100.0, T=1.0, r=0.05, sigma=0.2)] * 3
+        method = PDEPricing()
+
+        batch = method.price_batch(options, markets)
+        single = [method.price(o, m) for o, m in zip(options, markets)]
+
+        for b, s in zip(batch, single):
+            assert b.price == pytest.approx(s.price, rel=1e-12)
+            assert b.vega == pytest.approx(s.vega, rel=1e-10)
+
+    def test_contracts_sharing_grid_hit_cache(self):
+        """测试仅执行价不同的合约复用算子，不再重新组装和分解"""
+        cache = PDEOperatorCache()
+        method = PDEPricing(cache=cache)
+
+        method.price(EuropeanOption(100.0, 95.0, 1.0, 0.05, 0.2, "call"), MARKET)
+        built = cache.stats()["misses"]
+        method.price(EuropeanOption(100.0, 105.0, 1.0, 0.05, 0.2, "put"), MARKET)
+
+        # 基准、vega 扰动、rho 扰动共 5 组算子
+        assert built == 5
+        assert cache.stats()["misses"] == built
+        assert cache.stats()["hits"] == 5
+
+    def test_shared_cache_across_methods(self):
+        """测试多个定价实例共享缓存"""
+        cache = PDEOperatorCache()
+        option = EuropeanOption(100.0, 100.0, 1.0, 0.05, 0.2, "call")
+
+        PDEPricing(cache=cache, compute_greeks=False).price(option, MARKET)
+        PDEPricing(cache=cache, compute_greeks=False).price(option, MARKET)
+
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+    def test_cache_eviction(self):
+        """测试缓存有界并淘汰最久未使用的条目"""
+        cache = PDEOperatorCache(max_entries=2)
+        method = PDEPricing(cache=cache, compute_greeks=False)
+        option = EuropeanOption(100.0, 100.0, 1.0, 0.05, 0.2, "call")
+
+        for sigma in (0.1, 0.2, 0.3):
+            method.price(option, MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=sigma))
+
+        assert len(cache) == 2
+        assert cache.stats()["evictions"] == 1
+
+    def test_cache_invalid_size(self):
+        """测试无效的缓存容量"""
+        with pytest.raises(ValueError, match="max_entries 必须大于 0"):
+            PDEOperatorCache(max_entries=0)
@@ -0,0 +1,152 @@
+"""
+测试组合定价规划模块
+
+验证合约规范化与去重、按定价引擎分组共享计算、按名义本金分发结果，
+以及 MC 批量定价在同一组路径上与逐个定价一致
+"""
+
+import numpy as np
+import pytest
+
+from src.pricing_tool.options.asian_option import AsianOption
+from src.pricing_tool.options.barrier_option import BarrierOption
+from src.pricing_tool.options.basket_option import BasketOption
+from src.pricing_tool.options.european_option import EuropeanOption
+from src.pricing_tool.pricing.analytic_pricing import AnalyticPricing
+from src.pricing_tool.pricing.fourier_pricing import FourierPricing
+from src.pricing_tool.pricing.mc_pricing import MCPricing
+from src.pricing_tool.pricing.multi_asset_mc_pricing import MultiAssetMCPricing
+from src.pricing_tool.pricing.pde_pricing import PDEPricing
+from src.pricing_tool.pricing.portfolio import PortfolioPlanner, canonicalize
+from src.pricing_tool.utils.market_data import MarketData, MultiAssetMarketData
+
+MARKET = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+KWARGS = dict(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+MONTHLY = [i / 12.0 for i in range(1, 13)]
+
+
+def book():
+    """含重复合约的组合：同一合约以不同的期权市场字段和名义本金出现多次"""
+    return [
+        EuropeanOption(**KWARGS),
+        EuropeanOption(**dict(KWARGS, S=95.0, sigma=0.3)),
+        EuropeanOption(**dict(KWARGS, K=110.0)),
+        EuropeanOption(**dict(KWARGS, K=110.0), option_type="put"),
+        EuropeanOption(**dict(KWARGS, T=0.5)),
+        BarrierOption(**KWARGS),
+        BarrierOption(**dict(KWARGS, r=0.01)),
+    ]
+
+
+class TestCanonicalize:
+    """测试合约规范化"""
+
+    def test_market_fields_aligned(self):
+        """测试期权的市场字段取自 MarketData，MarketData 的 K、T 取自期权"""
+        option = EuropeanOption(**dict(KWARGS, S=95.0, sigma=0.3))
+        data = MarketData(S=100.0, K=80.0, T=2.0, r=0.05, sigma=0.2)
+        canonical_option, canonical_data = canonicalize(option, data)
+
+        assert canonical_option == EuropeanOption(**KWARGS)
+        assert canonical_data == MARKET
+        assert canonicalize(EuropeanOption(**KWARGS), MARKET) == (canonical_option, canonical_data)
+
+    def test_option_replace(self):
+        """测试期权替换字段后得到新对象，原对象不变"""
+        option = BarrierOption(**KWARGS, observation_dates=MONTHLY)
+        moved = option.replace(barrier=130.0)
+
+        assert moved.barrier == 130.0
+        assert moved.observation_dates == option.observation_dates
+        assert option.barrier == 120.0
+        with pytest.raises(ValueError, match="没有字段"):
+            option.replace(notional=2.0)
+
+
+class TestPortfolioPlanner:
+    """测试组合定价规划器"""
+
+    def test_dedup_and_grid_groups(self):
+        """测试 PDE 引擎下去重和按网格分组，并统计节省的工作量"""
+        plan = PortfolioPlanner(PDEPricing()).plan(book(), MARKET)
+
+        assert plan.n_positions == 7
+        assert plan.n_contracts == 5
+        assert list(plan.positions) == [0, 0, 1, 2, 3, 4, 4]
+        # 1 年期普通期权共享线性边界网格，半年期和障碍期权各自一组
+        assert plan.n_groups == 3
+        assert plan.savings() == {
+            "positions": 7,
+            "contracts": 5,
+            "groups": 3,
+            "duplicates": 2,
+            "shared": 2,
+            "work_ratio": 3 / 7,
+        }
+
+    def test_results_scaled_by_notional(self):
+        """测试结果按名义本金分发，与逐个定价再缩放一致"""
+        method = PDEPricing(n_space=100, n_time=100)
+        notionals = [2.0, -1.0, 3.0, 1.0, 0.5, 1.0, 4.0]
+        portfolio = PortfolioPlanner(method).price(book(), MARKET, notionals)
+
+        for option, notional, result in zip(book(), notionals, portfolio.results):
+            expected = method.price(*canonicalize(option, MARKET))
+            assert result.price == pytest.approx(notional * expected.price, rel=1e-10)
+            assert result.delta == pytest.approx(notional * expected.delta, rel=1e-10)
+            assert result.vega == pytest.approx(notional * expected.vega, rel=1e-6)
+        assert portfolio.value == pytest.approx(sum(r.price for r in portfolio.results))
+        assert len(portfolio.contract_results) == 5
+
+    def test_fourier_strip_groups(self):
+        """测试 Fourier 引擎下同一期限的普通期权归为一条执行价序列"""
+        options = [EuropeanOption(**dict(KWARGS, K=K)) for K in (90.0, 100.0, 110.0, 100.0)]
+        plan = PortfolioPlanner(FourierPricing()).plan(options, MARKET)
+
+        assert plan.n_contracts == 3
+        assert plan.n_groups == 1
+
+    def test_no_sharing_engine_only_deduplicates(self):
+        """测试不共享计算的引擎每个合约单独一组"""
+        options = [EuropeanOption(**dict(KWARGS, K=K)) for K in (90.0, 100.0, 90.0)]
+        plan = PortfolioPlanner(AnalyticPricing()).plan(options, MARKET)
+
+        assert plan.n_contracts == plan.n_groups == 2
+
+    def test_multi_asset_passthrough(self):
+        """测试多资产合约不做规范化，只按完全相同去重"""
+        basket = BasketOption(S=[100.0, 100.0], K=100.0, T=1.0, r=0.05, sigma=[0.2, 0.3])
+        data = MultiAssetMarketData(
+            S=[100.0, 100.0], sigma=[0.2, 0.3], correlation=[[1.0, 0.5], [0.5, 1.0]], r=0.05
+        )
+        method = MultiAssetMCPricing(n_paths=2_000, seed=1)
+        portfolio = PortfolioPlanner(method).price([basket, basket], data, [1.0, 2.0])
+
+        assert portfolio.plan.n_contracts == 1
+        assert portfolio.results[1].price == pytest.approx(2.0 * portfolio.results[0].price)
+
+    def test_invalid_notionals(self):
+        """测试名义本金数量与期权数量不一致"""
+        with pytest.raises(ValueError, match="名义本金"):
+            PortfolioPlanner(PDEPricing()).plan(book(), MARKET, [1.0, 2.0])
+
+
+class TestMCBatch:
+    """测试 MC 批量定价共享路径"""
+
+    def test_shared_paths_match_individual(self):
+        """测试同一模拟时间点的合约在同一组路径上定价，与逐个定价（相同种子）一致"""
+        method = MCPricing(n_paths=20_000, seed=11)
+        options = [
+            AsianOption(**dict(KWARGS, K=K), observation_dates=MONTHLY) for K in (90.0, 110.0)
+        ]
+        options.append(BarrierOption(**KWARGS, observation_dates=MONTHLY))
+        results = method.price_batch(options, MARKET)
+
+        assert len({method.batch_key(option, MARKET) for option in options}) == 1
+        for option, result in zip(options, results):
+            expected = method.price(option, MARKET)
+            assert result.price == pytest.approx(expected.price, rel=1e-12)
+            assert result.std_error == pytest.approx(expected.std_error, rel=1e-12)
+            assert result.delta == pytest.approx(expected.delta, rel=1e-10)
+        assert not np.isclose(results[0].price, results[1].price)
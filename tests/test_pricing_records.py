@@ -0,0 +1,155 @@
+"""
+测试紧凑数据表示
+
+验证 Option、PricingResult、MarketData 的不可变 __slots__ 表示和结构化数组打包
+"""
+
+import pickle
+import sys
+from dataclasses import FrozenInstanceError
+
+import numpy as np
+import pytest
+
+from src.pricing_tool.options.base import Option
+from src.pricing_tool.pricing.base import PricingResult
+from src.pricing_tool.pricing.records import (
+    PRICING_RESULT_DTYPE,
+    pack_results,
+    unpack_results,
+)
+from src.pricing_tool.utils.market_data import MarketData
+
+
+class CallOption(Option):
+    """测试用的带 __slots__ 的看涨期权"""
+
+    __slots__ = ()
+
+    def payoff(self, S_T: np.ndarray) -> np.ndarray:
+        return np.maximum(S_T - self.K, 0)
+
+
+class CappedCallOption(CallOption):
+    """测试用的带额外字段的期权"""
+
+    __slots__ = ("cap",)
+
+    def __init__(self, cap: float, **kwargs):
+        super().__init__(**kwargs)
+        self._set_fields(cap=cap)
+
+    def payoff(self, S_T: np.ndarray) -> np.ndarray:
+        return np.minimum(super().payoff(S_T), self.cap)
+
+
+OPTION_KWARGS = dict(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, option_type="call")
+
+
+class TestCompactObjects:
+    """测试不可变、可哈希的紧凑对象"""
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            CallOption(**OPTION_KWARGS),
+            PricingResult(price=10.0, delta=0.5),
+            MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2),
+        ],
+    )
+    def test_no_instance_dict(self, obj):
+        """测试实例没有 __dict__"""
+        assert not hasattr(obj, "__dict__")
+
+    def test_immutable(self):
+        """测试实例不可修改"""
+        option = CallOption(**OPTION_KWARGS)
+        result = PricingResult(price=10.0)
+        market_data = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+
+        with pytest.raises(FrozenInstanceError):
+            option.K = 90.0
+        with pytest.raises(FrozenInstanceError):
+            result.price = 11.0
+        with pytest.raises(FrozenInstanceError):
+            market_data.sigma = 0.3
+        with pytest.raises(AttributeError):
+            result.extra = 1.0
+
+    def test_hash_and_equality(self):
+        """测试相同内容的对象相等且哈希一致"""
+        assert CallOption(**OPTION_KWARGS) == CallOption(**OPTION_KWARGS)
+        assert hash(CallOption(**OPTION_KWARGS)) == hash(CallOption(**OPTION_KWARGS))
+        assert CallOption(**OPTION_KWARGS) != CallOption(**{**OPTION_KWARGS, "K": 90.0})
+        assert PricingResult(price=1.0, delta=0.5) == PricingResult(price=1.0, delta=0.5)
+        assert len({MarketData(100.0, 100.0, 1.0, 0.05, 0.2) for _ in range(3)}) == 1
+
+    def test_subclass_fields(self):
+        """测试子类字段参与比较和哈希"""
+        option = CappedCallOption(cap=5.0, **OPTION_KWARGS)
+
+        assert option.cap == 5.0
+        assert option != CappedCallOption(cap=6.0, **OPTION_KWARGS)
+        assert option._field_names()[-1] == "cap"
+        np.testing.assert_array_almost_equal(option.payoff(np.array([90.0, 120.0])), [0.0, 5.0])
+
+    def test_pickle_roundtrip(self):
+        """测试 pickle 序列化往返"""
+        objects = [
+            CappedCallOption(cap=5.0, **OPTION_KWARGS),
+            PricingResult(price=10.0, vega=20.0),
+            MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2),
+        ]
+        for obj in objects:
+            assert pickle.loads(pickle.dumps(obj)) == obj
+
+    def test_validation_still_runs(self):
+        """测试冻结后 MarketData 仍在初始化时验证参数"""
+        with pytest.raises(ValueError, match="波动率 sigma 必须大于 0"):
+            MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.0)
+
+
+class TestPackedResults:
+    """测试定价结果的结构化数组形式"""
+
+    def test_dtype_layout(self):
+        """测试打包记录为连续的 float64 字段"""
+        assert PRICING_RESULT_DTYPE.names[0] == "price"
+        assert PRICING_RESULT_DTYPE.itemsize == 8 * len(PRICING_RESULT_DTYPE.names)
+
+    def test_pack_unpack_roundtrip(self):
+        """测试打包与还原往返，None 存储为 NaN"""
+        results = [
+            PricingResult(price=10.0, delta=0.5, gamma=0.01, theta=-0.1, vega=20.0, rho=15.0),
+            PricingResult(price=3.5),
+        ]
+
+        records = pack_results(results)
+
+        assert records.dtype == PRICING_RESULT_DTYPE
+        assert records.shape == (2,)
+        np.testing.assert_array_equal(records["price"], [10.0, 3.5])
+        assert np.isnan(records["delta"][1])
+        assert unpack_results(records) == results
+
+    def test_packed_footprint(self):
+        """测试打包记录比活动对象（含字段 float 对象）小 3 倍以上"""
+        result = PricingResult(
+            price=10.0, delta=0.5, gamma=0.01, theta=-0.1, vega=20.0, rho=15.0,
+            std_error=0.02, elapsed=0.1,
+        )
+        live = sys.getsizeof(result) + sum(
+            sys.getsizeof(getattr(result, name)) for name in PRICING_RESULT_DTYPE.names
+        )
+
+        records = pack_results([result] * 1000)
+
+        assert records.nbytes == 1000 * 64
+        assert live >= 3 * PRICING_RESULT_DTYPE.itemsize
+
+    def test_pack_empty(self):
+        """测试打包空序列"""
+        records = pack_results([])
+
+        assert records.shape == (0,)
+        assert unpack_results(records) == []
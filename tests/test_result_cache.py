@@ -0,0 +1,212 @@
+"""
+测试定价结果磁盘缓存模块
+
+验证内容哈希键、跨实例和跨进程读取、TTL 与容量淘汰、代码版本失效，
+以及带缓存定价方法只为未命中的合约调用引擎
+"""
+
+import multiprocessing
+import sqlite3
+import time
+
+import numpy as np
+import pytest
+
+from src.pricing_tool.models.local_vol import LocalVolModel
+from src.pricing_tool.options.barrier_option import BarrierOption
+from src.pricing_tool.options.european_option import EuropeanOption
+from src.pricing_tool.pricing.auto_pricing import AutoPricing, AutoPricingResult
+from src.pricing_tool.pricing.base import PricingResult
+from src.pricing_tool.pricing.pde_pricing import PDEPricing
+from src.pricing_tool.pricing.result_cache import (
+    CachedPricing,
+    ResultCache,
+    code_version,
+    content_hash,
+)
+from src.pricing_tool.utils.market_data import MarketData
+
+MARKET = MarketData(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+KWARGS = dict(S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2)
+RESULT = PricingResult(price=10.45, delta=0.64, std_error=None, elapsed=0.01)
+
+
+class CountingPricing(PDEPricing):
+    """记录实际定价的合约数（私有属性不参与缓存键）"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._priced = 0
+
+    def price_batch(self, options, market_data):
+        self._priced += len(options)
+        return super().price_batch(options, market_data)
+
+
+def read_price(path, key):
+    """在子进程中打开缓存并读取价格"""
+    with ResultCache(path) as cache:
+        result = cache.get(key)
+    return None if result is None else result.price
+
+
+class TestKeys:
+    """测试缓存键"""
+
+    def test_content_hash(self):
+        """测试数值类型无关、数组按内容哈希"""
+        assert content_hash(1.5, [np.float64(2.0)]) == content_hash(np.float64(1.5), (2.0,))
+        assert content_hash(np.arange(3.0)) == content_hash(np.arange(3.0))
+        assert content_hash(np.arange(3.0)) != content_hash(np.arange(3.0).reshape(3, 1))
+        assert content_hash(1) != content_hash(1.0)
+        with pytest.raises(TypeError, match="内容哈希"):
+            content_hash(object())
+
+    def test_key_depends_on_contract_and_config(self, tmp_path):
+        """测试键随合约和引擎配置变化，不受期权市场字段和运行时状态影响"""
+        cache = ResultCache(tmp_path / "cache.db")
+        method = PDEPricing()
+        key = cache.key(EuropeanOption(**KWARGS), MARKET, method)
+
+        assert key == cache.key(EuropeanOption(**dict(KWARGS, S=90.0)), MARKET, PDEPricing())
+        assert key != cache.key(EuropeanOption(**dict(KWARGS, K=110.0)), MARKET, method)
+        assert key != cache.key(EuropeanOption(**KWARGS), MARKET, PDEPricing(n_space=100))
+        assert key != cache.key(BarrierOption(**KWARGS), MARKET, method)
+        method.price(EuropeanOption(**KWARGS), MARKET)
+        assert key == cache.key(EuropeanOption(**KWARGS), MARKET, method)
+
+        local_vol = LocalVolModel(100.0, 0.05, [1.0], [-1.0, 0.0, 1.0], np.full((1, 3), 0.2))
+        bumped = LocalVolModel(100.0, 0.05, [1.0], [-1.0, 0.0, 1.0], np.full((1, 3), 0.21))
+        assert cache.key(EuropeanOption(**KWARGS), MARKET, PDEPricing(model=local_vol)) != (
+            cache.key(EuropeanOption(**KWARGS), MARKET, PDEPricing(model=bumped))
+        )
+
+        auto = AutoPricing()
+        before = cache.key(BarrierOption(**KWARGS), MARKET, auto)
+        auto.costs["pde"] = 1e-6
+        assert cache.key(BarrierOption(**KWARGS), MARKET, auto) == before
+
+
+class TestResultCache:
+    """测试磁盘缓存"""
+
+    def test_round_trip_across_instances(self, tmp_path):
+        """测试写入后由新实例（模拟进程重启）读取"""
+        path = tmp_path / "cache.db"
+        with ResultCache(path) as cache:
+            cache.put("a", RESULT)
+
+        with ResultCache(path) as cache:
+            assert cache.get("a") == RESULT
+            assert cache.get("b") is None
+            assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+    def test_concurrent_readers_in_processes(self, tmp_path):
+        """测试多个进程同时读取同一缓存文件"""
+        path = str(tmp_path / "cache.db")
+        with ResultCache(path) as cache:
+            cache.put_many((f"k{i}", PricingResult(price=float(i))) for i in range(100))
+
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(2) as pool:
+            prices = pool.starmap(read_price, [(path, "k7"), (path, "k42"), (path, "none")])
+
+        assert prices == [7.0, 42.0, None]
+
+    def test_ttl(self, tmp_path, monkeypatch):
+        """测试过期条目视为未命中并由 evict 删除"""
+        cache = ResultCache(tmp_path / "cache.db", ttl=60.0)
+        cache.put("a", RESULT)
+        now = time.time()
+        monkeypatch.setattr("src.pricing_tool.pricing.result_cache.time.time", lambda: now + 120)
+
+        assert cache.get("a") is None
+        assert cache.evict() == 1
+        assert len(cache) == 0
+
+    def test_size_eviction(self, tmp_path):
+        """测试超过容量时淘汰最早写入的条目"""
+        cache = ResultCache(tmp_path / "cache.db", max_entries=3)
+        for i in range(5):
+            cache.put(f"k{i}", PricingResult(price=float(i)))
+
+        assert len(cache) == 3
+        assert cache.get("k0") is None
+        assert cache.get("k4").price == 4.0
+        assert cache.evictions == 2
+
+    def test_size_check_amortized(self, tmp_path):
+        """测试每累计写入约 1% 容量的条目才统计一次条目数"""
+        cache = ResultCache(tmp_path / "cache.db", max_entries=1000)
+        statements = []
+        cache._connect().set_trace_callback(statements.append)
+        for i in range(25):
+            cache.put(f"k{i}", PricingResult(price=float(i)))
+
+        assert sum("COUNT(*)" in statement for statement in statements) == 2
+        assert cache.evict() == 0
+
+    def test_old_schema_rebuilt(self, tmp_path):
+        """测试旧表结构的缓存文件被丢弃重建"""
+        path = tmp_path / "cache.db"
+        with sqlite3.connect(str(path)) as connection:
+            connection.execute(
+                "CREATE TABLE results (key TEXT PRIMARY KEY, version TEXT, created REAL, "
+                "payload BLOB)"
+            )
+
+        with ResultCache(path) as cache:
+            cache.put("a", RESULT)
+            assert cache.get("a") == RESULT
+
+    def test_version_invalidation(self, tmp_path):
+        """测试代码版本变化后旧条目失效"""
+        path = tmp_path / "cache.db"
+        ResultCache(path, version="v1").put("a", RESULT)
+        current = ResultCache(path, version="v2")
+
+        assert current.get("a") is None
+        assert ResultCache(path, version="v1").get("a") == RESULT
+        assert current.evict() == 1
+        assert len(code_version()) == 16
+
+    def test_invalid_arguments(self, tmp_path):
+        """测试无效参数"""
+        with pytest.raises(ValueError):
+            ResultCache(tmp_path / "cache.db", ttl=0.0)
+        with pytest.raises(ValueError):
+            ResultCache(tmp_path / "cache.db", max_entries=0)
+
+
+class TestCachedPricing:
+    """测试带缓存的定价方法"""
+
+    def test_prices_only_misses(self, tmp_path):
+        """测试只为未命中的合约调用引擎，重启后全部命中"""
+        path = tmp_path / "cache.db"
+        options = [EuropeanOption(**dict(KWARGS, K=K)) for K in (90.0, 100.0, 110.0)]
+        engine = CountingPricing(n_space=100, n_time=100)
+        cached = CachedPricing(engine, ResultCache(path))
+
+        first = cached.price_batch(options[:2], MARKET)
+        second = cached.price_batch(options + [options[0]], MARKET)
+        assert engine._priced == 3
+        assert second[0] == first[0]
+        assert second[3] == first[0]
+
+        restarted = CountingPricing(n_space=100, n_time=100)
+        results = CachedPricing(restarted, ResultCache(path)).price_batch(options, MARKET)
+        assert restarted._priced == 0
+        assert [r.price for r in results] == [r.price for r in second[:3]]
+        assert cached.price(options[2], MARKET) == second[2]
+
+    def test_result_subclass_preserved(self, tmp_path):
+        """测试包装 AutoPricing 时命中与未命中都返回 AutoPricingResult"""
+        path = tmp_path / "cache.db"
+        option = BarrierOption(**KWARGS)
+        first = CachedPricing(AutoPricing(tolerance=1e-2), ResultCache(path)).price(option, MARKET)
+        again = CachedPricing(AutoPricing(tolerance=1e-2), ResultCache(path)).price(option, MARKET)
+
+        assert type(first) is type(again) is AutoPricingResult
+        assert again == first
+        assert (again.method, again.resolution, again.converged) == ("pde", first.resolution, True)
@@ -0,0 +1,172 @@
+"""
+测试定价结果列式持久化模块
+
+验证 ResultWriter 分块写入和 ResultReader 内存映射读取
+"""
+
+import numpy as np
+import pytest
+
+from src.pricing_tool.pricing.base import PricingResult
+from src.pricing_tool.pricing.records import PRICING_RESULT_DTYPE, pack_results
+from src.pricing_tool.pricing.result_io import ResultReader, ResultWriter, resolve_format
+
+
+def make_results(n: int, offset: int = 0):
+    """生成测试用定价结果"""
+    return [
+        PricingResult(price=float(i), delta=0.5, std_error=0.01, elapsed=1e-3)
+        for i in range(offset, offset + n)
+    ]
+
+
+class TestResolveFormat:
+    """测试格式推断"""
+
+    def test_suffix(self):
+        """测试根据后缀推断格式"""
+        assert resolve_format("run.npy") == "npy"
+        assert resolve_format("run.arrow") == "arrow"
+        assert resolve_format("run.parquet") == "parquet"
+
+    def test_explicit_invalid(self):
+        """测试不支持的格式"""
+        with pytest.raises(ValueError, match="不支持的格式"):
+            resolve_format("run.npy", format="csv")
+
+
+class TestNpyStore:
+    """测试 npy 格式（仅依赖 NumPy）"""
+
+    def test_chunked_roundtrip(self, tmp_path):
+        """测试分块写入后可内存映射读取"""
+        path = tmp_path / "run.npy"
+
+        with ResultWriter(path, chunk_size=4) as writer:
+            writer.write(make_results(3))
+            writer.write(make_results(7, offset=3))
+            assert writer.rows_written == 8  # 两个完整分块，剩余 2 条在缓冲区
+
+        reader = ResultReader(path)
+        assert reader.format == "npy"
+        assert len(reader) == 10
+        assert isinstance(reader.to_records(), np.memmap)
+        np.testing.assert_array_equal(reader.column("price"), np.arange(10.0))
+        np.testing.assert_array_equal(reader[2:5]["price"], [2.0, 3.0, 4.0])
+        assert reader[9]["std_error"] == 0.01
+
+    def test_readable_with_numpy_while_writing(self, tmp_path):
+        """测试写入过程中已写出的分块可被 numpy 直接读取"""
+        path = tmp_path / "run.npy"
+        writer = ResultWriter(path, chunk_size=5)
+        writer.write(make_results(12))
+
+        partial = np.load(path, mmap_mode="r")
+        assert partial.shape == (10,)
+
+        writer.close()
+        assert np.load(path).shape == (12,)
+
+    def test_write_structured_array(self, tmp_path):
+        """测试直接写入结构化数组"""
+        path = tmp_path / "run.npy"
+        records = pack_results(make_results(5))
+
+        with ResultWriter(path) as writer:
+            writer.write(records)
+
+        assert ResultReader(path).to_records().tobytes() == records.tobytes()
+
+    def test_write_dtype_mismatch(self, tmp_path):
+        """测试结构化数组类型不匹配时报错"""
+        with ResultWriter(tmp_path / "run.npy") as writer:
+            with pytest.raises(ValueError, match="记录类型不匹配"):
+                writer.write(np.zeros(3, dtype=[("price", np.float32)]))
+
+    def test_write_after_close(self, tmp_path):
+        """测试关闭后写入报错"""
+        writer = ResultWriter(tmp_path / "run.npy")
+        writer.close()
+
+        with pytest.raises(ValueError, match="写入器已关闭"):
+            writer.write(make_results(1))
+
+    def test_invalid_chunk_size(self, tmp_path):
+        """测试无效分块大小"""
+        with pytest.raises(ValueError, match="chunk_size 必须大于 0"):
+            ResultWriter(tmp_path / "run.npy", chunk_size=0)
+
+    def test_empty_run(self, tmp_path):
+        """测试空运行"""
+        path = tmp_path / "run.npy"
+        ResultWriter(path).close()
+
+        assert len(ResultReader(path)) == 0
+
+
+class TestArrowStore:
+    """测试 Arrow/Parquet 格式（需要 pyarrow）"""
+
+    @pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+    def test_chunked_roundtrip(self, tmp_path, suffix):
+        """测试分块写入和切片读取"""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / f"run{suffix}"
+
+        with ResultWriter(path, chunk_size=4) as writer:
+            writer.write(make_results(10))
+
+        reader = ResultReader(path)
+        assert reader.format == suffix[1:]
+        assert len(reader) == 10
+        assert reader.dtype == PRICING_RESULT_DTYPE
+        np.testing.assert_array_equal(reader.column("price"), np.arange(10.0))
+        np.testing.assert_array_equal(reader[2:5]["price"], [2.0, 3.0, 4.0])
+        assert reader[-1]["price"] == 9.0
+        assert np.isnan(reader.column("gamma")).all()
+
+    def test_parquet_reads_row_groups_lazily(self, tmp_path):
+        """测试 Parquet 切片只解码覆盖到的 row group"""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "run.parquet"
+        with ResultWriter(path, chunk_size=4) as writer:
+            writer.write(make_results(10))
+
+        reader = ResultReader(path)
+        read_row_groups = reader._parquet.read_row_groups
+        requested = []
+
+        def recording(row_groups, *args, **kwargs):
+            requested.append(list(row_groups))
+            return read_row_groups(row_groups, *args, **kwargs)
+
+        reader._parquet.read_row_groups = recording
+        np.testing.assert_array_equal(reader[3:6]["price"], [3.0, 4.0, 5.0])
+        assert reader[9]["price"] == 9.0
+        assert reader[4:4].shape == (0,)
+        assert requested == [[0, 1], [2]]
+
+
+class TestReaderLifecycle:
+    """测试读取器的关闭和上下文管理"""
+
+    @pytest.mark.parametrize("suffix", [".npy", ".arrow", ".parquet"])
+    def test_close(self, tmp_path, suffix):
+        """测试 with 语句退出后释放文件，再次读取时报错"""
+        if suffix != ".npy":
+            pytest.importorskip("pyarrow")
+        path = tmp_path / f"run{suffix}"
+        with ResultWriter(path, chunk_size=4) as writer:
+            writer.write(make_results(6))
+
+        with ResultReader(path) as reader:
+            prices = np.array(reader.column("price"))
+
+        np.testing.assert_array_equal(prices, np.arange(6.0))
+        with pytest.raises(ValueError, match="读取器已关闭"):
+            reader[0]
+        with pytest.raises(ValueError, match="读取器已关闭"):
+            len(reader)
+        reader.close()
+        assert "closed" in repr(reader)
+        path.unlink()